@@ -0,0 +1,60 @@
+"""Kart çıkarma maliyetini ölçer: alan başına `select_one` ile tek geçişli plan.
+
+Kullanım:
+    uv run python benchmarks/bench_extract.py [--cards 100] [--repeat 20]
+
+`bench_parsers.py` ile aynı sentetik Kitapyurdu liste sayfası kullanılır. Her
+BeautifulSoup backend'i için ağaç bir kez kurulur; ardından yalnızca kart çıkarma
+(`ExtractionPlan.extract_css` = eski seçici yolu, `ExtractionPlan.extract` = tek geçiş)
+ve sayfa başına toplam `extract_page` süresi yazdırılır.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import time
+from collections.abc import Callable
+
+from bench_parsers import CATEGORY, listing_page
+
+from bookdata.adapters.parsers import make_document
+from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
+from bookdata.config import Settings
+
+
+def timed(fn: Callable[[], object], repeat: int) -> float:
+    fn()  # ısınma
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    content = listing_page(args.cards)
+    plan = KitapYurduAdapter.plan
+    print(f"Sayfa: {len(content) / 1024:.0f} KiB, {args.cards} kart")
+    for backend in ("html.parser", "lxml"):
+        if backend != "html.parser" and importlib.util.find_spec(backend) is None:
+            print(f"{backend:<12} kurulu değil")
+            continue
+        doc = make_document(content, backend, KitapYurduAdapter.page_regions)
+        assert plan.extract(doc) == plan.extract_css(doc)
+        css = timed(lambda doc=doc: plan.extract_css(doc), args.repeat)
+        single = timed(lambda doc=doc: plan.extract(doc), args.repeat)
+        adapter = KitapYurduAdapter(http=None, settings=Settings(html_parser=backend))
+        page = timed(lambda adapter=adapter: adapter.extract_page(content, CATEGORY), args.repeat)
+        print(
+            f"{backend:<12} select_one {css * 1000:7.2f} ms  tek geçiş {single * 1000:7.2f} ms"
+            f"  ({css / single:4.1f}x)  extract_page {page * 1000:7.2f} ms/sayfa"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""HTML ayrıştırıcı backend'lerini gerçekçi boyutta bir liste sayfasında ölçer.
+
+Kullanım:
+    uv run --extra fast python benchmarks/bench_parsers.py [--cards 100] [--repeat 20]
+
+`tests/fixtures/ky_card.html` içindeki kart çoğaltılıp menü/footer gürültüsüyle
+`limit=100` bir Kitapyurdu liste sayfası taklit edilir; her backend için (tam ve kısmi
+ayrıştırmada) sayfa başına ayrıştırma + kart çıkarma süresi ve tepe bellek yazdırılır.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import re
+import time
+import tracemalloc
+from pathlib import Path
+
+from bookdata.adapters.parsers import PARSER_BACKENDS
+from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
+from bookdata.config import Settings
+from bookdata.models import Category
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+CATEGORY = Category(name="Roman", url="https://www.kitapyurdu.com/kategori/kitap-roman/1.html")
+
+
+def listing_page(cards: int) -> bytes:
+    """Tek kartlık fixture'dan `cards` kartlı, menü ve footer'lı bir liste sayfası üretir."""
+    html = (FIXTURES / "ky_card.html").read_text(encoding="utf-8")
+    card = re.search(r"<body>(.*)</body>", html, re.S).group(1)
+    menu = "".join(
+        f'<li><a href="/kategori/kitap-{i}/{i}.html">Kategori {i}</a></li>' for i in range(400)
+    )
+    body = "".join(card.replace("123.html", f"{i}.html") for i in range(cards))
+    return (
+        f"<html><head><title>Liste</title></head><body><header><ul>{menu}</ul></header>"
+        f"<main>{body}</main><footer>{menu}</footer></body></html>"
+    ).encode()
+
+
+def bench(settings: Settings, content: bytes, repeat: int) -> tuple[float, int]:
+    """Sayfa başına ortalama süre (sn) ve tek bir ayrıştırmanın tepe belleği (bayt)."""
+    adapter = KitapYurduAdapter(http=None, settings=settings)
+    adapter.extract_page(content, CATEGORY)  # ısınma
+    started = time.perf_counter()
+    for _ in range(repeat):
+        adapter.extract_page(content, CATEGORY)
+    seconds = (time.perf_counter() - started) / repeat
+    tracemalloc.start()
+    adapter.extract_page(content, CATEGORY)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    content = listing_page(args.cards)
+    print(f"Sayfa: {len(content) / 1024:.0f} KiB, {args.cards} kart")
+    baseline = None
+    for backend in PARSER_BACKENDS:
+        if backend != "html.parser" and importlib.util.find_spec(backend) is None:
+            print(f"{backend:<12} kurulu değil")
+            continue
+        # selectolax bölgeleri yok sayar; kısmi/tam ayrımı yalnızca BeautifulSoup'ta anlamlı
+        modes = (True,) if backend == "selectolax" else (False, True)
+        for partial in modes:
+            settings = Settings(html_parser=backend, partial_parse=partial)
+            seconds, peak = bench(settings, content, args.repeat)
+            baseline = baseline or seconds
+            label = f"{backend} ({'kısmi' if partial else 'tam'})"
+            print(
+                f"{label:<22} {seconds * 1000:8.2f} ms/sayfa  ({baseline / seconds:5.1f}x)"
+                f"  tepe bellek {peak / 1024:7.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Kaset (cassette): HTTP yanıtlarını kaydedip ağ olmadan tekrar oynatır.
+
+`BOOKDATA_HTTP_MODE=record` gerçek bir taramada her yanıtı (durum, header, gövde)
+gzip'li JSON satırları olarak `BOOKDATA_CASSETTE` dosyasına yazar.
+`BOOKDATA_HTTP_MODE=replay` aynı `get` çağrılarını arşivden servis eder; böylece tam bir
+`run_scrape` ağsız ve deterministik olarak tekrarlanıp ayrıştırma/standardizasyon/depolama
+gerçek veriyle profillenebilir. İsteğe bağlı `BOOKDATA_REPLAY_LATENCY` ortalamalı
+log-normal gecikme simülasyonu eklenir.
+
+Kaset dosyası yoksa tekrar oynatma hata verir. Kasette olmayan URL'ler 404 döner, uyarı
+olarak loglanır ve `missed`'da sayılır (istemci `stats`'ında `replay_misses`).
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import logging
+import math
+import random
+from pathlib import Path
+from typing import IO
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+HTTP_MODES = ("live", "record", "replay")
+
+LATENCY_SIGMA = 0.5  # log-normal gecikmenin yayılımı
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+class Cassette:
+    """gzip'li JSON satırlarından oluşan yanıt arşivi (URL başına son yanıt geçerlidir)."""
+
+    def __init__(self, path: Path, *, latency: float = 0.0, seed: int = 0) -> None:
+        self.path = path
+        self.latency = latency
+        self._random = random.Random(seed)
+        self._writer: IO[str] | None = None
+        self._entries: dict[str, dict] | None = None
+        self.recorded = 0
+        self.replayed = 0
+        self.missed = 0
+
+    def record(self, url: str, response: httpx.Response) -> None:
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Kayıt boyunca açık kalır; `close()` (istemcinin aclose'u) kapatır.
+            self._writer = gzip.open(self.path, "at", encoding="utf-8")  # noqa: SIM115
+        entry = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {
+                k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS
+            },
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        self._writer.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.recorded += 1
+
+    def load(self) -> dict[str, dict]:
+        if self._entries is None:
+            if not self.path.exists():
+                raise FileNotFoundError(
+                    f"Kaset bulunamadı: {self.path} (önce BOOKDATA_HTTP_MODE=record ile kaydedin)"
+                )
+            self._entries = {}
+            with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["url"]] = entry
+            logger.info("Kaset yüklendi: %s yanıt (%s)", len(self._entries), self.path)
+        return self._entries
+
+    def delay(self) -> float:
+        """Simüle edilecek gecikme (sn): ortalaması `latency` olan log-normal örnek."""
+        if self.latency <= 0:
+            return 0.0
+        mu = math.log(self.latency) - LATENCY_SIGMA**2 / 2
+        return self._random.lognormvariate(mu, LATENCY_SIGMA)
+
+    def replay(self, url: str) -> httpx.Response:
+        """Kayıtlı yanıtı döndürür; kayıt yoksa 404 (sayfa taramada hiç istenmemiş)."""
+        request = httpx.Request("GET", url)
+        entry = self.load().get(url)
+        if entry is None:
+            self.missed += 1
+            logger.warning("Kasette yok, 404 sayıldı: %s", url)
+            return httpx.Response(404, request=request)
+        self.replayed += 1
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["body"]),
+            request=request,
+        )
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
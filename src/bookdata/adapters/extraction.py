@@ -0,0 +1,112 @@
+"""Derlenmiş kart çıkarma planı: her kartın alt ağacını tek geçişte dolaşır.
+
+Adapter'lar kart başına onlarca `select_one` çağırmak yerine alanlarını bir kez bildirir
+(`Field`: etiket, sınıf, kapsayan sınıf, öznitelik). `ExtractionPlan` kartın düğümlerini
+belge sırasıyla bir kez gezer; her düğüm henüz bulunmamış alanlarla karşılaştırılır
+(`select_one` gibi ilk eşleşme kazanır) ve tüm alanlar dolunca gezinti erken biter.
+
+selectolax (lexbor) ağacında CSS eşleştirme C'de yapıldığından plan, alanlardan
+türettiği seçicilerle `select_one` kullanır; iki yol da aynı sonucu verir.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from bookdata.adapters.parsers import Document, LexborNode, Region
+
+FieldValues = dict[str, str | None]
+
+
+def _classes(node: Any) -> Sequence[str]:
+    classes = node.get("class") or ()
+    return classes.split() if isinstance(classes, str) else classes
+
+
+@dataclass(frozen=True)
+class Field:
+    """Kart içindeki tek bir alan: `tag`/`cls` eşleşen ilk düğümün metni ya da özniteliği.
+
+    - `within`: düğüm, kart içinde bu sınıfa sahip bir atanın altında olmalı
+    - `attr`: verilirse düğümde bu öznitelik bulunmalı ve değeri alınır; yoksa metin
+    """
+
+    name: str
+    tag: str | None = None
+    cls: str | None = None
+    within: str | None = None
+    attr: str | None = None
+
+    @property
+    def selector(self) -> str:
+        own = (self.tag or "") + (f".{self.cls}" if self.cls else "")
+        own += f"[{self.attr}]" if self.attr else ""
+        return f".{self.within} {own}" if self.within else own
+
+    def matches(self, node: Any, card: Any) -> bool:
+        if self.tag is not None and node.name != self.tag:
+            return False
+        if self.cls is not None and self.cls not in _classes(node):
+            return False
+        if self.attr is not None and node.get(self.attr) is None:
+            return False
+        return self.within is None or self._inside(node, card)
+
+    def _inside(self, node: Any, card: Any) -> bool:
+        parent = node.parent
+        while parent is not None and parent is not card:
+            if self.within in _classes(parent):
+                return True
+            parent = parent.parent
+        return False
+
+    def value(self, node: Any) -> str | None:
+        if self.attr is not None:
+            return node.get(self.attr)
+        return node.get_text(strip=True)
+
+
+class ExtractionPlan:
+    """Bir adapter'ın kart seçicisi ve alanlarından derlenen çıkarma planı."""
+
+    def __init__(self, card: str, fields: Sequence[Field]) -> None:
+        self.card = Region.parse(card)
+        self.card_selector = card
+        self.fields = tuple(fields)
+
+    def extract(self, doc: Document) -> list[FieldValues]:
+        """Belgedeki her kart için alan değerlerini (bulunamayan alan → None) döndürür."""
+        if isinstance(doc, LexborNode):
+            return self.extract_css(doc)
+        cards = doc.find_all(self.card.tag, class_=self.card.cls)
+        return [self._walk(card) for card in cards]
+
+    def extract_css(self, doc: Document) -> list[FieldValues]:
+        """Alan başına `select_one` ile aynı çıktı (lexbor ve karşılaştırma için)."""
+        rows = []
+        for card in doc.select(self.card_selector):
+            row: FieldValues = dict.fromkeys(f.name for f in self.fields)
+            for field in self.fields:
+                node = card.select_one(field.selector)
+                if node is not None:
+                    row[field.name] = field.value(node)
+            rows.append(row)
+        return rows
+
+    def _walk(self, card: Any) -> FieldValues:
+        row: FieldValues = dict.fromkeys(f.name for f in self.fields)
+        pending = list(self.fields)
+        for node in card.descendants:
+            if node.name is None:  # metin düğümü
+                continue
+            matched = [field for field in pending if field.matches(node, card)]
+            if not matched:
+                continue
+            for field in matched:
+                row[field.name] = field.value(node)
+            pending = [field for field in pending if field not in matched]
+            if not pending:
+                break
+        return row
@@ -2,9 +2,19 @@
 
 - Rotasyonlu User-Agent ve gerçekçi header'lar
 - `httpx.AsyncClient` ile HTTP/2, redirect takibi, cookie kalıcılığı
-- Alan adı başına eşzamanlılık semaforu + minimum istek aralığı (naziklik)
+- Host başına zamanlayıcı (`HostScheduler`): ayrı eşzamanlılık sınırı, yarışsız slot
+  rezervasyonu ile kesin istek aralığı ve akışlar (kategoriler) arasında round-robin
+- Uyarlamalı istek aralığı (naziklik): hızlı 2xx yanıtlarda hız artar, 429/5xx/zaman
+  aşımında düşer (bkz. `bookdata.adapters.ratelimit`)
 - 429/5xx ve ağ hatalarında üstel geri çekilme (tenacity) + jitter; 403/404 gibi
   kalıcı hatalarda retry yok (bkz. `bookdata.errors`)
+- Host başına devre kesici + istemci geneli retry bütçesi: bozulan bir site saatlerce
+  geri çekilme yerine hızlıca düşer (bkz. `bookdata.adapters.resilience`)
+- Opsiyonel koşullu GET cache'i (`BOOKDATA_HTTP_CACHE_DIR`): ETag/Last-Modified ile
+  304 alınan sayfalar diskten servis edilir (bkz. `bookdata.adapters.http_cache`)
+- Kayıt/tekrar (`BOOKDATA_HTTP_MODE=record|replay`): yanıtlar kasete yazılır veya ağsız
+  olarak kasetten servis edilir (bkz. `bookdata.adapters.cassette`)
+- Single-flight: aynı URL'ye eşzamanlı istekler tek ağ isteğinde birleştirilir
 - Opsiyonel robots.txt saygısı (`BOOKDATA_RESPECT_ROBOTS=true`): host başına bir kez
   çekilir, cache'lenir, yasaklıysa `RobotsDeniedError` fırlatılır
 """
@@ -15,19 +25,29 @@ import asyncio
 import logging
 import random
 import time
-import urllib.robotparser
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from urllib.robotparser import RobotFileParser
 
 import httpx
 from tenacity import (
     AsyncRetrying,
-    retry_if_exception,
+    RetryCallState,
     stop_after_attempt,
     wait_exponential_jitter,
 )
 
+from bookdata.adapters.cassette import HTTP_MODES, Cassette
+from bookdata.adapters.http_cache import ResponseCache
+from bookdata.adapters.ratelimit import AdaptiveRateController
+from bookdata.adapters.resilience import CircuitBreaker, RetryBudget
 from bookdata.config import Settings
 from bookdata.errors import (
     BlockedResponseError,
+    CircuitOpenError,
     FetchError,
     FetchTimeoutError,
     FetchTransportError,
@@ -62,11 +82,131 @@ def classify_status(url: str, status: int) -> FetchError:
     return FetchError(url, status=status)
 
 
+_current_flow: ContextVar[str] = ContextVar("bookdata_http_flow", default="")
+
+
+@contextmanager
+def request_flow(key: str) -> Iterator[None]:
+    """Bu bağlamdaki istekleri `key` akışına bağlar (ör. kategori URL'si).
+
+    Zamanlayıcı aynı host'u bekleyen akışlara sırayla (round-robin) slot verir;
+    böylece çok sayfalı bir kategori diğerlerini aç bırakmaz.
+    """
+    token = _current_flow.set(key)
+    try:
+        yield
+    finally:
+        _current_flow.reset(token)
+
+
+@dataclass
+class _HostQueue:
+    flows: OrderedDict[str, deque[asyncio.Future[None]]] = field(default_factory=OrderedDict)
+    active: int = 0
+    next_at: float = 0.0
+    timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class _Flight:
+    """Uçuştaki tek alım ve onu bekleyen `get` çağrılarının sayısı."""
+
+    task: asyncio.Future[httpx.Response]
+    waiters: int = 0
+
+
+class HostScheduler:
+    """Host başına adil ve yarışsız istek zamanlayıcısı.
+
+    - Her host'un kendi eşzamanlılık sınırı vardır; farklı host'lar birbirini beklemez
+    - Slot verilirken bir sonraki başlangıç anı hemen rezerve edilir; eşzamanlı
+      istekler aynı `son istek` değerini okuyup aralığı delemez
+    - Bekleyenler akış (kategori) kuyruklarında tutulur, slotlar akışlara round-robin dağıtılır
+    """
+
+    def __init__(self, interval: Callable[[str], float], concurrency: int) -> None:
+        self._interval = interval
+        self._concurrency = max(1, concurrency)
+        self._hosts: dict[str, _HostQueue] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str, flow: str = "") -> AsyncIterator[None]:
+        await self._acquire(host, flow)
+        try:
+            yield
+        finally:
+            self._release(host)
+
+    async def _acquire(self, host: str, flow: str) -> None:
+        state = self._hosts.setdefault(host, _HostQueue())
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        state.flows.setdefault(flow, deque()).append(waiter)
+        self._dispatch(host)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(host)  # slot verilmişti ama kullanılmadı
+            else:
+                self._forget(state, flow, waiter)
+            raise
+
+    def _release(self, host: str) -> None:
+        state = self._hosts[host]
+        state.active -= 1
+        self._dispatch(host)
+
+    @staticmethod
+    def _forget(state: _HostQueue, flow: str, waiter: asyncio.Future[None]) -> None:
+        queue = state.flows.get(flow)
+        if queue is None:
+            return
+        if waiter in queue:
+            queue.remove(waiter)
+        if not queue:
+            del state.flows[flow]
+
+    def _dispatch(self, host: str) -> None:
+        state = self._hosts[host]
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        while state.flows and state.active < self._concurrency:
+            now = time.monotonic()
+            if now < state.next_at:
+                state.timer = asyncio.get_running_loop().call_later(
+                    state.next_at - now, self._dispatch, host
+                )
+                return
+            flow, queue = next(iter(state.flows.items()))
+            waiter = queue.popleft()
+            del state.flows[flow]
+            if queue:
+                state.flows[flow] = queue  # akış sıranın sonuna gider (round-robin)
+            if waiter.done():
+                continue
+            interval = self._interval(host)
+            jitter = random.uniform(0.0, min(0.3, interval)) if interval else 0.0
+            state.next_at = now + interval + jitter
+            state.active += 1
+            waiter.set_result(None)
+
+    def close(self) -> None:
+        for state in self._hosts.values():
+            if state.timer is not None:
+                state.timer.cancel()
+                state.timer = None
+
+
+def _no_interval(host: str) -> float:
+    return 0.0
+
+
 def is_retryable(exc: BaseException) -> bool:
     """Hangi hataların tekrar denenmesi gerektiğine karar verir (kör retry yok)."""
     if isinstance(exc, (RateLimitedError, TemporaryServerError)):
         return True
-    if isinstance(exc, (BlockedResponseError, RobotsDeniedError)):
+    if isinstance(exc, (BlockedResponseError, RobotsDeniedError, CircuitOpenError)):
         return False
     return isinstance(exc, _RETRYABLE)
 
@@ -74,17 +214,45 @@ def is_retryable(exc: BaseException) -> bool:
 class AsyncHTTPClient:
     """Tek sınıf, tek `httpx.Client`; tüm adapter'lar bu istemciyi paylaşır."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        if settings.http_mode not in HTTP_MODES:
+            raise ValueError(
+                f"Geçersiz BOOKDATA_HTTP_MODE: {settings.http_mode} ({', '.join(HTTP_MODES)})"
+            )
         self._settings = settings
-        self._semaphore = asyncio.Semaphore(settings.concurrency)
-        self._last_request_at: dict[str, float] = {}
-        self._robots_cache: dict[str, bool] = {}
+        self._rate = AdaptiveRateController(settings)
+        replaying = settings.http_mode == "replay"
+        self._scheduler = HostScheduler(
+            _no_interval if replaying else self._rate.interval, settings.concurrency
+        )
+        self._cassette = (
+            Cassette(settings.cassette_file, latency=settings.replay_latency)
+            if settings.http_mode != "live"
+            else None
+        )
+        if self._cassette is not None and replaying:
+            self._cassette.load()  # kaset yoksa tarama başlamadan hata
+        self._robots_cache: dict[str, asyncio.Future[RobotFileParser | None]] = {}
+        self._inflight: dict[str, _Flight] = {}
+        self._coalesced = 0
+        self._breaker = CircuitBreaker(
+            settings.breaker_failure_threshold, settings.breaker_reset_seconds
+        )
+        self._budget = RetryBudget(settings.retry_budget_ratio)
+        self._cache = (
+            ResponseCache(settings.http_cache_dir, int(settings.http_cache_max_mb * 1024 * 1024))
+            if settings.http_cache_dir and settings.http_mode == "live"
+            else None  # kaset modlarında 304'ler kaydı bozmasın diye cache kapalı
+        )
         self._client = httpx.AsyncClient(
             timeout=httpx.Timeout(settings.request_timeout),
             follow_redirects=True,
             http2=True,
             cookies=None,
             verify=True,
+            transport=transport,
         )
 
     def _headers(self) -> dict[str, str]:
@@ -107,58 +275,90 @@ class AsyncHTTPClient:
             "Cache-Control": "no-cache",
         }
 
-    async def _polite(self, url: str) -> None:
-        """Alan adı başına minimum istek aralığını rastgele jitter ile korur."""
-        host = httpx.URL(url).host
-        now = time.monotonic()
-        last = self._last_request_at.get(host, 0.0)
-        wait = max(0.0, self._settings.min_request_interval - (now - last))
-        if wait:
-            await asyncio.sleep(wait + random.uniform(0.0, 0.3))
-        self._last_request_at[host] = time.monotonic()
-
     async def _robots_allowed(self, url: str) -> bool:
-        """Host başına bir kez robots.txt çeker ve `can_fetch` sonucunu cache'ler."""
-        if not self._settings.respect_robots:
+        """robots.txt'yi host başına bir kez (tek uçuşta) çeker, kararı URL bazında verir."""
+        if not self._settings.respect_robots or self._settings.http_mode == "replay":
             return True
         host = httpx.URL(url).host
-        if host in self._robots_cache:
-            return self._robots_cache[host]
-        allowed = True
+        task = self._robots_cache.get(host)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_robots(host))
+            self._robots_cache[host] = task
+        elif not task.done():
+            self._coalesced += 1
+        parser = await asyncio.shield(task)
+        allowed = parser is None or parser.can_fetch(BOT_USER_AGENT, url)
+        if not allowed:
+            logger.warning("robots.txt gereği erişim reddedildi: %s", url)
+        return allowed
+
+    async def _fetch_robots(self, host: str) -> RobotFileParser | None:
         try:
             robots_url = f"https://{host}/robots.txt"
             resp = await self._client.get(robots_url, headers={"User-Agent": BOT_USER_AGENT})
-            if resp.status_code == 200:
-                parser = urllib.robotparser.RobotFileParser()
-                parser.parse(resp.text.splitlines())
-                allowed = parser.can_fetch(BOT_USER_AGENT, url)
         except (httpx.HTTPError, OSError):
-            allowed = True  # robots.txt alınamadıysa liberal davran
-        self._robots_cache[host] = allowed
-        if not allowed:
-            logger.warning("robots.txt gereği erişim reddedildi: %s", url)
-        return allowed
+            return None  # robots.txt alınamadıysa liberal davran
+        if resp.status_code != 200:
+            return None
+        parser = RobotFileParser()
+        parser.parse(resp.text.splitlines())
+        return parser
 
     async def get(self, url: str) -> httpx.Response:
-        """Tek istek; hata yoksa `Response`, kalıcı hata varsa sınıflandırılmış hata fırlatır."""
+        """Tek istek; hata yoksa `Response`, kalıcı hata varsa sınıflandırılmış hata fırlatır.
+
+        Aynı URL için uçuştaki bir istek varsa yeni istek atılmaz; tüm bekleyenler aynı
+        yanıtı (veya aynı hatayı) paylaşır (single-flight). Bekleyenlerin hepsi iptal
+        edilirse (ör. tüketici sayfalamayı erken bıraktı) alım da iptal edilir.
+        """
+        flight = self._inflight.get(url)
+        if flight is not None:
+            self._coalesced += 1
+        else:
+            flight = _Flight(asyncio.ensure_future(self._fetch(url)))
+            self._inflight[url] = flight
+            flight.task.add_done_callback(lambda done: self._finish_inflight(url, flight))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                # İptal edilen uçuş hemen bırakılır: aynı URL'ye yeni gelen çağrı ölmekte olan
+                # alıma katılıp kendisi iptal edilmemişken `CancelledError` almasın
+                self._drop_inflight(url, flight)
+                flight.task.cancel()
+
+    def _drop_inflight(self, url: str, flight: _Flight) -> None:
+        if self._inflight.get(url) is flight:
+            del self._inflight[url]
+
+    def _finish_inflight(self, url: str, flight: _Flight) -> None:
+        self._drop_inflight(url, flight)
+        task = flight.task
+        if not task.cancelled():
+            task.exception()  # bekleyen kalmadıysa "never retrieved" uyarısını önler
+
+    async def _fetch(self, url: str) -> httpx.Response:
+        """Zamanlayıcı slotu + retry ile tek ağ alımı (single-flight'ın paylaşılan işi)."""
+        host = httpx.URL(url).host
 
         async def _attempt() -> httpx.Response:
-            async with self._semaphore:
-                await self._polite(url)
-                if not await self._robots_allowed(url):
-                    raise RobotsDeniedError(url)
-                try:
-                    resp = await self._client.get(url, headers=self._headers())
-                except httpx.TimeoutException as exc:
-                    raise FetchTimeoutError(url) from exc
-                except httpx.TransportError as exc:
-                    raise FetchTransportError(url) from exc
-                if resp.status_code >= 400:
-                    raise classify_status(url, resp.status_code)
-                return resp
+            if self._breaker.rejects(host):
+                raise CircuitOpenError(url)
+            async with self._scheduler.slot(host, _current_flow.get()):
+                return await self._send(url, host)
+
+        def _should_retry(state: RetryCallState) -> bool:
+            exc = state.outcome.exception() if state.outcome else None
+            if exc is None or not is_retryable(exc):
+                return False
+            if state.attempt_number >= self._settings.retry_attempts:
+                return False  # stop zaten devrede; bütçeden harcama
+            return self._budget.try_spend()
 
         retrier = AsyncRetrying(
-            retry=retry_if_exception(is_retryable),
+            retry=_should_retry,
             wait=wait_exponential_jitter(
                 initial=self._settings.retry_backoff_base,
                 max=30.0,
@@ -174,12 +374,91 @@ class AsyncHTTPClient:
             ),
         )
 
+        self._budget.record_request()
         async for attempt in retrier:
             with attempt:
                 return await _attempt()
         raise FetchError(url)
 
+    async def _send(self, url: str, host: str) -> httpx.Response:
+        """Slot alınmışken tek HTTP isteği; sonucu host'un devresine işler."""
+        if not await self._robots_allowed(url):
+            raise RobotsDeniedError(url)
+        if not self._breaker.allow(host):  # slot beklerken devre açılmış olabilir
+            raise CircuitOpenError(url)
+        try:
+            resp = await self._request(url, host)
+        except FetchError as exc:
+            self._breaker.record(host, exc)
+            raise
+        except BaseException:
+            self._breaker.release(host)
+            raise
+        self._breaker.record(host, None)
+        return resp
+
+    async def _request(self, url: str, host: str) -> httpx.Response:
+        """Koşullu GET, hız denetimi ve durum kodu sınıflandırması."""
+        headers = self._headers()
+        cached = self._cache.lookup(url) if self._cache else None
+        if cached:
+            headers.update(cached.validators)
+        started = time.monotonic()
+        try:
+            resp = await self._network_get(url, headers)
+        except httpx.TimeoutException as exc:
+            error: FetchError = FetchTimeoutError(url)
+            self._rate.on_error(host, error)
+            raise error from exc
+        except httpx.TransportError as exc:
+            raise FetchTransportError(url) from exc
+        if resp.status_code >= 400:
+            error = classify_status(url, resp.status_code)
+            self._rate.on_error(host, error)
+            raise error
+        self._rate.on_response(host, time.monotonic() - started)
+        if resp.status_code == 304 and cached:
+            return self._cache.hit(cached, resp.request)
+        if self._cache:
+            self._cache.store(url, resp)
+        return resp
+
+    async def _network_get(self, url: str, headers: dict[str, str]) -> httpx.Response:
+        """Canlı istek; `record` modunda yanıt kasete yazılır, `replay`de kasetten okunur."""
+        if self._cassette is not None and self._settings.http_mode == "replay":
+            delay = self._cassette.delay()
+            if delay:
+                await asyncio.sleep(delay)
+            return self._cassette.replay(url)
+        resp = await self._client.get(url, headers=headers)
+        if self._cassette is not None:
+            self._cassette.record(url, resp)
+        return resp
+
+    def request_rate(self, host: str) -> float:
+        """Host için uyarlamalı denetleyicinin güncel hızı (istek/sn)."""
+        return self._rate.rate(host)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        cache = (
+            self._cache.stats
+            if self._cache
+            else {"cache_hits": 0, "cache_misses": 0, "cache_bytes_saved": 0}
+        )
+        return {
+            **cache,
+            "coalesced": self._coalesced,
+            "retries": self._budget.retries,
+            "retries_denied": self._budget.denied,
+            "circuit_rejections": self._breaker.rejections,
+            "replay_misses": self._cassette.missed if self._cassette else 0,
+        }
+
     async def aclose(self) -> None:
+        self._scheduler.close()
+        if self._cassette is not None:
+            self._cassette.close()
         await self._client.aclose()
 
     async def __aenter__(self) -> AsyncHTTPClient:
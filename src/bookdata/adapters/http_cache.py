@@ -0,0 +1,147 @@
+"""Koşullu GET cache'i: yanıt gövdelerini ve doğrulayıcıları (ETag/Last-Modified) diskte tutar.
+
+Gece çalışmalarında liste sayfalarının çoğu dünküyle bayt-bayt aynıdır. Cache,
+URL başına son gövdeyi ve sunucunun verdiği doğrulayıcıları saklar; sonraki istekte
+`If-None-Match` / `If-Modified-Since` gönderilir ve 304 gelirse gövde diskten okunur.
+
+- Anahtar: URL'nin SHA-256 özeti → `{anahtar}.json` (meta) + `{anahtar}.body` (gövde)
+- Boyut sınırı: toplam gövde boyutu `max_bytes`'ı aşınca en eski kullanılanlar silinir
+  (toplam boyut ve LRU sırası bellekte tutulur; dizin yalnızca açılışta bir kez taranır)
+- Yazma: meta ve gövde geçici dosya + `os.replace` ile; yarım kalan yazım girdiyi bozmaz
+- Sayaçlar: `hits` (304 → diskten), `misses`, `bytes_saved`
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_KEPT_HEADERS = ("content-type", "etag", "last-modified")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Koşullu istek header'ları (sunucu hiç doğrulayıcı vermediyse boş)."""
+        conditional: dict[str, str] = {}
+        if etag := self.headers.get("etag"):
+            conditional["If-None-Match"] = etag
+        if last_modified := self.headers.get("last-modified"):
+            conditional["If-Modified-Since"] = last_modified
+        return conditional
+
+
+class ResponseCache:
+    """URL anahtarlı, boyut sınırlı disk cache'i."""
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Anahtar → gövde boyu, en eski kullanılandan en yeniye (LRU sırası)
+        found = [(path.stat(), path.stem) for path in self.directory.glob("*.body")]
+        self._sizes: OrderedDict[str, int] = OrderedDict(
+            (key, st.st_size) for st, key in sorted(found, key=lambda item: item[0].st_mtime)
+        )
+        self._total = sum(self._sizes.values())
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        """URL için saklanan yanıtı döndürür; yoksa veya bozuksa None."""
+        key = self._key(url)
+        if key not in self._sizes:
+            return None
+        try:
+            meta = json.loads((self.directory / f"{key}.json").read_text(encoding="utf-8"))
+            body = (self.directory / f"{key}.body").read_bytes()
+        except (OSError, ValueError):
+            self._drop(key)
+            return None
+        if meta.get("url") != url:  # özet çakışması; pratikte olmaz ama körü körüne güvenme
+            return None
+        return CachedResponse(url=url, headers=meta.get("headers", {}), body=body)
+
+    def hit(self, entry: CachedResponse, request: httpx.Request) -> httpx.Response:
+        """304 yanıtını diskteki gövdeyle tam bir 200 yanıtına çevirir."""
+        self.hits += 1
+        self.bytes_saved += len(entry.body)
+        key = self._key(entry.url)
+        if key in self._sizes:
+            self._sizes.move_to_end(key)
+        with contextlib.suppress(OSError):
+            os.utime(self.directory / f"{key}.body")  # sonraki çalıştırmanın LRU sırası için
+        return httpx.Response(200, headers=entry.headers, content=entry.body, request=request)
+
+    def store(self, url: str, response: httpx.Response) -> None:
+        """Doğrulayıcısı olan 200 yanıtlarını saklar; diğerlerini yalnızca ıskalama sayar."""
+        self.misses += 1
+        if response.status_code != 200:
+            return
+        headers = {k: response.headers[k] for k in _KEPT_HEADERS if k in response.headers}
+        if "etag" not in headers and "last-modified" not in headers:
+            return
+        body = response.content
+        if len(body) > self.max_bytes:
+            return
+
+        key = self._key(url)
+        meta_path = self.directory / f"{key}.json"
+        body_path = self.directory / f"{key}.body"
+        try:
+            # Önce eski meta silinir: arada ölünürse meta'sız gövde kalır ve okunurken atılır;
+            # yeni gövde eski doğrulayıcılarla asla eşleşmez
+            meta_path.unlink(missing_ok=True)
+            _write_atomic(body_path, body)
+            _write_atomic(meta_path, json.dumps({"url": url, "headers": headers}).encode())
+        except OSError as exc:
+            logger.warning("HTTP cache yazılamadı (%s): %s", url, exc)
+            self._drop(key)
+            return
+        self._total += len(body) - self._sizes.get(key, 0)
+        self._sizes[key] = len(body)
+        self._sizes.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._total > self.max_bytes and self._sizes:
+            self._drop(next(iter(self._sizes)))
+
+    def _drop(self, key: str) -> None:
+        self._total -= self._sizes.pop(key, 0)
+        for suffix in (".json", ".body"):
+            (self.directory / f"{key}{suffix}").unlink(missing_ok=True)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "cache_bytes_saved": self.bytes_saved,
+        }
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
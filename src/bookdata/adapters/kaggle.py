@@ -3,6 +3,9 @@
 Veri seti kimliği (`BOOKDATA_KAGGLE_DATASET`) ve kimlik bilgileri
 (`KAGGLE_USERNAME`, `KAGGLE_KEY`) kodda gömülü değildir; ENV'den alınır.
 Böylece repo başkası tarafından fork edilince kendi veri setine yükler.
+
+Her sürüm, veri seti CSV'sinin yanında verilen ek dosyaları (ör. kategori üyelik tablosu)
+da taşır; Kaggle yeni sürümde olmayan dosyaları sildiği için hepsi birlikte yüklenir.
 """
 
 from __future__ import annotations
@@ -10,6 +13,7 @@ from __future__ import annotations
 import json
 import logging
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -23,7 +27,10 @@ class KagglePublisher:
     def can_publish(self) -> bool:
         return bool(self.dataset_id)
 
-    def publish(self, csv_path: Path, store: str, note: str) -> None:
+    def publish(
+        self, csv_path: Path, store: str, note: str, extra: Mapping[Path, str] | None = None
+    ) -> None:
+        """`csv_path` ve `extra`'daki (yol → açıklama) dosyaları tek sürüm olarak yükler."""
         from kaggle.api.kaggle_api_extended import KaggleApi  # yalnızca yayınlarken yüklenir
 
         if not self.dataset_id:
@@ -33,6 +40,7 @@ class KagglePublisher:
             return
 
         owner, slug = self.dataset_id.split("/", 1)
+        files = {csv_path: f"{store} veri seti", **(extra or {})}
         with tempfile.TemporaryDirectory() as tmp:
             workdir = Path(tmp)
             (workdir / "dataset-metadata.json").write_text(
@@ -41,13 +49,17 @@ class KagglePublisher:
                         "title": slug,
                         "id": self.dataset_id,
                         "licenses": [{"name": "CC0-1.0"}],
-                        "resources": [{"path": csv_path.name, "description": f"{store} veri seti"}],
+                        "resources": [
+                            {"path": path.name, "description": description}
+                            for path, description in files.items()
+                        ],
                     },
                     indent=2,
                 ),
                 encoding="utf-8",
             )
-            (workdir / csv_path.name).write_bytes(csv_path.read_bytes())
+            for path in files:
+                (workdir / path.name).write_bytes(path.read_bytes())
 
             api = KaggleApi()
             api.authenticate()
@@ -0,0 +1,243 @@
+"""Parquet veri deposu: `DatasetStore` ile aynı sözleşme, sütunlu ve güne göre bölümlü.
+
+Düzen: `Data/{store}_Datasets/gun=YYYY-MM-DD/part-<zaman>.parquet`. Her `append` kayıtları
+tarihlerine göre gün bölümlerine yeni birer dosya olarak (geçici dosya + `os.replace`)
+yazar. Dosya adındaki zaman damgası örnek içinde artan, dizinde benzersizdir; aynı
+nanosaniyede iki ekleme birbirinin dosyasını ezmez.
+
+`flush()` bu örneğin yazdığı her gün bölümünü tek dosyada birleştirir (ek partiler küçük
+dosya yığmaz). Birleşik dosya kapsadığı damga aralığını adında taşır
+(`part-<ilk>-<son>.parquet`); aralığın içindeki eski dosyalar okunmaz, ardından silinir.
+Böylece birleştirme ortasında çöken bir süreç satır kaybettirmez ya da çoğaltmaz.
+
+Sütun adları CSV başlığıyla aynıdır. Site, Kategori, Yayınevi, Para Birimi ve Stok Durumu
+sözlük kodludur (pandas'ta `category`), Tarih gerçek zaman damgası, Fiyat `float64`'tür;
+analiz tarafı metin ayrıştırmaz.
+
+Kaggle CSV beklediği için `export_csv` aynı şemada CSV üretir. pyarrow opsiyoneldir:
+`uv sync --extra parquet`.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bookdata.adapters.storage import HEADER, DatasetStats, write_dataset_csv
+from bookdata.models import Product, ProductRecord, format_timestamp
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+DICTIONARY_COLUMNS = ("Yayınevi", "Kategori", "Site", "Para Birimi", "Stok Durumu")
+
+_PART_NAME = re.compile(r"part-(\d+)(?:-(\d+))?\.parquet")
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.parquet  # noqa: F401
+    except ImportError as exc:
+        raise ImportError("Parquet deposu için: `uv sync --extra parquet`") from exc
+    return pyarrow
+
+
+def dataset_schema() -> pa.Schema:
+    pa = _pyarrow()
+    text = pa.dictionary(pa.int32(), pa.string())
+    types = {"Fiyat": pa.float64(), "Tarih": pa.timestamp("s")}
+    return pa.schema(
+        [
+            pa.field(name, types.get(name, text if name in DICTIONARY_COLUMNS else pa.string()))
+            for name in HEADER
+        ]
+    )
+
+
+class ParquetDatasetStore:
+    """Güne göre bölümlü Parquet veri seti; `DatasetStore` ile aynı metotlar.
+
+    - `load()`: CSV deposundaki gibi metin değerli satırlar
+    - `load_frame()`: analiz için tipli DataFrame (kategorik sütunlar, gerçek tarih)
+    - `last_price_by_url()`: yalnızca URL/Fiyat/Tarih sütunlarını okur
+    - `row_count()`: yalnızca dosya üst verisinden
+    - `flush()`: yazılan gün bölümlerini tek dosyada birleştirir
+    - `export_csv()`: Kaggle için CSV
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._last_stamp = 0
+        self._dirty_days: set[str] = set()
+
+    def _files(self) -> list[Path]:
+        # Gün bölümü, sonra yazılma zamanı: dosya sırası ekleme sırasıdır
+        files: list[Path] = []
+        for day in sorted(self.directory.glob("gun=*")):
+            files.extend(_live_parts(day)[0])
+        return files
+
+    def _next_stamp(self, days: Sequence[str]) -> int:
+        """Örnek içinde artan ve hedef gün bölümlerindeki her dosyadan büyük damga.
+
+        Saat geri gitse bile yeni dosya birleşik bir dosyanın aralığına düşüp gizlenmez.
+        """
+        newest = max(
+            (
+                _stamp_range(f)[1]
+                for day in days
+                for f in (self.directory / f"gun={day}").glob("part-*.parquet")
+            ),
+            default=0,
+        )
+        self._last_stamp = max(time.time_ns(), self._last_stamp + 1, newest + 1)
+        return self._last_stamp
+
+    def _table(self, columns: Sequence[str] | None = None) -> pa.Table:
+        pa = _pyarrow()
+        files = self._files()
+        schema = dataset_schema()
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns])
+        if not files:
+            return schema.empty_table()
+        tables = [pa.parquet.read_table(f, columns=columns, schema=schema) for f in files]
+        return pa.concat_tables(tables)
+
+    def load_frame(self) -> pd.DataFrame:
+        return self._table().to_pandas()
+
+    def load(self) -> list[dict[str, str]]:
+        rows: list[dict[str, str]] = []
+        for row in self._table().to_pylist():
+            rows.append(
+                {
+                    name: (
+                        format_timestamp(value)
+                        if isinstance(value, datetime)
+                        else ""
+                        if value is None
+                        else str(value)
+                    )
+                    for name, value in row.items()
+                }
+            )
+        return rows
+
+    def last_price_by_url(self) -> dict[str, float]:
+        """Her URL için son kayıttaki fiyatı döndürür (Tarih'e göre en güncel)."""
+        frame = self._table(["URL", "Fiyat", "Tarih"]).to_pandas()
+        if frame.empty:
+            return {}
+        latest = frame.sort_values("Tarih", kind="stable").drop_duplicates("URL", keep="last")
+        return dict(zip(latest["URL"], latest["Fiyat"].astype(float), strict=True))
+
+    def append(self, products: Sequence[Product | ProductRecord], *, flush: bool = True) -> int:
+        if not products:
+            return 0
+        pa = _pyarrow()
+        by_day: dict[str, list[Product | ProductRecord]] = {}
+        for product in products:
+            by_day.setdefault(product.scraped_at.strftime("%Y-%m-%d"), []).append(product)
+        schema = dataset_schema()
+        stamp = self._next_stamp(list(by_day))
+        for day, group in by_day.items():
+            rows = [_row(product) for product in group]
+            table = pa.Table.from_pylist(rows, schema=schema)
+            target = self.directory / f"gun={day}" / f"part-{stamp:020d}.parquet"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(".tmp")
+            pa.parquet.write_table(table, tmp, compression="zstd")
+            os.replace(tmp, target)
+        self._dirty_days.update(by_day)
+        logger.info("Veri setine %s yeni kayıt eklendi: %s", len(products), self.directory)
+        if flush:
+            self.flush()
+        return len(products)
+
+    def flush(self) -> None:
+        """Bu örneğin yazdığı gün bölümlerini birer dosyada birleştirir."""
+        pa = _pyarrow()
+        for day in sorted(self._dirty_days):
+            directory = self.directory / f"gun={day}"
+            live, covered = _live_parts(directory)
+            if len(live) > 1:
+                ranges = [_stamp_range(f) for f in live]
+                first, last = min(lo for lo, _ in ranges), max(hi for _, hi in ranges)
+                table = pa.concat_tables(
+                    pa.parquet.read_table(f, schema=dataset_schema()) for f in live
+                )
+                target = directory / f"part-{first:020d}-{last:020d}.parquet"
+                tmp = target.with_suffix(".tmp")
+                pa.parquet.write_table(table, tmp, compression="zstd")
+                os.replace(tmp, target)
+                covered += live
+                logger.info("%s bölümü birleştirildi: %s dosya → 1", directory.name, len(live))
+            for f in covered:
+                f.unlink(missing_ok=True)
+        self._dirty_days.clear()
+
+    def row_count(self) -> int:
+        pa = _pyarrow()
+        return sum(pa.parquet.ParquetFile(f).metadata.num_rows for f in self._files())
+
+    def stats(self) -> DatasetStats:
+        pa = _pyarrow()
+        table = self._table(["URL", "Tarih"])
+        if not table.num_rows:
+            return DatasetStats(0, None, None, 0)
+        bounds = pa.compute.min_max(table["Tarih"]).as_py()
+        return DatasetStats(
+            table.num_rows,
+            format_timestamp(bounds["min"]),
+            format_timestamp(bounds["max"]),
+            pa.compute.count_distinct(table["URL"]).as_py(),
+        )
+
+    def export_csv(self, path: Path) -> int:
+        """Veri setini CSV deposuyla aynı biçimde (`;`, aynı başlık) dışa aktarır."""
+        rows = self.load()
+        write_dataset_csv(path, rows)
+        logger.info("Parquet veri seti CSV'ye aktarıldı: %s (%s kayıt)", path, len(rows))
+        return len(rows)
+
+
+def _stamp_range(path: Path) -> tuple[int, int]:
+    match = _PART_NAME.fullmatch(path.name)
+    if match is None:
+        raise ValueError(f"Beklenmeyen Parquet dosya adı: {path}")
+    first = int(match.group(1))
+    return first, int(match.group(2) or first)
+
+
+def _live_parts(directory: Path) -> tuple[list[Path], list[Path]]:
+    """Gün bölümündeki (okunacak, başka bir birleşik dosyanın kapsadığı) dosyalar."""
+    parts = sorted(directory.glob("part-*.parquet"))
+    ranges = {f: _stamp_range(f) for f in parts}
+    live: list[Path] = []
+    covered: list[Path] = []
+    for f, (lo, hi) in ranges.items():
+        inside = any(
+            other != f and olo <= lo and hi <= ohi and (olo, ohi) != (lo, hi)
+            for other, (olo, ohi) in ranges.items()
+        )
+        (covered if inside else live).append(f)
+    return live, covered
+
+
+def _row(product: Product | ProductRecord) -> dict[str, Any]:
+    values = dict(zip(HEADER, product.to_csv_row(), strict=True))
+    values["Tarih"] = product.scraped_at.replace(tzinfo=None)
+    values["Resim"] = product.image_url
+    return values
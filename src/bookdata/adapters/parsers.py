@@ -0,0 +1,165 @@
+"""HTML ayrıştırıcı backend'leri: `html.parser`, `lxml` ve `selectolax` (lexbor).
+
+Adapter'lar DOM'a yalnızca küçük bir arayüzle dokunur: `select`, `select_one`, `find`,
+`get_text(strip=True)`, `get(attr)` ve `string`. BeautifulSoup bu arayüzü zaten
+sağlar; `html.parser` ve `lxml` onun tree builder'larıdır. `selectolax` için ince bir
+sarmalayıcı (`LexborNode`) aynı arayüzü lexbor üzerinde sunar, böylece adapter kodu
+backend'den bağımsız kalır.
+
+Seçim `BOOKDATA_HTML_PARSER` ile yapılır; `auto`, kurulu olanlar arasından ölçümde en
+hızlı çıkanı seçer (selectolax → lxml → html.parser; bkz. `benchmarks/bench_parsers.py`).
+Hızlı backend'ler opsiyoneldir: `uv sync --extra fast`.
+
+Kısmi ayrıştırma: adapter'lar ihtiyaç duydukları bölgeleri (`div.product-item`,
+`div.pagination`, `script[type="application/ld+json"]` gibi basit seçiciler) bildirir;
+BeautifulSoup backend'lerinde yalnızca bu alt ağaçlar kurulur (menü, header, footer
+atlanır). selectolax tüm belgeyi zaten çok hızlı kurduğu için bölgeleri yok sayar.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+
+if TYPE_CHECKING:
+    from selectolax.lexbor import LexborNode as _LexborNode
+
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+# Ölçülen hıza göre (hızlıdan yavaşa) `auto` tercih sırası
+_AUTO_ORDER = ("selectolax", "lxml", "html.parser")
+_BACKEND_MODULES = {"selectolax": "selectolax", "lxml": "lxml", "html.parser": "html.parser"}
+
+
+class LexborNode:
+    """selectolax düğümünü BeautifulSoup'un adapter'larca kullanılan alt kümesiyle sarar."""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node: _LexborNode) -> None:
+        self._node = node
+
+    def select(self, selector: str) -> list[LexborNode]:
+        return [LexborNode(n) for n in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> LexborNode | None:
+        node = self._node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def find(self, name: str) -> LexborNode | None:
+        return self.select_one(name)
+
+    def get_text(self, strip: bool = False) -> str:
+        return self._node.text(deep=True, separator="", strip=strip)
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        value = self._node.attributes.get(attr)
+        return default if value is None else value
+
+    @property
+    def string(self) -> str | None:
+        return self._node.text(deep=True)
+
+
+Document = BeautifulSoup | LexborNode
+
+LD_JSON_REGION = 'script[type="application/ld+json"]'
+
+_REGION = re.compile(
+    r"""^(?P<tag>[\w-]+)(?:\.(?P<cls>[\w-]+))?"""
+    r"""(?:\[(?P<attr>[\w-]+)=["']?(?P<value>[^"'\]]+)["']?\])?$"""
+)
+
+
+@dataclass(frozen=True)
+class Region:
+    """`tag`, `tag.class` veya `tag[attr=value]` biçimindeki bir bölge seçicisi."""
+
+    tag: str
+    cls: str | None = None
+    attr: str | None = None
+    value: str | None = None
+
+    @classmethod
+    def parse(cls, selector: str) -> Region:
+        match = _REGION.match(selector.strip())
+        if match is None:
+            raise ValueError(f"Desteklenmeyen bölge seçicisi: {selector}")
+        return cls(**match.groupdict())
+
+    def matches(self, name: str, attrs: dict) -> bool:
+        if name != self.tag:
+            return False
+        if self.cls is not None:
+            classes = attrs.get("class") or ""
+            if isinstance(classes, str):
+                classes = classes.split()
+            if self.cls not in classes:
+                return False
+        return self.attr is None or attrs.get(self.attr) == self.value
+
+
+class RegionFilter(ElementFilter):
+    """Yalnızca bölgelere uyan etiketlerin (ve alt ağaçlarının) kurulmasına izin verir.
+
+    BeautifulSoup filtreyi sadece kabul edilmiş bir atası olmayan düğümler için sorar;
+    kabul edilen bir bölgenin içeriği olduğu gibi kurulur.
+    """
+
+    def __init__(self, regions: Sequence[Region]) -> None:
+        super().__init__()
+        self.regions = tuple(regions)
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix: str | None, name: str, attrs: dict | None) -> bool:
+        return any(region.matches(name, attrs or {}) for region in self.regions)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+
+@cache
+def region_filter(selectors: tuple[str, ...]) -> RegionFilter:
+    return RegionFilter([Region.parse(selector) for selector in selectors])
+
+
+@cache
+def resolve_backend(name: str) -> str:
+    """`auto`yu kurulu en hızlı backend'e çözer; bilinmeyen adlarda `ValueError`."""
+    if name == "auto":
+        for candidate in _AUTO_ORDER:
+            if importlib.util.find_spec(_BACKEND_MODULES[candidate]) is not None:
+                return candidate
+    if name not in PARSER_BACKENDS:
+        options = ", ".join((*PARSER_BACKENDS, "auto"))
+        raise ValueError(f"Bilinmeyen HTML ayrıştırıcı: {name} (seçenekler: {options})")
+    return name
+
+
+def make_document(
+    content: bytes | str, backend: str = "html.parser", regions: Sequence[str] = ()
+) -> Document:
+    """Ham sayfadan seçilen backend ile sorgulanabilir bir belge kurar.
+
+    `regions` verilirse BeautifulSoup backend'leri yalnızca bu bölgeleri kurar.
+    """
+    backend = resolve_backend(backend)
+    if backend == "selectolax":
+        try:
+            from selectolax.lexbor import LexborHTMLParser
+        except ImportError as exc:
+            raise ImportError("selectolax backend'i için: `uv sync --extra fast`") from exc
+        return LexborNode(LexborHTMLParser(content).root)
+    if regions:
+        return BeautifulSoup(content, backend, parse_only=region_filter(tuple(regions)))
+    return BeautifulSoup(content, backend)
@@ -0,0 +1,70 @@
+"""Uyarlamalı hız denetleyicisi: host başına AIMD ile istek aralığını ayarlar.
+
+Sabit `min_request_interval` ya yavaş tarama ya da ban demektir. Denetleyici her
+host için bir istek hızı (istek/sn) tutar:
+
+- Hızlı (`slow_response_seconds` altı) 2xx yanıtlarda hız toplamsal olarak artar
+- 429/408 (`RateLimitedError`), 5xx (`TemporaryServerError`) ve zaman aşımlarında
+  (`FetchTimeoutError`) hız çarpımsal olarak düşer
+- Aralık `[min_interval_floor, max_request_interval]` içinde tutulur
+
+`adaptive_rate=False` ise aralık sabit `min_request_interval` olarak kalır.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from bookdata.config import Settings
+from bookdata.errors import FetchError, FetchTimeoutError, RateLimitedError, TemporaryServerError
+
+logger = logging.getLogger(__name__)
+
+ADDITIVE_STEP = 0.25  # hızlı her başarılı yanıtta eklenen istek/sn
+BACKOFF_FACTOR = 0.5  # geri çekilmede hızın çarpanı
+MIN_BACKOFF_INTERVAL = 0.1  # aralık 0 iken (sınırsız) ilk geri çekilmenin tabanı
+
+_BACKOFF_ERRORS = (RateLimitedError, TemporaryServerError, FetchTimeoutError)
+
+
+class AdaptiveRateController:
+    """Host başına AIMD hız denetimi; `interval(host)` bir sonraki istek aralığını verir."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._enabled = settings.adaptive_rate
+        self._start = settings.min_request_interval
+        self._floor = min(settings.min_interval_floor, settings.min_request_interval)
+        self._ceiling = max(settings.max_request_interval, settings.min_request_interval)
+        self._slow = settings.slow_response_seconds
+        self._intervals: dict[str, float] = {}
+
+    def interval(self, host: str) -> float:
+        return self._intervals.get(host, self._start)
+
+    def on_response(self, host: str, elapsed: float) -> None:
+        """Başarılı yanıt: hızlıysa hızı toplamsal artırır, yavaşsa olduğu gibi bırakır."""
+        if not self._enabled or elapsed >= self._slow:
+            return
+        current = self.interval(host)
+        rate = 1.0 / current if current > 0 else float("inf")
+        self._intervals[host] = max(self._floor, 1.0 / (rate + ADDITIVE_STEP))
+
+    def on_error(self, host: str, exc: FetchError) -> None:
+        """Sunucu baskı işareti veriyorsa (429/5xx/zaman aşımı) hızı çarpımsal düşürür."""
+        if not self._enabled or not isinstance(exc, _BACKOFF_ERRORS):
+            return
+        current = max(self.interval(host), MIN_BACKOFF_INTERVAL)
+        slowed = min(self._ceiling, current / BACKOFF_FACTOR)
+        self._intervals[host] = slowed
+        logger.info(
+            "Hız düşürüldü (%s): %.2f istek/sn (%s)", host, 1.0 / slowed, type(exc).__name__
+        )
+
+    def rate(self, host: str) -> float:
+        """Host'un güncel istek hızı (istek/sn); aralık 0 ise sınırsız (`inf`)."""
+        interval = self.interval(host)
+        return 1.0 / interval if interval > 0 else float("inf")
+
+    @property
+    def rates(self) -> dict[str, float]:
+        return {host: self.rate(host) for host in self._intervals}
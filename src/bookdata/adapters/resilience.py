@@ -0,0 +1,163 @@
+"""Dayanıklılık: host başına devre kesici ve istemci geneli retry bütçesi.
+
+Bir host her şeye 503 dönmeye başladığında yüzlerce coroutine'in her biri ayrı ayrı
+üstel geri çekilmeyle beklerse çalışma saatlerce asılı kalır. Bunun yerine:
+
+- `CircuitBreaker`: ardışık `failure_threshold` sunucu hatasında host'un devresi açılır
+  (OPEN) ve istekler ağa çıkmadan `CircuitOpenError` ile düşer; `reset_timeout` sonra
+  tek bir deneme isteğine izin verilir (HALF_OPEN), başarılıysa devre kapanır
+- `RetryBudget`: tüm `get` çağrıları tek bütçeyi paylaşır; retry sayısı istek sayısının
+  `ratio` katını (+ küçük bir başlangıç payı) aşamaz
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+from bookdata.errors import (
+    FetchTimeoutError,
+    FetchTransportError,
+    RateLimitedError,
+    TemporaryServerError,
+)
+
+logger = logging.getLogger(__name__)
+
+MIN_RETRIES = 10  # çalışmanın başında, istek sayısı azken de birkaç retry'a izin ver
+
+_FAILURES = (RateLimitedError, TemporaryServerError, FetchTimeoutError, FetchTransportError)
+
+
+def counts_as_failure(exc: BaseException) -> bool:
+    """Host'un sağlığını gösteren hatalar (429/5xx/ağ); 404 gibi kalıcı hatalar sayılmaz."""
+    return isinstance(exc, _FAILURES)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+class CircuitBreaker:
+    """Host başına CLOSED → OPEN → HALF_OPEN devre kesici."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self.rejections = 0
+
+    def state(self, host: str) -> CircuitState:
+        return self._circuits.get(host, _Circuit()).state
+
+    def rejects(self, host: str) -> bool:
+        """Kuyruğa girmeden önceki ucuz kontrol: devre kesin olarak kapalı mı (durum değişmez)?"""
+        circuit = self._circuits.get(host)
+        if circuit is None or circuit.state is CircuitState.CLOSED:
+            return False
+        if circuit.state is CircuitState.OPEN:
+            rejected = self._clock() - circuit.opened_at < self.reset_timeout
+        else:
+            rejected = circuit.probing
+        if rejected:
+            self.rejections += 1
+        return rejected
+
+    def allow(self, host: str) -> bool:
+        """İstek ağa çıkabilir mi? HALF_OPEN'da aynı anda yalnızca bir deneme geçer."""
+        circuit = self._circuits.setdefault(host, _Circuit())
+        if circuit.state is CircuitState.OPEN:
+            if self._clock() - circuit.opened_at < self.reset_timeout:
+                self.rejections += 1
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probing = False
+        if circuit.state is CircuitState.HALF_OPEN:
+            if circuit.probing:
+                self.rejections += 1
+                return False
+            circuit.probing = True
+        return True
+
+    def record_success(self, host: str) -> None:
+        circuit = self._circuits.setdefault(host, _Circuit())
+        if circuit.state is not CircuitState.CLOSED:
+            logger.info("Devre kapandı (%s): host yeniden yanıt veriyor", host)
+        circuit.state = CircuitState.CLOSED
+        circuit.failures = 0
+        circuit.probing = False
+
+    def record_failure(self, host: str) -> None:
+        circuit = self._circuits.setdefault(host, _Circuit())
+        circuit.failures += 1
+        circuit.probing = False
+        if circuit.state is CircuitState.HALF_OPEN or (
+            circuit.state is CircuitState.CLOSED and circuit.failures >= self.failure_threshold
+        ):
+            circuit.state = CircuitState.OPEN
+            circuit.opened_at = self._clock()
+            logger.warning(
+                "Devre açıldı (%s): %s ardışık hata, %.0f sn boyunca istek atılmayacak",
+                host,
+                circuit.failures,
+                self.reset_timeout,
+            )
+
+    def release(self, host: str) -> None:
+        """Sonuçsuz biten (iptal edilen) HALF_OPEN denemesini serbest bırakır."""
+        circuit = self._circuits.get(host)
+        if circuit is not None:
+            circuit.probing = False
+
+    def record(self, host: str, exc: BaseException | None) -> None:
+        """Sonucu devreye işler: sağlık hatası → failure, diğer her şey → success."""
+        if exc is not None and counts_as_failure(exc):
+            self.record_failure(host)
+        else:
+            self.record_success(host)
+
+
+class RetryBudget:
+    """İstemci geneli retry bütçesi: retry ≤ MIN_RETRIES + ratio × istek."""
+
+    def __init__(self, ratio: float) -> None:
+        self.ratio = ratio
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self) -> None:
+        self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Bütçe izin veriyorsa bir retry harcar; tükenmişse False döner."""
+        if self.retries < MIN_RETRIES + self.ratio * self.requests:
+            self.retries += 1
+            return True
+        self.denied += 1
+        if self.denied == 1:
+            logger.warning(
+                "Retry bütçesi tükendi (%s retry / %s istek); hatalar artık tekrar denenmeyecek",
+                self.retries,
+                self.requests,
+            )
+        return False
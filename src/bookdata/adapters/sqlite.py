@@ -0,0 +1,232 @@
+"""SQLite veri deposu: `DatasetStore` ile aynı sözleşme, indeksli fiyat geçmişi.
+
+Tek dosya (`Data/{store}_Datasets.sqlite`, WAL kipinde), iki tablo:
+
+- `products`: URL başına bir satır; kitabın en güncel tanımlayıcı alanları ve son fiyatı
+- `price_observations`: her gözlem, CSV satırının tüm alanlarıyla; `(url, scraped_at)`
+  indeksli
+
+`last_price_by_url` yalnızca `products`'ı, `history(url)` indeksten tek URL'nin gözlemlerini
+okur; CSV'deki gibi tüm geçmiş taranmaz. `append` her partiyi tek işlemde `executemany` ile
+yazar. `load()`/`export_csv()` satırları yalnızca gözlemlerden okur: her satır yazıldığı
+andaki başlık, yayınevi, ISBN ve görselle döner, CSV deposuyla birebir aynıdır. Mevcut CSV
+geçmişi `import_csv` ile bir kez aktarılır.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bookdata.adapters.storage import HEADER, DatasetStats, write_dataset_csv
+from bookdata.models import Product, ProductRecord, format_timestamp
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    publisher TEXT NOT NULL,
+    site TEXT NOT NULL,
+    image_url TEXT,
+    isbn TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    last_price REAL NOT NULL,
+    last_scraped_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS price_observations (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL REFERENCES products (url),
+    scraped_at TEXT NOT NULL,
+    price REAL NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT NOT NULL,
+    publisher TEXT NOT NULL,
+    category TEXT NOT NULL,
+    site TEXT NOT NULL,
+    image_url TEXT,
+    isbn TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    availability TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS price_observations_url_time
+    ON price_observations (url, scraped_at);
+"""
+
+# Aynı URL'nin daha eski tarihli bir kaydı (ör. içe aktarma) son fiyatı ezmez
+_UPSERT_PRODUCT = """
+INSERT INTO products VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (url) DO UPDATE SET
+    title = excluded.title, author = excluded.author, publisher = excluded.publisher,
+    site = excluded.site, image_url = excluded.image_url, isbn = excluded.isbn,
+    currency = excluded.currency, last_price = excluded.last_price,
+    last_scraped_at = excluded.last_scraped_at
+WHERE excluded.last_scraped_at >= products.last_scraped_at
+"""
+
+_INSERT_OBSERVATION = """
+INSERT INTO price_observations (
+    url, title, author, publisher, site, image_url, isbn, currency, price, scraped_at,
+    category, availability
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# CSV başlığıyla aynı sıra ve adlar; her alan gözlemin kendisinden
+_SELECT_ROWS = """
+SELECT title AS "Kitap İsmi", author AS "Yazar", publisher AS "Yayınevi",
+       category AS "Kategori", price AS "Fiyat", url AS "URL", site AS "Site",
+       scraped_at AS "Tarih", image_url AS "Resim", isbn AS "ISBN",
+       currency AS "Para Birimi", availability AS "Stok Durumu"
+FROM price_observations
+ORDER BY id
+"""
+
+
+class SqliteDatasetStore:
+    """WAL kipinde SQLite veri seti; `DatasetStore` ile aynı metotlar + `history(url)`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            yield conn
+
+    def load(self) -> list[dict[str, str]]:
+        with self._connect() as conn:
+            cursor = conn.execute(_SELECT_ROWS)
+            return [
+                dict(zip(HEADER, ("" if v is None else str(v) for v in row), strict=True))
+                for row in cursor
+            ]
+
+    def load_frame(self) -> pd.DataFrame:
+        import pandas as pd
+
+        with self._connect() as conn:
+            return pd.read_sql_query(_SELECT_ROWS, conn, parse_dates=["Tarih"])
+
+    def last_price_by_url(self) -> dict[str, float]:
+        """Her URL için son kayıttaki fiyatı döndürür (Tarih'e göre en güncel)."""
+        with self._connect() as conn:
+            return dict(conn.execute("SELECT url, last_price FROM products"))
+
+    def history(self, url: str) -> list[tuple[str, float]]:
+        """Bir URL'nin (Tarih, fiyat) gözlemleri, eskiden yeniye."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT scraped_at, price FROM price_observations"
+                " WHERE url = ? ORDER BY scraped_at, id",
+                (url,),
+            ).fetchall()
+
+    def append(self, products: Sequence[Product | ProductRecord], *, flush: bool = True) -> int:
+        if not products:
+            return 0
+        rows = [
+            (
+                p.url,
+                p.title,
+                p.author,
+                p.publisher,
+                p.store,
+                p.image_url,
+                p.isbn,
+                p.currency,
+                p.price,
+                format_timestamp(p.scraped_at),
+                p.category,
+                p.availability,
+            )
+            for p in products
+        ]
+        self._write(rows)
+        logger.info("Veri setine %s yeni kayıt eklendi: %s", len(rows), self.path)
+        return len(rows)
+
+    def _write(self, rows: list[tuple]) -> None:
+        """Satırlar: products sütunları + (kategori, stok); tek işlemde yazılır."""
+        with self._connect() as conn, conn:
+            conn.executemany(_UPSERT_PRODUCT, [row[:10] for row in rows])
+            conn.executemany(_INSERT_OBSERVATION, rows)
+
+    def flush(self) -> None:
+        """Her `append` zaten kalıcıdır; `DatasetStore` ile aynı arayüz için."""
+
+    def row_count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM price_observations").fetchone()[0]
+
+    def stats(self) -> DatasetStats:
+        if not self.path.exists():
+            return DatasetStats(0, None, None, 0)
+        with self._connect() as conn:
+            rows, first, last = conn.execute(
+                "SELECT COUNT(*), MIN(scraped_at), MAX(scraped_at) FROM price_observations"
+            ).fetchone()
+            urls = conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+        return DatasetStats(rows, first, last, urls)
+
+    def import_csv(self, csv_path: Path, batch_size: int = 50_000) -> int:
+        """Mevcut `*_Datasets.csv` geçmişini aktarır; parti başına tek işlem."""
+        imported = 0
+        batch: list[tuple] = []
+        with csv_path.open(encoding="utf-8", newline="") as fh:
+            # Kısa/eski satırlarda eksik sütunlar None gelir (DictReader); boş metin sayılır
+            for raw in csv.DictReader(fh, delimiter=";"):
+                row = {name: raw.get(name) or "" for name in HEADER}
+                try:
+                    price = float(row["Fiyat"])
+                except ValueError:
+                    continue
+                if not row["URL"] or not row["Tarih"]:
+                    continue
+                batch.append(
+                    (
+                        row["URL"],
+                        row["Kitap İsmi"],
+                        row["Yazar"],
+                        row["Yayınevi"],
+                        row["Site"],
+                        row["Resim"] or None,
+                        row["ISBN"],
+                        row["Para Birimi"] or "TRY",
+                        price,
+                        row["Tarih"],
+                        row["Kategori"],
+                        row["Stok Durumu"],
+                    )
+                )
+                if len(batch) >= batch_size:
+                    self._write(batch)
+                    imported += len(batch)
+                    batch = []
+        if batch:
+            self._write(batch)
+            imported += len(batch)
+        logger.info(
+            "CSV geçmişi SQLite'a aktarıldı: %s → %s (%s kayıt)", csv_path, self.path, imported
+        )
+        return imported
+
+    def export_csv(self, path: Path) -> int:
+        """Veri setini CSV deposuyla aynı biçimde (`;`, aynı başlık) dışa aktarır."""
+        rows = self.load()
+        write_dataset_csv(path, rows)
+        logger.info("SQLite veri seti CSV'ye aktarıldı: %s (%s kayıt)", path, len(rows))
+        return len(rows)
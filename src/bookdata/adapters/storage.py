@@ -1,12 +1,35 @@
-"""Veri deposu: veri setini CSV olarak okur/yazar ve fiyat geçmişini tutar."""
+"""Veri deposu: veri setini CSV olarak okur/yazar ve fiyat geçmişini tutar.
+
+CSV'nin yanında ikili bir son fiyat indeksi (`PriceIndex`, `*.idx`) tutulur; fiyat diff'i
+her çalıştırmada tüm geçmişi değil yalnızca URL başına bir kaydı okur.
+
+Veri setinin yanında kategori parmak izleri (`CategoryFingerprints`) bir dizinde, yarım
+kalan çalıştırmanın tamamlanan kategorileri (`CheckpointJournal`) bir günlükte, ürünlerin
+ek kategori üyelikleri (`MembershipTable`) ayrı bir CSV'de tutulur. Kayıt sayısı, tarih
+aralığı ve append partileri `DatasetManifest`'te (`*.manifest.json`) özetlenir. Sütunlu depolama
+ve indeksli geçmiş için aynı sözleşmeli Parquet (`adapters/parquet.py`) ve SQLite
+(`adapters/sqlite.py`) depoları `open_dataset` ile seçilir.
+"""
 
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
+import json
 import logging
+import os
+import struct
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
 
-from bookdata.models import Product
+from bookdata.config import Settings
+from bookdata.models import Product, ProductRecord
+
+if TYPE_CHECKING:
+    from bookdata.adapters.parquet import ParquetDatasetStore
+    from bookdata.adapters.sqlite import SqliteDatasetStore
 
 logger = logging.getLogger(__name__)
 
@@ -24,18 +47,286 @@ HEADER = [
     "Para Birimi",
     "Stok Durumu",
 ]
+DATE_COLUMN = HEADER.index("Tarih")
+
+
+class LastPrice(NamedTuple):
+    """Bir URL'nin veri setindeki son kaydı: fiyat, `Tarih` ve satırın bayt ofseti."""
+
+    price: float
+    scraped_at: str
+    offset: int
+
+
+class PriceIndex:
+    """CSV veri setinin yanında URL → son fiyat/tarih/satır ofseti tutan ikili indeks.
+
+    Dosya: başlık (sihirli sayı, sürüm, kapsanan CSV boyu, CSV'nin ilk 64 KiB'ının SHA-1'i,
+    kayıt sayısı) + URL başına bir kayıt. `sync()` indeksi CSV'ye karşı doğrular:
+
+    - CSV büyümüş ama başı aynıysa yalnızca eklenen kuyruk okunur (yarım kalan çalıştırma
+      ya da dışarıdan ekleme)
+    - indeks yok/bozuk, CSV kısalmış ya da başı değişmişse (ör. Kaggle'dan yeni dosya)
+      tüm CSV'den yeniden kurulur
+
+    Yazma her zaman geçici dosya + `os.replace` ile atomiktir.
+    """
+
+    MAGIC = b"BDPI"
+    VERSION = 1
+    PREFIX_BYTES = 64 * 1024
+    _HEADER = struct.Struct("<4sHQ20sI")
+    _ENTRY = struct.Struct("<dQHH")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def sync(self, csv_path: Path) -> dict[str, LastPrice]:
+        """CSV ile güncel son fiyat tablosu; gerekirse indeksi tamamlayıp kaydeder."""
+        if not csv_path.exists():
+            return {}
+        size = csv_path.stat().st_size
+        loaded = self._read(csv_path, size)
+        entries, covered = loaded if loaded is not None else ({}, 0)
+        if covered < size:
+            if loaded is None:
+                logger.info("Fiyat indeksi CSV'den yeniden kuruluyor: %s", self.path)
+            _scan_rows(csv_path, covered, entries)
+            self.save(csv_path, entries)
+        return entries
+
+    def save(self, csv_path: Path, entries: dict[str, LastPrice]) -> None:
+        size = csv_path.stat().st_size
+        parts = [
+            self._HEADER.pack(
+                self.MAGIC, self.VERSION, size, _prefix_digest(csv_path, size), len(entries)
+            )
+        ]
+        for url, entry in entries.items():
+            url_bytes = url.encode()
+            date_bytes = entry.scraped_at.encode()
+            parts.append(
+                self._ENTRY.pack(entry.price, entry.offset, len(url_bytes), len(date_bytes))
+            )
+            parts.append(url_bytes)
+            parts.append(date_bytes)
+        _write_atomic(self.path, b"".join(parts))
+
+    def _read(self, csv_path: Path, size: int) -> tuple[dict[str, LastPrice], int] | None:
+        """Geçerli indeks → (kayıtlar, kapsanan CSV boyu); yoksa/eskiyse None."""
+        try:
+            data = self.path.read_bytes()
+            magic, version, covered, digest, count = self._HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            return None
+        if magic != self.MAGIC or version != self.VERSION or covered > size:
+            return None
+        if digest != _prefix_digest(csv_path, covered):
+            return None
+        entries: dict[str, LastPrice] = {}
+        pos = self._HEADER.size
+        unpack = self._ENTRY.unpack_from
+        step = self._ENTRY.size
+        try:
+            for _ in range(count):
+                price, offset, url_len, date_len = unpack(data, pos)
+                pos += step
+                url = data[pos : pos + url_len].decode()
+                pos += url_len
+                entries[url] = LastPrice(price, data[pos : pos + date_len].decode(), offset)
+                pos += date_len
+        except (struct.error, UnicodeDecodeError):
+            return None
+        return entries, covered
+
+
+def _prefix_digest(csv_path: Path, size: int) -> bytes:
+    with csv_path.open("rb") as fh:
+        return hashlib.sha1(fh.read(min(size, PriceIndex.PREFIX_BYTES))).digest()
+
+
+def _iter_rows(fh: io.BufferedReader) -> Iterator[tuple[int, list[str]]]:
+    """CSV satırlarını başladıkları bayt ofsetiyle üretir (tırnaklı çok satırlı alanlar dahil)."""
+    position = fh.tell()
+
+    def lines() -> Iterator[str]:
+        nonlocal position
+        for line in fh:
+            position += len(line)
+            yield line.decode("utf-8")
+
+    reader = csv.reader(lines(), delimiter=";")
+    start = position
+    for row in reader:
+        yield start, row
+        start = position
+
+
+def _scan_rows(csv_path: Path, start: int, entries: dict[str, LastPrice]) -> None:
+    """`start` ofsetinden itibaren satırları okuyup URL başına en güncel kaydı günceller."""
+    with csv_path.open("rb") as fh:
+        header = next(csv.reader([fh.readline().decode("utf-8")], delimiter=";"), HEADER)
+        try:
+            url_col, price_col, date_col = (header.index(c) for c in ("URL", "Fiyat", "Tarih"))
+        except ValueError:
+            logger.warning("Veri setinde URL/Fiyat/Tarih sütunu yok: %s", csv_path)
+            return
+        if start > 0:
+            fh.seek(start)
+        for offset, row in _iter_rows(fh):
+            try:
+                url, scraped_at = row[url_col], row[date_col]
+                price = float(row[price_col])
+            except (IndexError, ValueError):
+                continue
+            if not url:
+                continue
+            last = entries.get(url)
+            if last is None or scraped_at >= last.scraped_at:
+                entries[url] = LastPrice(price, scraped_at, offset)
+
+
+class DatasetStats(NamedTuple):
+    """Veri setinin özeti: kayıt sayısı, ilk/son `Tarih`, farklı URL sayısı."""
+
+    rows: int
+    first: str | None
+    last: str | None
+    urls: int
+
+
+class ManifestBatch(NamedTuple):
+    """Bir append partisinin CSV'deki bayt aralığı ve özeti."""
+
+    offset: int
+    end: int
+    rows: int
+    first: str | None
+    last: str | None
+    urls: int
+
+
+class DatasetManifest:
+    """CSV veri setinin yanında `append`'in güncellediği özet (`*.manifest.json`).
+
+    Toplam kayıt sayısı, ilk/son `Tarih`, farklı URL sayısı ve her append partisinin bayt
+    aralığını tutar; `row_count` ve `bookdata stats` CSV'yi taramadan buradan cevaplanır.
+    `PriceIndex` gibi CSV'ye karşı doğrulanır (kapsanan boy + ilk 64 KiB'ın SHA-1'i):
+    dışarıdan eklenen kuyruk tek parti olarak taranır, başı değişmiş CSV baştan taranır.
+    Çalıştırma sırasında `DatasetStore` partileri bellekte biriktirir, `flush()` bir kez yazar.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def sync(self, csv_path: Path, url_count: Callable[[], int]) -> tuple[list[ManifestBatch], int]:
+        """CSV ile güncel (partiler, farklı URL sayısı); gerekirse kuyruğu tarayıp kaydeder."""
+        if not csv_path.exists():
+            return [], 0
+        size = csv_path.stat().st_size
+        loaded = self._read(csv_path, size)
+        if loaded is None:
+            logger.info("Veri seti manifest'i CSV'den yeniden kuruluyor: %s", self.path)
+        batches, urls = loaded if loaded is not None else ([], 0)
+        covered = batches[-1].end if batches else 0
+        if covered < size:
+            batches.append(_scan_batch(csv_path, covered, size))
+            urls = url_count()
+            self.save(csv_path, batches, urls)
+        return batches, urls
+
+    def save(self, csv_path: Path, batches: list[ManifestBatch], urls: int) -> None:
+        size = csv_path.stat().st_size
+        data = {
+            "version": self.VERSION,
+            "csv_bytes": size,
+            "prefix_sha1": _prefix_digest(csv_path, size).hex(),
+            **summarize(batches, urls)._asdict(),
+            "batches": [b._asdict() for b in batches],
+        }
+        _write_atomic(self.path, json.dumps(data, ensure_ascii=False))
+
+    def _load(self) -> dict | None:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data if isinstance(data, dict) and data.get("version") == self.VERSION else None
+
+    def _read(self, csv_path: Path, size: int) -> tuple[list[ManifestBatch], int] | None:
+        """Geçerli manifest'in partileri ve URL sayısı; yoksa/bozuksa/başı değişmişse None."""
+        data = self._load()
+        if data is None:
+            return None
+        try:
+            covered = int(data["csv_bytes"])
+            urls = int(data["urls"])
+            batches = [ManifestBatch(**batch) for batch in data["batches"]]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if covered > size or (batches[-1].end if batches else 0) != covered:
+            return None
+        if data.get("prefix_sha1") != _prefix_digest(csv_path, covered).hex():
+            return None
+        return batches, urls
+
+
+def summarize(batches: Sequence[ManifestBatch], urls: int) -> DatasetStats:
+    firsts = [b.first for b in batches if b.first]
+    lasts = [b.last for b in batches if b.last]
+    return DatasetStats(
+        sum(b.rows for b in batches), min(firsts, default=None), max(lasts, default=None), urls
+    )
+
+
+def _scan_batch(csv_path: Path, start: int, end: int) -> ManifestBatch:
+    """`start`..`end` aralığındaki satırları sayar (başlık hariç); tarih aralığı ve URL'ler."""
+    rows = 0
+    dates: list[str] = []
+    urls: set[str] = set()
+    with csv_path.open("rb") as fh:
+        header = next(csv.reader([fh.readline().decode("utf-8")], delimiter=";"), HEADER)
+        url_col = header.index("URL") if "URL" in header else None
+        date_col = header.index("Tarih") if "Tarih" in header else None
+        if start > 0:
+            fh.seek(start)
+        for _, row in _iter_rows(fh):
+            if not row:
+                continue
+            rows += 1
+            if url_col is not None and url_col < len(row):
+                urls.add(row[url_col])
+            if date_col is not None and date_col < len(row) and row[date_col]:
+                dates.append(row[date_col])
+    return ManifestBatch(
+        start, end, rows, min(dates, default=None), max(dates, default=None), len(urls)
+    )
 
 
 class DatasetStore:
     """Standart şemadaki CSV veri setini yönetir.
 
     - `load()`: geçmiş kayıtları okur
-    - `last_price_by_url()`: her URL için son bilinen fiyatı O(n) döndürür
-    - `append()`: yeni kayıtları dosyaya ekler
+    - `last_price_by_url()`: her URL için son bilinen fiyatı ikili indeksten O(#URL) döndürür
+    - `append()`: yeni kayıtları dosyaya ekler, indeksi ve manifest'i atomik olarak günceller
+    - `row_count()` / `stats()`: manifest'ten, CSV taranmadan
+
+    `append(..., flush=False)` indeksi ve manifest'i yalnızca bellekte günceller; çalıştırma
+    sonunda tek `flush()` diske yazar (parti başına ikisini de baştan yazmamak için). Arada
+    ölen bir çalıştırmada ikisi de CSV'nin gerisinde kalır ve sonraki okumada kuyruktan
+    tamamlanır.
     """
 
     def __init__(self, path: Path) -> None:
         self.path = path
+        self.index = PriceIndex(path.with_suffix(".idx"))
+        self.manifest = DatasetManifest(path.with_suffix(".manifest.json"))
+        self._last: dict[str, LastPrice] | None = None
+        self._batches: list[ManifestBatch] | None = None
+        self._urls = 0
+        self._dirty = False
 
     def load(self) -> list[dict[str, str]]:
         if not self.path.exists():
@@ -43,38 +334,289 @@ class DatasetStore:
         with self.path.open(encoding="utf-8", newline="") as fh:
             return list(csv.DictReader(fh, delimiter=";"))
 
+    def last_prices(self) -> dict[str, LastPrice]:
+        """URL → son kayıt (Tarih'e göre en güncel; eşitlikte sonraki satır)."""
+        if self._last is None:
+            self._last = self.index.sync(self.path)
+        return self._last
+
     def last_price_by_url(self) -> dict[str, float]:
         """Her URL için son kayıttaki fiyatı döndürür (Tarih'e göre en güncel)."""
-        latest: dict[str, tuple[str, float]] = {}
-        for row in self.load():
-            url = row.get("URL", "")
-            if not url:
-                continue
-            try:
-                price = float(row.get("Fiyat", "0"))
-            except ValueError:
-                continue
-            scraped_at = row.get("Tarih", "")
-            if url not in latest or scraped_at >= latest[url][0]:
-                latest[url] = (scraped_at, price)
-        return {url: price for url, (_, price) in latest.items()}
+        return {url: entry.price for url, entry in self.last_prices().items()}
 
-    def append(self, products: list[Product]) -> int:
+    def batches(self) -> list[ManifestBatch]:
+        """Append partileri (bayt aralığı, kayıt sayısı, tarih aralığı)."""
+        if self._batches is None:
+            self._batches, self._urls = self.manifest.sync(
+                self.path, lambda: len(self.last_prices())
+            )
+        return self._batches
+
+    def append(self, products: Sequence[Product | ProductRecord], *, flush: bool = True) -> int:
         if not products:
             return 0
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        exists = self.path.exists()
-        with self.path.open(mode="a", encoding="utf-8", newline="") as fh:
-            writer = csv.writer(fh, delimiter=";")
-            if not exists:
-                writer.writerow(HEADER)
-            for product in products:
-                writer.writerow(product.to_csv_row())
+        last = self.last_prices()
+        batches = self.batches()
+        rows = io.StringIO(newline="")
+        writer = csv.writer(rows, delimiter=";")
+        ends: list[int] = []
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            writer.writerow(HEADER)
+        header_end = rows.tell()
+        csv_rows = [product.to_csv_row() for product in products]
+        for row in csv_rows:
+            writer.writerow(row)
+            ends.append(rows.tell())
+        text = rows.getvalue()
+        with self.path.open(mode="ab") as fh:
+            base = fh.tell()
+            data = text.encode("utf-8")
+            fh.write(data)
+        # StringIO konumları karakter; ASCII dışı karakterler için bayt ofsetine çevrilir
+        offsets = _byte_offsets(text, [header_end, *ends[:-1]], base)
+        dates = [str(row[DATE_COLUMN]) for row in csv_rows]
+        for product, scraped_at, offset in zip(products, dates, offsets, strict=True):
+            entry = last.get(product.url)
+            if entry is None or scraped_at >= entry.scraped_at:
+                last[product.url] = LastPrice(float(product.price), scraped_at, offset)
+        batches.append(
+            ManifestBatch(
+                base,
+                base + len(data),
+                len(csv_rows),
+                min(dates),
+                max(dates),
+                len({product.url for product in products}),
+            )
+        )
+        self._urls = len(last)
+        self._dirty = True
+        if flush:
+            self.flush()
         logger.info("Veri setine %s yeni kayıt eklendi: %s", len(products), self.path)
         return len(products)
 
+    def flush(self) -> None:
+        """Bellekteki son fiyat indeksini ve manifest'i (değiştiyse) atomik olarak yazar."""
+        if self._dirty and self._last is not None and self._batches is not None:
+            self.index.save(self.path, self._last)
+            self.manifest.save(self.path, self._batches, self._urls)
+            self._dirty = False
+
     def row_count(self) -> int:
+        return sum(batch.rows for batch in self.batches())
+
+    def stats(self) -> DatasetStats:
+        return summarize(self.batches(), self._urls)
+
+
+def open_dataset(
+    settings: Settings,
+) -> DatasetStore | ParquetDatasetStore | SqliteDatasetStore:
+    """`BOOKDATA_STORAGE_BACKEND`'e göre veri deposunu açar (csv | parquet | sqlite)."""
+    if settings.storage_backend == "csv":
+        return DatasetStore(settings.dataset_file)
+    if settings.storage_backend == "parquet":
+        from bookdata.adapters.parquet import ParquetDatasetStore
+
+        return ParquetDatasetStore(settings.dataset_dir)
+    if settings.storage_backend == "sqlite":
+        from bookdata.adapters.sqlite import SqliteDatasetStore
+
+        return SqliteDatasetStore(settings.database_file)
+    raise ValueError(f"Bilinmeyen depolama: {settings.storage_backend} (csv | parquet | sqlite)")
+
+
+class CategoryFingerprints:
+    """Kategori başına ilk sayfa parmak izi ve son tam taramanın ham ürünleri.
+
+    İlk sayfanın parmak izi geçen çalıştırmayla aynıysa kategori değişmemiş sayılır ve
+    sayfalama yerine kayıtlı ürünler kullanılır. Her kategori en geç `refresh_every`
+    çalıştırmada bir baştan sona taranır.
+
+    Dizin düzeni: `index.json` (parmak izleri) + kategori başına bir ürün dosyası. Ürünler
+    yalnızca yeniden kullanılacakları an okunur; katalog belleğe topluca alınmaz. Bu
+    çalıştırmada görülmeyen kategoriler `save()` sırasında silinir.
+    """
+
+    def __init__(self, directory: Path, refresh_every: int) -> None:
+        self.directory = directory
+        self.refresh_every = refresh_every
+        data = self._read()
+        self.run = int(data.get("run", 0)) + 1
+        self._previous: dict[str, dict] = data.get("categories", {})
+        self._current: dict[str, dict] = {}
+        self.skipped = 0
+
+    @property
+    def index_file(self) -> Path:
+        return self.directory / "index.json"
+
+    def _items_file(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+    def _read(self) -> dict:
+        if not self.index_file.exists():
+            return {}
+        try:
+            return json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            logger.warning(
+                "Parmak izi dizini okunamadı, tam tarama yapılacak (%s): %s", self.directory, exc
+            )
+            return {}
+
+    def reusable(self, url: str, fingerprint: str) -> list[dict] | None:
+        """İlk sayfa değişmemişse ve tam tarama zamanı gelmemişse geçen seferki ürünler."""
+        entry = self._previous.get(url)
+        if entry is None or entry.get("fingerprint") != fingerprint:
+            return None
+        if self.run - int(entry.get("crawled_run", 0)) >= self.refresh_every:
+            return None
+        try:
+            items = json.loads(self._items_file(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        self._current[url] = entry
+        self.skipped += 1
+        return items
+
+    def record(self, url: str, fingerprint: str, items: list[dict]) -> None:
+        """Tam taranmış kategorinin parmak izini kaydeder, ürünlerini hemen diske yazar."""
+        _write_atomic(self._items_file(url), json.dumps(items, ensure_ascii=False))
+        self._current[url] = {"fingerprint": fingerprint, "crawled_run": self.run}
+
+    def save(self) -> None:
+        """İndeksi atomik olarak yazar, görülmeyen kategorilerin dosyalarını siler."""
+        for url in self._previous.keys() - self._current.keys():
+            self._items_file(url).unlink(missing_ok=True)
+        payload = {"run": self.run, "categories": self._current}
+        _write_atomic(self.index_file, json.dumps(payload, ensure_ascii=False))
+
+
+class CompletedCategory(NamedTuple):
+    """Günlükteki bir kategori: ürünleri ve o kategoride görülen ek kategori üyelikleri."""
+
+    products: list[ProductRecord]
+    memberships: dict[str, set[str]]
+
+
+class CheckpointJournal:
+    """Tamamlanan kategorileri ve standardize ürünlerini satır satır kaydeden günlük (JSONL).
+
+    Her kategori bittiğinde bir satır eklenir ve diske zorlanır (fsync); çalıştırma ortada
+    ölse bile (OOM, CI zaman aşımı, ban) biten kategoriler kaybolmaz. `--resume` ile
+    başlayan çalıştırma bu kategorileri tekrar taramaz, ürünlerini ve kategori üyeliklerini
+    (`MembershipTable`'a gidecek kopyalar) günlükten alır. Başarılı
+    çalıştırmanın sonunda günlük silinir. Yarım yazılmış son satır yok sayılır.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, CompletedCategory]:
+        """Kategori URL'si → ürünleri ve üyelikleri (diskten geldiği için doğrulanarak)."""
         if not self.path.exists():
-            return 0
+            return {}
+        completed: dict[str, CompletedCategory] = {}
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                    products = [Product.model_validate(p).to_record() for p in entry["products"]]
+                    memberships = {
+                        str(url): {str(c) for c in categories}
+                        for url, categories in entry.get("memberships", {}).items()
+                    }
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    logger.warning("Checkpoint satırı okunamadı, atlandı: %s", self.path)
+                    continue
+                completed[entry["category"]] = CompletedCategory(products, memberships)
+        return completed
+
+    def complete(
+        self,
+        url: str,
+        products: list[ProductRecord],
+        memberships: dict[str, set[str]] | None = None,
+    ) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "category": url,
+            "products": [{**p._asdict(), "scraped_at": p.scraped_at.isoformat()} for p in products],
+            "memberships": {u: sorted(c) for u, c in (memberships or {}).items()},
+        }
+        with self.path.open(mode="a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+class MembershipTable:
+    """Ürünlerin veri setindeki kategorisi dışında listelendiği kategoriler (`URL;Kategori`).
+
+    Kategoriler arası kopyalar standardizasyonda elenir; bu tablo son çalıştırmada hangi
+    URL'nin başka hangi kategorilerde görüldüğünü saklar. Her çalıştırmada atomik olarak
+    yeniden yazılır: önceki çalıştırmanın tablosu birikmez, yerine geçer; satırlar URL'ye
+    göre sıralıdır. Dosya geçici CI makinesinde kalmasın diye `bookdata publish` veri
+    setiyle aynı Kaggle sürümüne yükler.
+    """
+
+    COLUMNS = ("URL", "Kategori")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> dict[str, set[str]]:
+        if not self.path.exists():
+            return {}
+        memberships: dict[str, set[str]] = {}
         with self.path.open(encoding="utf-8", newline="") as fh:
-            return sum(1 for _ in fh) - 1
+            for row in csv.DictReader(fh, delimiter=";"):
+                memberships.setdefault(row["URL"], set()).add(row["Kategori"])
+        return memberships
+
+    def write(self, memberships: dict[str, set[str]]) -> int:
+        """Tabloyu yazar, satır sayısını döndürür."""
+        buffer = io.StringIO(newline="")
+        writer = csv.writer(buffer, delimiter=";")
+        writer.writerow(self.COLUMNS)
+        rows = [(url, c) for url in sorted(memberships) for c in sorted(memberships[url])]
+        writer.writerows(rows)
+        _write_atomic(self.path, buffer.getvalue())
+        return len(rows)
+
+
+def write_dataset_csv(path: Path, rows: Sequence[dict[str, str]]) -> None:
+    """Metin değerli satırları `DatasetStore` biçiminde (`;`, aynı başlık) atomik yazar."""
+    buffer = io.StringIO(newline="")
+    writer = csv.writer(buffer, delimiter=";")
+    writer.writerow(HEADER)
+    writer.writerows([row[name] for name in HEADER] for row in rows)
+    _write_atomic(path, buffer.getvalue())
+
+
+def _byte_offsets(text: str, char_positions: list[int], base: int) -> list[int]:
+    if text.isascii():
+        return [base + position for position in char_positions]
+    offsets: list[int] = []
+    consumed_chars = consumed_bytes = 0
+    for position in char_positions:
+        consumed_bytes += len(text[consumed_chars:position].encode("utf-8"))
+        consumed_chars = position
+        offsets.append(base + consumed_bytes)
+    return offsets
+
+
+def _write_atomic(path: Path, data: str | bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    if isinstance(data, bytes):
+        tmp.write_bytes(data)
+    else:
+        tmp.write_text(data, encoding="utf-8", newline="")
+    os.replace(tmp, path)
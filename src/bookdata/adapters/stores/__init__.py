@@ -1,5 +1,5 @@
-from bookdata.adapters.stores.base import StorePort
+from bookdata.adapters.stores.base import Page, StorePort
 from bookdata.adapters.stores.bkm import BkmKitapAdapter
 from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
 
-__all__ = ["StorePort", "BkmKitapAdapter", "KitapYurduAdapter"]
+__all__ = ["Page", "StorePort", "BkmKitapAdapter", "KitapYurduAdapter"]
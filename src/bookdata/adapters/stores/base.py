@@ -6,23 +6,55 @@ Adapter'lar sadece siteye özel olan işleri yapar:
 - Sayfa içinden ham ürün verilerini çıkarmak
 
 Veri temizleme (fiyat, URL, kopya) bağımsız bir standardizasyon aşamasında yapılır.
+
+Sayfalar ham bayt (`Page`) olarak akar; ayrıştırma `extract` ile yapılır. Ayarlarda
+`parse_workers > 0` ise HTML ayrıştırma event loop'u kilitlemesin diye bir
+`ProcessPoolExecutor` işçisinde çalışır ve sınır ötesine yalnızca ürün dict'leri döner.
+Liste sayfalarında yalnızca adapter'ın `page_regions` ile bildirdiği bölgeler kurulur.
+JSON-LD ham baytlardan okunur; sayfadaki her kartı (`card_class`) kapsıyorsa DOM hiç
+kurulmaz.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-
-from bs4 import BeautifulSoup
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import cache, cached_property
+from typing import TYPE_CHECKING
 
 from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.adapters.parsers import Document, make_document
 from bookdata.config import Settings
 from bookdata.models import Category
 
+if TYPE_CHECKING:
+    from bookdata.pipeline.filter import IgnoreRules
+
 logger = logging.getLogger(__name__)
 
 
+@cache
+def card_pattern(card_class: str) -> re.Pattern[bytes]:
+    """`card_class` sınıflı elemanları DOM kurmadan bulur (`x-title` gibi alt sınıflar hariç)."""
+    return re.compile(
+        rb"""class=["'](?:[^"']*\s)?""" + re.escape(card_class.encode()) + rb"""["'\s]"""
+    )
+
+
+@dataclass(frozen=True)
+class Page:
+    """Çekilmiş tek bir sayfa: URL ve ham yanıt gövdesi."""
+
+    url: str
+    content: bytes
+
+
 class StorePort(ABC):
     """Bir kitap sitesinin web arayüzünü modelleyen soyut port.
 
@@ -35,47 +67,182 @@ class StorePort(ABC):
     display_name: str
     site_url: str
     domain: str = ""
-
-    def __init__(self, http: AsyncHTTPClient, settings: Settings) -> None:
+    # Liste sayfasında ürün çıkarmak için gereken bölgeler (`tag`, `tag.class`, `tag[attr=v]`)
+    page_regions: tuple[str, ...] = ()
+    # Ürün kartının CSS sınıfı; JSON-LD'nin sayfayı kapsayıp kapsamadığını saymak için
+    card_class: str = ""
+
+    def __init__(
+        self, http: AsyncHTTPClient, settings: Settings, executor: Executor | None = None
+    ) -> None:
         self.http = http
         self.settings = settings
+        self.executor = executor
         self._fetch_count = 0
         self._fail_count = 0
+        self._wasted_count = 0
+
+    @cached_property
+    def ignore_rules(self) -> IgnoreRules:
+        from bookdata.pipeline.filter import compile_rules
+
+        return compile_rules(tuple(self.settings.load_ignore_patterns()))
 
-    async def get_soup(self, url: str) -> BeautifulSoup:
+    def keep_category(self, name: str, url: str) -> bool:
+        """Keşif sırasında: ignore kuralına uyan kategori (ve alt ağacı) hiç eklenmez."""
+        return not self.ignore_rules.ignored(name, url)
+
+    async def fetch_page(self, url: str) -> Page:
         self._fetch_count += 1
         try:
             response = await self.http.get(url)
-            return BeautifulSoup(response.content, "html.parser")
         except Exception as exc:  # noqa: BLE001 — tek kategori hatası pipeline'ı durdurmamalı
             self._fail_count += 1
             logger.warning("Sayfa alınamadı (%s): %s", self.store, exc)
             raise
+        return Page(url=url, content=response.content)
+
+    async def fetch_pages(
+        self, urls: Sequence[str], *, ordered: bool | None = None
+    ) -> AsyncIterator[Page]:
+        """URL'leri eşzamanlı çeker; host sınırlarını HTTP zamanlayıcısı uygular.
+
+        Sayfalar tamamlandıkça (`ordered` ise URL sırasıyla) üretilir. Tüketici erken
+        durursa ya da bir sayfa hata verirse bekleyen istekler iptal edilir.
+        """
+        if ordered is None:
+            ordered = self.settings.ordered_pages
+        tasks = [asyncio.create_task(self.fetch_page(url)) for url in urls]
+        try:
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def prefetch_pages(
+        self, urls: Iterable[str], has_content: Callable[[Page], bool], window: int
+    ) -> AsyncIterator[Page]:
+        """Sayısı bilinmeyen sayfaları sırayla, `window` sayfa önden çekerek üretir.
+
+        `has_content` yanlış dönen ilk sayfada (boş sayfa) durulur; o sayfa üretilmez.
+        Pencere ilk sayfa tüketilince açılır: tek sayfalık ya da ilk sayfadan sonra
+        bırakılan (ör. değişmemiş) kategoriler boşa istek üretmez. Durulduğunda önden
+        istenmiş sayfalar iptal edilir ve boşa giden istek olarak sayılır.
+        """
+        pending: deque[asyncio.Task[Page]] = deque()
+        remaining = iter(urls)
+
+        def fill(size: int) -> None:
+            while len(pending) < size:
+                url = next(remaining, None)
+                if url is None:
+                    return
+                pending.append(asyncio.create_task(self.fetch_page(url)))
+
+        try:
+            fill(1)
+            while pending:
+                page = await pending.popleft()
+                if not has_content(page):
+                    break
+                yield page
+                fill(max(1, window))
+        finally:
+            self._wasted_count += len(pending)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def get_soup(self, url: str) -> Document:
+        return self.make_soup((await self.fetch_page(url)).content)
+
+    def make_soup(self, content: bytes, regions: Sequence[str] = ()) -> Document:
+        """Ayarlardaki backend ile (`html.parser`/`lxml`/`selectolax`) belge kurar.
+
+        `regions` verilirse (ve `partial_parse` açıksa) yalnızca o bölgeler kurulur.
+        """
+        if not self.settings.partial_parse:
+            regions = ()
+        return make_document(content, self.settings.html_parser, regions)
 
     @abstractmethod
     async def fetch_categories(self) -> list[Category]:
         """Sitedeki tüm kitap kategorilerini döndürür."""
 
     @abstractmethod
-    def iter_pages(self, category: Category) -> AsyncIterator[BeautifulSoup]:
-        """Kategoriye ait tüm sayfa HTML'lerini (sayfalama dahil) üretir."""
+    def iter_pages(self, category: Category) -> AsyncIterator[Page]:
+        """Kategoriye ait tüm sayfaları (sayfalama dahil) ham bayt olarak üretir."""
 
     @abstractmethod
-    def parse_dom_products(self, soup: BeautifulSoup, category: Category) -> list[dict]:
+    def parse_dom_products(self, soup: Document, category: Category) -> list[dict]:
         """Sayfadan DOM selectors ile ham ürün dict'leri çıkarır."""
 
-    def parse_products(self, soup: BeautifulSoup, category: Category) -> list[dict]:
+    def parse_products(self, soup: Document, category: Category) -> list[dict]:
         """DOM çıktısını JSON-LD verisiyle zenginleştirir (structured data first)."""
-        from bookdata.pipeline.extract import merge_products, products_from_json_ld
+        from bookdata.pipeline.extract import products_from_json_ld
 
         dom = self.parse_dom_products(soup, category)
-        ld = products_from_json_ld(soup, category.name)
+        return self._merge_json_ld(dom, products_from_json_ld(soup, category.name))
+
+    def _merge_json_ld(self, dom: list[dict], ld: list[dict]) -> list[dict]:
+        from bookdata.pipeline.extract import merge_products
+
         if not ld:
             return dom
         merged = merge_products(dom, ld)
         logger.info("JSON-LD zenginleştirmesi (%s): %s DOM + %s LD", self.store, len(dom), len(ld))
         return merged
 
+    def count_cards(self, content: bytes) -> int:
+        """Ham sayfadaki ürün kartı sayısı (DOM kurmadan)."""
+        if not self.card_class:
+            return 0
+        return len(card_pattern(self.card_class).findall(content))
+
+    def extract_page(self, content: bytes, category: Category) -> list[dict]:
+        """Ham sayfadan ürünleri çıkarır (senkron; süreç havuzu işçisinde de çalışır).
+
+        JSON-LD ham baytlardan okunur; kart bölgeleri ayrıştırılıp JSON-LD ile zenginleştirilir
+        (`parse_products` ile aynı çıktı). Opsiyonel `ld_fast_path` açıksa ve kart başına tam
+        bir JSON-LD kaydı varsa DOM atlanır; kayıtlar o zaman yalnızca JSON-LD'dendir.
+        """
+        from bookdata.pipeline.extract import products_from_ld_bytes
+
+        ld = products_from_ld_bytes(content, category.name)
+        if self.settings.ld_fast_path and ld and len(ld) == self.count_cards(content):
+            logger.debug("JSON-LD tüm kartları kapsıyor (%s): DOM atlandı", self.store)
+            return ld
+        dom = self.parse_dom_products(self.make_soup(content, self.page_regions), category)
+        return self._merge_json_ld(dom, ld)
+
+    async def extract(self, page: Page, category: Category) -> list[dict]:
+        """Sayfayı ayrıştırır; süreç havuzu varsa iş event loop dışında yapılır."""
+        if self.executor is None:
+            return self.extract_page(page.content, category)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, _extract_in_worker, type(self), self.settings, page.content, category
+        )
+
     @property
     def stats(self) -> dict[str, int]:
-        return {"fetch": self._fetch_count, "fail": self._fail_count}
+        return {"fetch": self._fetch_count, "fail": self._fail_count, "wasted": self._wasted_count}
+
+
+_worker_adapters: dict[type[StorePort], StorePort] = {}
+
+
+def _extract_in_worker(
+    adapter_cls: type[StorePort], settings: Settings, content: bytes, category: Category
+) -> list[dict]:
+    """Süreç havuzu işçisi: adapter'ı işçi başına bir kez kurar, sadece dict'leri döndürür."""
+    adapter = _worker_adapters.get(adapter_cls)
+    if adapter is None:
+        adapter = _worker_adapters[adapter_cls] = adapter_cls(None, settings)  # type: ignore[arg-type]
+    return adapter.extract_page(content, category)
@@ -3,7 +3,8 @@
 - Kategoriler: ana menüdeki (`#header-main`) kategori linkleri
 - Sayfalama: sunucu sayfalama linki (`pg=`) varsa takip edilir; yoksa tek sayfa çekilir.
   (BKM sayfalama şu an JS tarafında çalıştığından, algılanamayan durumda sayfa-1 verisi
-  alınır ve bu durum loga yazılır.)
+  alınır ve bu durum loga yazılır.) Son sayfa ilk sayfanın baytlarından (DOM kurmadan)
+  okunduğu için kalan sayfalar eşzamanlı istenir.
 - Ürün kartı: `div.product-item`
 """
 
@@ -12,17 +13,37 @@ from __future__ import annotations
 import re
 from collections.abc import AsyncIterator
 
-from bs4 import BeautifulSoup
-
-from bookdata.adapters.stores.base import StorePort
+from bookdata.adapters.extraction import ExtractionPlan, Field
+from bookdata.adapters.parsers import Document
+from bookdata.adapters.stores.base import Page, StorePort
 from bookdata.models import Category
 
+# `div.pagination` açılışı (`pagination-x` gibi alt sınıflar hariç) ve iç içe div sınırları
+_PAGINATION = re.compile(
+    rb"""<div\b[^>]*\bclass=["'](?:[^"']*\s)?pagination["'\s][^>]*>""", re.IGNORECASE
+)
+_DIV_TAG = re.compile(rb"<(/?)div\b", re.IGNORECASE)
+_PG_LINK = re.compile(rb"""href=["'][^"']*?pg=(\d+)""", re.IGNORECASE)
+
 
 class BkmKitapAdapter(StorePort):
     store = "bkm"
     display_name = "BKM Kitap"
     site_url = "https://www.bkmkitap.com"
     domain = "www.bkmkitap.com"
+    page_regions = ("div.product-item",)
+    card_class = "product-item"
+    plan = ExtractionPlan(
+        "div.product-item",
+        [
+            Field("title", tag="a", cls="product-title"),
+            Field("url", tag="a", cls="product-title", attr="href"),
+            Field("price", tag="span", cls="product-price"),
+            Field("author", tag="a", cls="model-title"),
+            Field("publisher", tag="a", cls="brand-title"),
+            Field("image_url", tag="img", attr="data-src"),
+        ],
+    )
 
     async def fetch_categories(self) -> list[Category]:
         soup = await self.get_soup(f"{self.site_url}/kategori-listesi")
@@ -36,51 +57,57 @@ class BkmKitapAdapter(StorePort):
                 continue
             seen.add(href)
             title = link.get("title") or link.get_text(strip=True)
+            if not self.keep_category(title, href):
+                continue
             categories.append(Category(name=title, url=href, parent=None))
         return categories
 
-    async def iter_pages(self, category: Category) -> AsyncIterator[BeautifulSoup]:
+    async def iter_pages(self, category: Category) -> AsyncIterator[Page]:
         url = category.url
-        soup = await self.get_soup(url)
-        yield soup
+        first = await self.fetch_page(url)
+        yield first
 
-        last_page = self._last_pg_link(soup)
+        last_page = self._last_pg_link(first.content)
         if last_page and last_page > 1:
-            for page in range(2, min(last_page, self.settings.per_category_max_pages) + 1):
-                sep = "&" if "?" in url else "?"
-                yield await self.get_soup(f"{url}{sep}pg={page}")
+            sep = "&" if "?" in url else "?"
+            last = min(last_page, self.settings.per_category_max_pages)
+            async for page in self.fetch_pages([f"{url}{sep}pg={n}" for n in range(2, last + 1)]):
+                yield page
 
     @staticmethod
-    def _last_pg_link(soup: BeautifulSoup) -> int:
-        pages = []
-        for a in soup.select("div.pagination a[href*='pg=']"):
-            match = re.search(r"pg=(\d+)", a.get("href", ""))
-            if match:
-                pages.append(int(match.group(1)))
-        return max(pages, default=0)
+    def _last_pg_link(content: bytes) -> int:
+        """`div.pagination` içindeki en büyük `pg=` numarası; sayfa ikinci kez ayrıştırılmaz.
 
-    def parse_dom_products(self, soup: BeautifulSoup, category: Category) -> list[dict]:
-        raw: list[dict] = []
-        for item in soup.select("div.product-item"):
-            title = item.select_one("a.product-title")
-            price = item.select_one("span.product-price")
-            author = item.select_one("a.model-title")
-            publisher = item.select_one("a.brand-title")
-            img = item.select_one("img[data-src]")
+        Kapsayıcının sonu iç içe div'ler sayılarak bulunur; birden çok sayfalama bloğu
+        (üst/alt) varsa hepsine bakılır.
+        """
+        pages = [0]
+        for match in _PAGINATION.finditer(content):
+            depth, end = 1, len(content)
+            for tag in _DIV_TAG.finditer(content, match.end()):
+                depth += -1 if tag.group(1) else 1
+                if depth == 0:
+                    end = tag.start()
+                    break
+            pages.extend(int(n) for n in _PG_LINK.findall(content, match.end(), end))
+        return max(pages)
 
-            if not title or not price:
+    def parse_dom_products(self, soup: Document, category: Category) -> list[dict]:
+        raw: list[dict] = []
+        for card in self.plan.extract(soup):
+            if card["title"] is None or card["price"] is None:
                 continue
 
-            url = title.get("href", "")
+            url = card["url"] or ""
             raw.append(
                 {
-                    "title": title.get_text(strip=True),
-                    "author": author.get_text(strip=True) if author else "",
-                    "publisher": publisher.get_text(strip=True) if publisher else "",
+                    "title": card["title"],
+                    "author": card["author"] or "",
+                    "publisher": card["publisher"] or "",
                     "category": category.name,
-                    "price_text": price.get_text(strip=True).replace("TL", "").strip(),
+                    "price_text": card["price"].replace("TL", "").strip(),
                     "url": url if url.startswith("http") else f"{self.site_url}{url}",
-                    "image_url": img.get("data-src") if img else None,
+                    "image_url": card["image_url"],
                 }
             )
         return raw
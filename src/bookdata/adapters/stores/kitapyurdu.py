@@ -1,7 +1,8 @@
 """Kitapyurdu adapter'ı.
 
 - Kategoriler: ana sayfa menüsündeki `/kategori/kitap-{slug}/{id}.html` linkleri
-- Sayfalama: `route=product/list&category_id={id}&limit=100&page={n}` (sayfa boşalana dek)
+- Sayfalama: `route=product/list&category_id={id}&limit=100&page={n}` (sayfa boşalana dek);
+  sayfa sayısı bilinmediğinden `prefetch_window` sayfa önden istenir
 - Ürün kartı: `div.ky-product`
 """
 
@@ -10,12 +11,13 @@ from __future__ import annotations
 import re
 from collections.abc import AsyncIterator
 
-from bs4 import BeautifulSoup
-
-from bookdata.adapters.stores.base import StorePort
+from bookdata.adapters.extraction import ExtractionPlan, Field
+from bookdata.adapters.parsers import Document
+from bookdata.adapters.stores.base import Page, StorePort, card_pattern
 from bookdata.models import Category
 
 _PRODUCT_CARD = "ky-product"
+_CARD_CLASS = card_pattern(_PRODUCT_CARD)
 
 
 class KitapYurduAdapter(StorePort):
@@ -23,6 +25,19 @@ class KitapYurduAdapter(StorePort):
     display_name = "Kitap Yurdu"
     site_url = "https://www.kitapyurdu.com"
     domain = "www.kitapyurdu.com"
+    page_regions = (f"div.{_PRODUCT_CARD}",)
+    card_class = _PRODUCT_CARD
+    plan = ExtractionPlan(
+        f"div.{_PRODUCT_CARD}",
+        [
+            Field("title", cls="ky-product-title"),
+            Field("price", cls="ky-product-sell-price"),
+            Field("url", tag="a", cls="ky-product-cover", attr="href"),
+            Field("author", tag="a", within="ky-product-author"),
+            Field("publisher", tag="a", within="ky-product-publisher"),
+            Field("image_url", tag="img", within="ky-product-cover", attr="src"),
+        ],
+    )
 
     async def fetch_categories(self) -> list[Category]:
         soup = await self.get_soup(f"{self.site_url}/")
@@ -34,15 +49,12 @@ class KitapYurduAdapter(StorePort):
             if not category_id or href in seen:
                 continue
             seen.add(href)
-            categories.append(
-                Category(
-                    name=link.get_text(strip=True) or href.rsplit("/", 1)[-1].split(".")[0],
-                    url=href,
-                )
-            )
+            name = link.get_text(strip=True) or href.rsplit("/", 1)[-1].split(".")[0]
+            if self.keep_category(name, href):
+                categories.append(Category(name=name, url=href))
         return categories
 
-    async def iter_pages(self, category: Category) -> AsyncIterator[BeautifulSoup]:
+    async def iter_pages(self, category: Category) -> AsyncIterator[Page]:
         category_id = re.search(r"/(\d+)\.html$", category.url)
         if not category_id:
             return
@@ -50,36 +62,32 @@ class KitapYurduAdapter(StorePort):
             f"{self.site_url}/index.php?route=product/list"
             f"&category_id={category_id.group(1)}&limit=100"
         )
-        for page in range(1, self.settings.per_category_max_pages + 1):
-            url = f"{base}&page={page}"
-            soup = await self.get_soup(url)
-            if not soup.select(f".{_PRODUCT_CARD}"):
-                break
-            yield soup
+        urls = (f"{base}&page={n}" for n in range(1, self.settings.per_category_max_pages + 1))
+        window = self.settings.prefetch_window
+        async for page in self.prefetch_pages(urls, self.has_products, window):
+            yield page
 
-    def parse_dom_products(self, soup: BeautifulSoup, category: Category) -> list[dict]:
-        raw: list[dict] = []
-        for card in soup.select(f"div.{_PRODUCT_CARD}"):
-            title = card.select_one(".ky-product-title")
-            price = card.select_one(".ky-product-sell-price")
-            cover = card.select_one("a.ky-product-cover")
-            author = card.select_one(".ky-product-author a")
-            publisher = card.select_one(".ky-product-publisher a")
-            img = cover.find("img") if cover else None
+    @staticmethod
+    def has_products(page: Page) -> bool:
+        """Sayfada ürün kartı var mı? Boş sayfa sayfalamanın sonudur."""
+        return _CARD_CLASS.search(page.content) is not None
 
-            if not title or not price or not cover:
+    def parse_dom_products(self, soup: Document, category: Category) -> list[dict]:
+        raw: list[dict] = []
+        for card in self.plan.extract(soup):
+            if card["title"] is None or card["price"] is None or card["url"] is None:
                 continue
 
-            url = re.sub(r"[\?&].*$", "", cover.get("href", ""))
+            url = re.sub(r"[\?&].*$", "", card["url"])
             raw.append(
                 {
-                    "title": title.get_text(strip=True),
-                    "author": author.get_text(strip=True) if author else "",
-                    "publisher": publisher.get_text(strip=True) if publisher else "",
+                    "title": card["title"],
+                    "author": card["author"] or "",
+                    "publisher": card["publisher"] or "",
                     "category": category.name,
-                    "price_text": price.get_text(strip=True).replace("TL", "").strip(),
+                    "price_text": card["price"].replace("TL", "").strip(),
                     "url": url if url.startswith("http") else f"{self.site_url}{url}",
-                    "image_url": img.get("src") if img else None,
+                    "image_url": card["image_url"],
                 }
             )
         return raw
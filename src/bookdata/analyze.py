@@ -10,10 +10,24 @@ REQUIRED = ["Tarih", "URL", "Fiyat", "Kitap İsmi", "Site", "Kategori"]
 
 
 def load_datasets(data_dir: Path) -> pd.DataFrame:
-    """Data dizinindeki tüm *_Datasets.csv dosyalarını tek DataFrame'de birleştirir."""
+    """Data dizinindeki tüm veri setlerini tek DataFrame'de birleştirir.
+
+    Mağaza başına bir kaynak okunur: Parquet deposu (`*_Datasets/`), yoksa SQLite
+    (`*_Datasets.sqlite`), yoksa CSV. Parquet'te tarih ve fiyat zaten tiplidir,
+    Site/Kategori/Yayınevi kategorik gelir.
+    """
     frames: list[pd.DataFrame] = []
-    for path in sorted(data_dir.glob("*_Datasets.csv")):
-        df = pd.read_csv(path, sep=";", encoding="utf-8", parse_dates=["Tarih"])
+    for path in _dataset_paths(data_dir):
+        if path.is_dir():
+            from bookdata.adapters.parquet import ParquetDatasetStore
+
+            df = ParquetDatasetStore(path).load_frame()
+        elif path.suffix == ".sqlite":
+            from bookdata.adapters.sqlite import SqliteDatasetStore
+
+            df = SqliteDatasetStore(path).load_frame()
+        else:
+            df = pd.read_csv(path, sep=";", encoding="utf-8", parse_dates=["Tarih"])
         missing = [c for c in REQUIRED if c not in df.columns]
         if missing:
             raise ValueError(f"{path.name}: eksik sütunlar {missing}")
@@ -22,6 +36,21 @@ def load_datasets(data_dir: Path) -> pd.DataFrame:
     return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=REQUIRED)
 
 
+_SOURCE_PRIORITY = {"": 0, ".sqlite": 1, ".csv": 2}
+
+
+def _dataset_paths(data_dir: Path) -> list[Path]:
+    """Mağaza (`<store>_Datasets`) başına öncelikli kaynak: Parquet > SQLite > CSV."""
+    chosen: dict[str, tuple[int, Path]] = {}
+    for path in data_dir.glob("*_Datasets*"):
+        stem, suffix = (path.name, "") if path.is_dir() else (path.stem, path.suffix)
+        if not stem.endswith("_Datasets") or suffix not in _SOURCE_PRIORITY:
+            continue
+        candidate = (_SOURCE_PRIORITY[suffix], path)
+        chosen[stem] = min(chosen.get(stem, candidate), candidate)
+    return sorted(path for _, path in chosen.values())
+
+
 def price_changes(df: pd.DataFrame) -> pd.DataFrame:
     """Her URL için son iki kaydı alıp fiyat değişimini hesaplar.
 
@@ -53,7 +82,7 @@ def weekly_trends(df: pd.DataFrame) -> pd.DataFrame:
     """Haftalık ortalama fiyatları site bazında döndürür."""
     data = df.copy()
     data["Hafta"] = data["Tarih"].dt.isocalendar().week.astype(str) + ".Hafta"
-    return data.groupby(["Hafta", "Site"], as_index=False)["Fiyat"].mean()
+    return data.groupby(["Hafta", "Site"], as_index=False, observed=True)["Fiyat"].mean()
 
 
 def summary(df: pd.DataFrame, changes: pd.DataFrame) -> dict[str, float | int]:
@@ -3,7 +3,12 @@
 Kullanım (uv):
     uv run bookdata scrape bkm
     uv run bookdata scrape kitapyurdu
+    uv run bookdata scrape bkm --resume
+    uv run bookdata scrape all
     uv run bookdata publish bkm
+    uv run bookdata export bkm
+    uv run bookdata import-csv bkm
+    uv run bookdata stats
     uv run bookdata categories bkm
     uv run bookdata inspect <url>
 """
@@ -21,7 +26,13 @@ import typer
 
 from bookdata.config import Settings
 from bookdata.logging_setup import get_logger, setup_logging
-from bookdata.pipeline import STORE_REGISTRY, get_store_class, resolve_adapter, run_scrape
+from bookdata.pipeline import (
+    STORE_REGISTRY,
+    get_store_class,
+    resolve_adapter,
+    run_scrape,
+    run_scrape_many,
+)
 
 logger = get_logger(__name__)
 
@@ -37,6 +48,13 @@ def _store_name(value: str) -> str:
     return name
 
 
+def _store_names(value: str) -> list[str]:
+    """`all` → kayıtlı tüm mağazalar; `bkm,KY` gibi virgüllü listeler de kabul edilir."""
+    if value.lower() == "all":
+        return list(STORE_REGISTRY)
+    return list(dict.fromkeys(_store_name(part.strip()) for part in value.split(",")))
+
+
 def _settings(store: str | None = None) -> Settings:
     base = Settings.from_env()
     if store:
@@ -46,17 +64,35 @@ def _settings(store: str | None = None) -> Settings:
 
 @app.command()
 def scrape(
-    store: Annotated[str, typer.Argument(help="bkm veya kitapyurdu (KY/BKM de kabul edilir)")],
+    store: Annotated[
+        str,
+        typer.Argument(help="bkm, kitapyurdu (KY/BKM), virgüllü liste veya tümü için 'all'"),
+    ],
     log_file: Annotated[str | None, typer.Option("--log-file", help="Log dosyası adı")] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Yarım kalan çalıştırmaya checkpoint'ten devam et"),
+    ] = False,
 ) -> None:
-    """Kategori çek → filtrele → ürünleri çek → standardize → fiyat diff → veri setine ekle."""
-    settings = _settings(store)
-    setup_logging(settings.log_dir, settings.log_level, log_file or f"{settings.store}.log")
-    result = asyncio.run(run_scrape(settings))
-    typer.echo(
-        f"{settings.store}: {result.rows_written} yeni kayıt "
-        f"({result.products_scraped} ürün / {result.categories_scraped} kategori)"
-    )
+    """Kategori çek → filtrele → ürünleri çek → standardize → fiyat diff → veri setine ekle.
+
+    Birden çok mağaza tek süreçte, paylaşılan HTTP istemcisiyle eşzamanlı kazınır.
+    """
+    names = _store_names(store)
+    if len(names) == 1:
+        settings = _settings(names[0])
+        setup_logging(settings.log_dir, settings.log_level, log_file or f"{settings.store}.log")
+        results = {settings.store: asyncio.run(run_scrape(settings, resume=resume))}
+    else:
+        settings = _settings()
+        setup_logging(settings.log_dir, settings.log_level, log_file or "all.log")
+        many = asyncio.run(run_scrape_many(settings, names, resume=resume))
+        results = {**many.stores, "toplam": many.combined}
+    for name, result in results.items():
+        typer.echo(
+            f"{name}: {result.rows_written} yeni kayıt "
+            f"({result.products_scraped} ürün / {result.categories_scraped} kategori)"
+        )
 
 
 @app.command()
@@ -88,7 +124,10 @@ def categories(
 def publish(
     store: Annotated[str, typer.Argument(help="bkm veya kitapyurdu")],
 ) -> None:
-    """Veri setini Kaggle'a yükler (BOOKDATA_KAGGLE_DATASET ENV'den okunur)."""
+    """Veri setini (ve varsa kategori üyelik tablosunu) Kaggle'a yükler.
+
+    Veri seti kimliği BOOKDATA_KAGGLE_DATASET ENV'den okunur.
+    """
     settings = _settings(store)
     setup_logging(settings.log_dir, settings.log_level, f"{settings.store}.log")
 
@@ -100,7 +139,53 @@ def publish(
         raise typer.Exit(code=1)
     from datetime import date
 
-    publisher.publish(settings.dataset_file, settings.store, str(date.today()))
+    if settings.storage_backend != "csv":
+        _export_csv(settings)
+    extra = {}
+    if settings.membership_file.exists():
+        extra[settings.membership_file] = f"{settings.store} kategori üyelikleri (son çalıştırma)"
+    publisher.publish(settings.dataset_file, settings.store, str(date.today()), extra)
+
+
+@app.command()
+def export(
+    store: Annotated[str, typer.Argument(help="bkm veya kitapyurdu")],
+) -> None:
+    """Parquet/SQLite veri setini Kaggle'ın beklediği CSV'ye ({store}_Datasets.csv) aktarır."""
+    settings = _settings(store)
+    setup_logging(settings.log_dir, settings.log_level, f"{settings.store}.log")
+    if settings.storage_backend == "csv":
+        typer.echo("BOOKDATA_STORAGE_BACKEND=csv; veri seti zaten CSV.", err=True)
+        raise typer.Exit(code=1)
+    rows = _export_csv(settings)
+    typer.echo(f"{rows} kayıt yazıldı: {settings.dataset_file}")
+
+
+def _export_csv(settings: Settings) -> int:
+    from bookdata.adapters.storage import open_dataset
+
+    return open_dataset(settings).export_csv(settings.dataset_file)
+
+
+@app.command("import-csv")
+def import_csv(
+    store: Annotated[str, typer.Argument(help="bkm veya kitapyurdu")],
+) -> None:
+    """Mevcut {store}_Datasets.csv geçmişini SQLite veritabanına bir kez aktarır."""
+    settings = _settings(store)
+    setup_logging(settings.log_dir, settings.log_level, f"{settings.store}.log")
+
+    from bookdata.adapters.sqlite import SqliteDatasetStore
+
+    if not settings.dataset_file.exists():
+        typer.echo(f"CSV bulunamadı: {settings.dataset_file}", err=True)
+        raise typer.Exit(code=1)
+    database = SqliteDatasetStore(settings.database_file)
+    if database.row_count():
+        typer.echo(f"Veritabanı boş değil, aktarım atlandı: {settings.database_file}", err=True)
+        raise typer.Exit(code=1)
+    rows = database.import_csv(settings.dataset_file)
+    typer.echo(f"{rows} kayıt aktarıldı: {settings.database_file}")
 
 
 @app.command()
@@ -261,6 +346,29 @@ def match(
     typer.echo(f"İnceleme dosyası: {out} ({len(review_df)} satır)")
 
 
+@app.command()
+def stats(
+    store: Annotated[
+        str, typer.Argument(help="bkm, kitapyurdu (KY/BKM), virgüllü liste veya tümü için 'all'")
+    ] = "all",
+) -> None:
+    """Veri setlerinin kayıt sayısı, tarih aralığı ve URL sayısı (CSV'de manifest'ten)."""
+    from bookdata.adapters.storage import DatasetStore, open_dataset
+
+    for name in _store_names(store):
+        settings = _settings(name)
+        dataset = open_dataset(settings)
+        summary = dataset.stats()
+        line = (
+            f"{name}: {summary.rows} kayıt, {summary.urls} URL, "
+            f"{summary.first or '-'} → {summary.last or '-'}"
+        )
+        if isinstance(dataset, DatasetStore) and dataset.path.exists():
+            size_mb = dataset.path.stat().st_size / 1024 / 1024
+            line += f" ({len(dataset.batches())} parti, {size_mb:.1f} MB)"
+        typer.echo(line)
+
+
 @app.command()
 def stores() -> None:
     """Kayıtlı mağaza adapter'larını listeler."""
@@ -18,10 +18,32 @@ class Settings:
     request_timeout: float = 20.0
     retry_attempts: int = 3
     retry_backoff_base: float = 2.0
+    retry_budget_ratio: float = 0.1
+    breaker_failure_threshold: int = 5
+    breaker_reset_seconds: float = 60.0
     min_request_interval: float = 0.2
+    adaptive_rate: bool = True
+    min_interval_floor: float = 0.05
+    max_request_interval: float = 10.0
+    slow_response_seconds: float = 2.0
     respect_robots: bool = False
+    http_cache_dir: Path | None = None
+    http_cache_max_mb: float = 512.0
+    http_mode: str = "live"
+    cassette_file: Path = Path("cassettes/http.jsonl.gz")
+    replay_latency: float = 0.0
 
     per_category_max_pages: int = 50
+    ordered_pages: bool = False
+    prefetch_window: int = 4
+    full_refresh_every: int = 7
+    queue_size: int = 64
+    append_batch_size: int = 1000
+    storage_backend: str = "csv"
+    parse_workers: int = 0
+    html_parser: str = "html.parser"
+    partial_parse: bool = True
+    ld_fast_path: bool = False
     kaggle_dataset: str | None = None
 
     match_threshold: float = 0.95
@@ -40,9 +62,37 @@ class Settings:
             concurrency=int(os.getenv("BOOKDATA_CONCURRENCY", "12")),
             request_timeout=float(os.getenv("BOOKDATA_TIMEOUT", "20")),
             retry_attempts=int(os.getenv("BOOKDATA_RETRY_ATTEMPTS", "3")),
+            retry_budget_ratio=float(os.getenv("BOOKDATA_RETRY_BUDGET", "0.1")),
+            breaker_failure_threshold=int(os.getenv("BOOKDATA_BREAKER_THRESHOLD", "5")),
+            breaker_reset_seconds=float(os.getenv("BOOKDATA_BREAKER_RESET", "60")),
             min_request_interval=float(os.getenv("BOOKDATA_MIN_INTERVAL", "0.2")),
+            adaptive_rate=os.getenv("BOOKDATA_ADAPTIVE_RATE", "true").lower()
+            in {"1", "true", "yes"},
+            min_interval_floor=float(os.getenv("BOOKDATA_MIN_INTERVAL_FLOOR", "0.05")),
+            max_request_interval=float(os.getenv("BOOKDATA_MAX_INTERVAL", "10")),
+            slow_response_seconds=float(os.getenv("BOOKDATA_SLOW_RESPONSE", "2")),
             respect_robots=os.getenv("BOOKDATA_RESPECT_ROBOTS", "").lower() in {"1", "true", "yes"},
+            http_cache_dir=(
+                Path(os.environ["BOOKDATA_HTTP_CACHE_DIR"])
+                if os.getenv("BOOKDATA_HTTP_CACHE_DIR")
+                else None
+            ),
+            http_cache_max_mb=float(os.getenv("BOOKDATA_HTTP_CACHE_MAX_MB", "512")),
+            http_mode=os.getenv("BOOKDATA_HTTP_MODE", "live").lower(),
+            cassette_file=Path(os.getenv("BOOKDATA_CASSETTE", "cassettes/http.jsonl.gz")),
+            replay_latency=float(os.getenv("BOOKDATA_REPLAY_LATENCY", "0")),
             per_category_max_pages=int(os.getenv("BOOKDATA_MAX_PAGES", "50")),
+            ordered_pages=os.getenv("BOOKDATA_ORDERED_PAGES", "").lower() in {"1", "true", "yes"},
+            prefetch_window=int(os.getenv("BOOKDATA_PREFETCH_WINDOW", "4")),
+            full_refresh_every=int(os.getenv("BOOKDATA_FULL_REFRESH_EVERY", "7")),
+            queue_size=int(os.getenv("BOOKDATA_QUEUE_SIZE", "64")),
+            append_batch_size=int(os.getenv("BOOKDATA_APPEND_BATCH", "1000")),
+            storage_backend=os.getenv("BOOKDATA_STORAGE_BACKEND", "csv").lower(),
+            parse_workers=int(os.getenv("BOOKDATA_PARSE_WORKERS", "0")),
+            html_parser=os.getenv("BOOKDATA_HTML_PARSER", "html.parser"),
+            partial_parse=os.getenv("BOOKDATA_PARTIAL_PARSE", "true").lower()
+            in {"1", "true", "yes"},
+            ld_fast_path=os.getenv("BOOKDATA_LD_FAST_PATH", "").lower() in {"1", "true", "yes"},
             kaggle_dataset=os.getenv("BOOKDATA_KAGGLE_DATASET"),
             match_threshold=float(os.getenv("BOOKDATA_MATCH_THRESHOLD", "0.95")),
             review_threshold=float(os.getenv("BOOKDATA_REVIEW_THRESHOLD", "0.75")),
@@ -54,6 +104,26 @@ class Settings:
     def dataset_file(self) -> Path:
         return self.data_dir / f"{self.store}_Datasets.csv"
 
+    @property
+    def dataset_dir(self) -> Path:
+        return self.data_dir / f"{self.store}_Datasets"
+
+    @property
+    def database_file(self) -> Path:
+        return self.data_dir / f"{self.store}_Datasets.sqlite"
+
+    @property
+    def membership_file(self) -> Path:
+        return self.data_dir / f"{self.store}_categories.csv"
+
+    @property
+    def checkpoint_file(self) -> Path:
+        return self.data_dir / f"{self.store}_checkpoint.jsonl"
+
+    @property
+    def fingerprint_dir(self) -> Path:
+        return self.data_dir / f"{self.store}_fingerprints"
+
     def load_ignore_patterns(self) -> list[str]:
         """Git'te commit'li ignore dosyasından (her satır bir desen) kuralları okur."""
         if not self.ignore_file.exists():
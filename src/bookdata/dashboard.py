@@ -69,12 +69,14 @@ def render_dashboard(df: pd.DataFrame) -> str:
     trends = weekly_trends(df)
 
     site_stats = (
-        changes.groupby("Site")
+        changes.groupby("Site", observed=True)
         .agg(Ortalama=("Değişim %", "mean"), Ürün=("URL", "count"))
         .reset_index()
     )
     category_stats = (
-        changes.groupby(["Kategori", "Site"]).agg(Ortalama=("Değişim %", "mean")).reset_index()
+        changes.groupby(["Kategori", "Site"], observed=True)
+        .agg(Ortalama=("Değişim %", "mean"))
+        .reset_index()
     )
 
     top_up = changes.nlargest(10, "Değişim %")
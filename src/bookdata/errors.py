@@ -6,6 +6,7 @@ Retry mantığı hataları körü körüne denemez; her hata türü net bir kate
 - `BlockedResponseError` (403/404/410/451) → tekrar deneme
 - `FetchTimeoutError` / `FetchTransportError` → ağ hataları
 - `RobotsDeniedError` → robots.txt kuralı gereği engelli
+- `CircuitOpenError` → host'un devresi açık; istek ağa çıkmadan hızlıca düşer
 - `ParsingError` → HTML/JSON ayrıştırma başarısız
 """
 
@@ -48,6 +49,10 @@ class RobotsDeniedError(FetchError):
     pass
 
 
+class CircuitOpenError(FetchError):
+    """Host art arda hata verdiği için devre açık; tekrar denenmez."""
+
+
 class ParsingError(Exception):
     """Sayfa içeriği (HTML/JSON) çözümlenemedi."""
 
@@ -1,11 +1,40 @@
-"""Alan modelleri: kategori ve ürün (standart şema)."""
+"""Alan modelleri: kategori ve ürün (standart şema).
+
+`Product` (pydantic) sınırlarda kullanılır: diskten/dışarıdan gelen veri doğrulanırken.
+Pipeline içinde ürünler `ProductRecord` olarak taşınır: tuple tabanlı, doğrulaması
+standardizasyonda toplu yapılmış, aynı alanlara ve `to_csv_row()`'a sahip hafif kayıt.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple
 
 from pydantic import BaseModel, Field
 
+CSV_COLUMNS = [
+    "Kitap İsmi",
+    "Yazar",
+    "Yayınevi",
+    "Kategori",
+    "Fiyat",
+    "URL",
+    "Site",
+    "Tarih",
+    "Resim",
+    "ISBN",
+    "Para Birimi",
+    "Stok Durumu",
+]
+
+
+@lru_cache(maxsize=16)
+def format_timestamp(value: datetime) -> str:
+    """CSV `Tarih` biçimi; bir çalıştırmadaki tüm kayıtlar aynı zamanı paylaştığından
+    biçimlendirme çalıştırma başına bir kez yapılır."""
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
 
 class Category(BaseModel):
     name: str
@@ -31,20 +60,7 @@ class Product(BaseModel):
 
     @property
     def csv_columns(self) -> list[str]:
-        return [
-            "Kitap İsmi",
-            "Yazar",
-            "Yayınevi",
-            "Kategori",
-            "Fiyat",
-            "URL",
-            "Site",
-            "Tarih",
-            "Resim",
-            "ISBN",
-            "Para Birimi",
-            "Stok Durumu",
-        ]
+        return CSV_COLUMNS
 
     def to_csv_row(self) -> list[str | int | float]:
         return [
@@ -55,9 +71,47 @@ class Product(BaseModel):
             self.price,
             self.url,
             self.store,
-            self.scraped_at.strftime("%Y-%m-%d %H:%M:%S"),
+            format_timestamp(self.scraped_at),
             self.image_url or "",
             self.isbn,
             self.currency,
             self.availability,
         ]
+
+    def to_record(self) -> ProductRecord:
+        return ProductRecord(**self.model_dump())
+
+
+class ProductRecord(NamedTuple):
+    """Pipeline içi ürün kaydı; `Product` ile aynı alanlar, doğrulamasız ve `__dict__`siz.
+
+    Alanların geçerliliğini (başlık/URL dolu, fiyat > 0, metinler `str`) üreten taraf
+    (`standardize.normalize`) garanti eder.
+    """
+
+    title: str
+    author: str
+    publisher: str
+    category: str
+    price: float
+    url: str
+    store: str
+    scraped_at: datetime
+    image_url: str | None = None
+    isbn: str = ""
+    currency: str = "TRY"
+    availability: str = ""
+
+    @property
+    def csv_columns(self) -> list[str]:
+        return CSV_COLUMNS
+
+    def to_csv_row(self) -> list[str | int | float]:
+        row: list[str | int | float] = list(self)
+        row[7] = format_timestamp(self.scraped_at)
+        row[8] = self.image_url or ""
+        return row
+
+    def to_model(self) -> Product:
+        """Sınırda (dışa aktarım, JSON) kullanmak için doğrulanmış `Product`."""
+        return Product(**self._asdict())
@@ -1,15 +1,19 @@
 from bookdata.pipeline.runner import (
     STORE_REGISTRY,
+    MultiScrapeResult,
     ScrapeResult,
     get_store_class,
     resolve_adapter,
     run_scrape,
+    run_scrape_many,
 )
 
 __all__ = [
     "STORE_REGISTRY",
+    "MultiScrapeResult",
     "ScrapeResult",
     "get_store_class",
     "resolve_adapter",
     "run_scrape",
+    "run_scrape_many",
 ]
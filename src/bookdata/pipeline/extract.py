@@ -4,6 +4,11 @@
 bloklarındaki `Product`/`Book`/`ItemList` verisi okunur; bu, DOM değişimlerine
 karşı daha dayanıklıdır. DOM çıktısı hiçbir zaman atılmaz, `merge_products` ile
 zenginleştirilir — böylece veri kaybı olmaz.
+
+`parse_json_ld_bytes` aynı blokları DOM kurmadan, ham yanıt baytları üzerinde bulur ve
+(kuruluysa `orjson` ile) çözer. Opsiyonel `ld_fast_path` (varsayılan kapalı) açıksa ve
+JSON-LD kayıt sayısı kart sayısına eşitse DOM hiç kurulmaz; bu durumda kayıtlar yalnızca
+JSON-LD'dendir (url, görsel ve fiyat metni birleştirilmiş çıktıdan farklı olabilir).
 """
 
 from __future__ import annotations
@@ -12,10 +17,19 @@ import json
 import re
 from collections.abc import Iterable
 
-from bs4 import BeautifulSoup
+from bookdata.adapters.parsers import LD_JSON_REGION, Document
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # opsiyonel: `uv sync --extra fast`
+    _loads = json.loads
 
 _ISBN13 = re.compile(r"97[89]\d{10}")
 _ISBN10 = re.compile(r"(?<!\d)\d{9}[\dX](?!\d)")
+_LD_SCRIPT = re.compile(
+    rb"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def _as_list(value: object) -> list[dict]:
@@ -26,17 +40,13 @@ def _as_list(value: object) -> list[dict]:
     return []
 
 
-def parse_json_ld(soup: BeautifulSoup) -> list[dict]:
-    """Sayfadaki tüm JSON-LD bloklarını ayrıştırıp dict listesi döndürür.
-
-    Bozuk veya JSON olmayan bloklar sessizce atlanır; `@graph` düzleştirilir.
-    """
+def _decode_blocks(blocks: Iterable[str | bytes]) -> list[dict]:
+    """JSON-LD blok metinlerini çözer; bozuk bloklar atlanır, `@graph` düzleştirilir."""
     results: list[dict] = []
-    for script in soup.select('script[type="application/ld+json"]'):
-        text = script.string or ""
+    for text in blocks:
         try:
-            data = json.loads(text)
-        except json.JSONDecodeError:
+            data = _loads(text)
+        except ValueError:  # JSONDecodeError ve UTF-8 olmayan baytlar
             continue
         if isinstance(data, dict):
             results.append(data)
@@ -46,6 +56,21 @@ def parse_json_ld(soup: BeautifulSoup) -> list[dict]:
     return results
 
 
+def parse_json_ld(soup: Document) -> list[dict]:
+    """Sayfadaki tüm JSON-LD bloklarını ayrıştırıp dict listesi döndürür.
+
+    Bozuk veya JSON olmayan bloklar sessizce atlanır; `@graph` düzleştirilir.
+    """
+    return _decode_blocks(str(script.string or "") for script in soup.select(LD_JSON_REGION))
+
+
+def parse_json_ld_bytes(content: bytes) -> list[dict]:
+    """`parse_json_ld` ile aynı sonucu DOM kurmadan, ham sayfa baytlarından üretir."""
+    if b"ld+json" not in content:
+        return []
+    return _decode_blocks(match.group(1) for match in _LD_SCRIPT.finditer(content))
+
+
 def _type_name(data: dict) -> list[str]:
     t = data.get("@type")
     if isinstance(t, list):
@@ -143,10 +168,20 @@ def product_from_ld(data: dict, category: str) -> dict | None:
     }
 
 
-def products_from_json_ld(soup: BeautifulSoup, category: str) -> list[dict]:
+def products_from_json_ld(soup: Document, category: str) -> list[dict]:
     """Sayfadaki JSON-LD verisinden fiyatı olan ürünleri döndürür."""
+    return products_from_ld_blocks(parse_json_ld(soup), category)
+
+
+def products_from_ld_bytes(content: bytes, category: str) -> list[dict]:
+    """`products_from_json_ld`'nin DOM'suz karşılığı (ham sayfa baytları üzerinde)."""
+    return products_from_ld_blocks(parse_json_ld_bytes(content), category)
+
+
+def products_from_ld_blocks(blocks: Iterable[dict], category: str) -> list[dict]:
+    """Çözülmüş JSON-LD bloklarından fiyatı olan ürünleri döndürür."""
     items: list[dict] = []
-    for data in parse_json_ld(soup):
+    for data in blocks:
         for t in _type_name(data):
             if t == "ItemList":
                 for entry in _as_list(data.get("itemListElement")):
@@ -1,9 +1,28 @@
-"""Kategori filtre aşaması: ignore_categories.txt'teki desenlere uyan kategorileri atlar."""
+"""Kategori filtre aşaması: ignore_categories.txt'teki kurallara uyan kategorileri atlar.
+
+Her satır bir kuraldır; önek kural türünü belirler:
+
+- `Hobi`                    → ad veya URL'de geçiyorsa (alt dize)
+- `glob:*Kitapları`         → adın ya da URL'nin tamamı glob desenine uyuyorsa
+- `re:^(cd|dvd)\\b`          → ad veya URL'de regex eşleşiyorsa
+- `url:https://x.com/hobi`  → URL bu önekle başlıyorsa (`url:/hobi` yalnızca yola bakar)
+
+Ad/URL karşılaştırmaları büyük/küçük harf ve Türkçe karakter duyarsızdır (metin ASCII'ye
+indirgenip küçültülür; regex'ler de bu indirgenmiş metne uygulanır). Alt dize ve glob
+kuralları tek bir derlenmiş regex'te birleşir; `re:` kuralları ayrı ayrı derlenir (adlı
+gruplar, `\\1` geri başvuruları ve satır içi bayraklar birleştirmede anlam değiştirir);
+kategori başına karar önbelleğe alınır. Adapter'lar kuralları keşif sırasında uygular
+(`StorePort.keep_category`), böylece yok sayılan kategoriler ve alt ağaçları hiç çekilmez.
+"""
 
 from __future__ import annotations
 
 import logging
+import re
 import unicodedata
+from collections.abc import Sequence
+from functools import cache, lru_cache
+from urllib.parse import urlsplit
 
 from bookdata.models import Category
 
@@ -12,27 +31,96 @@ logger = logging.getLogger(__name__)
 _TURKISH_TO_ASCII = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
 
 
+@lru_cache(maxsize=8192)
 def _normalize(text: str) -> str:
     """Türkçe karakterleri ASCII'ye çevirir ve küçültür (ı↔i eşleşmesi için)."""
     text = text.translate(_TURKISH_TO_ASCII)
     return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode().lower()
 
 
-def apply_ignore(categories: list[Category], patterns: list[str]) -> list[Category]:
-    """Kategori adı veya URL'sinde desen geçenleri (büyük/küçük duyarsız) çıkarır."""
-    if not patterns:
-        return categories
+def _glob(pattern: str) -> str:
+    """Tek satıra (ad ya da URL) tam uyan glob; `*`/`?` satır sonunu geçmez."""
+    body = "".join(
+        "[^\n]*" if ch == "*" else "[^\n]" if ch == "?" else re.escape(ch) for ch in pattern
+    )
+    return f"^{body}$"
+
+
+class IgnoreRules:
+    """Derlenmiş ignore kuralları; `ignored(name, url)` kategori başına önbelleklidir."""
+
+    def __init__(self, lines: Sequence[str]) -> None:
+        self.count = len(lines)
+        alternatives: list[str] = []
+        regexes: list[re.Pattern[str]] = []
+        url_prefixes: list[str] = []
+        path_prefixes: list[str] = []
+        for line in lines:
+            kind, sep, value = line.partition(":")
+            kind = kind.strip().lower() if sep else ""
+            if kind == "re":
+                try:
+                    regexes.append(re.compile(value, re.IGNORECASE | re.MULTILINE))
+                except re.error as exc:
+                    raise ValueError(f"Geçersiz ignore regex'i: {line} ({exc})") from exc
+            elif kind == "glob":
+                alternatives.append(_glob(_normalize(value.strip())))
+            elif kind == "url":
+                prefix = value.strip()
+                (path_prefixes if prefix.startswith("/") else url_prefixes).append(prefix)
+            else:
+                alternatives.append(re.escape(_normalize(line)))
+        self._pattern = (
+            re.compile("|".join(alternatives), re.IGNORECASE | re.MULTILINE)
+            if alternatives
+            else None
+        )
+        self._regexes = tuple(regexes)
+        self._url_prefixes = tuple(url_prefixes)
+        self._path_prefixes = tuple(path_prefixes)
+        self._decisions: dict[tuple[str, str], bool] = {}
 
-    normalized_patterns = [_normalize(p) for p in patterns]
+    def __bool__(self) -> bool:
+        return self.count > 0
 
-    def ignored(category: Category) -> bool:
-        haystack = _normalize(f"{category.name} {category.url}")
-        return any(pattern in haystack for pattern in normalized_patterns)
+    def ignored(self, name: str, url: str) -> bool:
+        key = (name, url)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = self._decisions[key] = self._match(name, url)
+        return decision
 
-    kept = [c for c in categories if not ignored(c)]
+    def _match(self, name: str, url: str) -> bool:
+        if self._url_prefixes and url.startswith(self._url_prefixes):
+            return True
+        if self._path_prefixes and urlsplit(url).path.startswith(self._path_prefixes):
+            return True
+        # Ad ve URL ayrı satırlarda: glob'lar satır başı/sonuna bağlanır
+        haystack = f"{_normalize(name)}\n{_normalize(url)}"
+        if self._pattern is not None and self._pattern.search(haystack) is not None:
+            return True
+        return any(regex.search(haystack) is not None for regex in self._regexes)
+
+    def category_ignored(self, category: Category) -> bool:
+        """Kategori ya da (varsa) üst kategorisi kurallara uyuyorsa alt ağaç atlanır."""
+        if self.ignored(category.name, category.url):
+            return True
+        return category.parent is not None and self.ignored(category.parent, category.parent)
+
+
+@cache
+def compile_rules(lines: tuple[str, ...]) -> IgnoreRules:
+    return IgnoreRules(lines)
+
+
+def apply_ignore(categories: list[Category], patterns: Sequence[str]) -> list[Category]:
+    """Kurallara uyan kategorileri (ve üst kategorisi uyanları) çıkarır."""
+    rules = compile_rules(tuple(patterns))
+    if not rules:
+        return categories
+
+    kept = [c for c in categories if not rules.category_ignored(c)]
     skipped = len(categories) - len(kept)
     if skipped:
-        logger.info(
-            "Ignore kuralları gereği %s kategori atlandı (%s desen)", skipped, len(patterns)
-        )
+        logger.info("Ignore kuralları gereği %s kategori atlandı (%s kural)", skipped, rules.count)
     return kept
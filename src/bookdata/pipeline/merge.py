@@ -8,17 +8,27 @@ from __future__ import annotations
 
 import logging
 
-from bookdata.models import Product
+from bookdata.models import ProductRecord
 
 logger = logging.getLogger(__name__)
 
 
-def diff_products(products: list[Product], last_prices: dict[str, float]) -> list[Product]:
-    changed: list[Product] = []
+def changed_products(
+    products: list[ProductRecord], last_prices: dict[str, float]
+) -> list[ProductRecord]:
+    """Fiyatı değişen veya ilk kez görülen ürünler (loglamasız; parti parti çağrılır)."""
+    changed: list[ProductRecord] = []
     for product in products:
         last = last_prices.get(product.url)
         if last is None or abs(last - product.price) > 1e-6:
             changed.append(product)
+    return changed
+
+
+def diff_products(
+    products: list[ProductRecord], last_prices: dict[str, float]
+) -> list[ProductRecord]:
+    changed = changed_products(products, last_prices)
     logger.info(
         "Fiyat karşılaştırması: %s ürünün %s tanesinde değişiklik/yeni kayıt",
         len(products),
@@ -1,51 +1,169 @@
-"""Ürün toplama aşaması: kategori port'u üzerinden tüm kategorilerin ürünlerini çeker."""
+"""Ürün toplama aşaması: kategori port'u üzerinden tüm kategorilerin ürünlerini çeker.
+
+Ürünler sayfa sayfa akar (`stream_products`); çalıştırıcı her sayfayı geldiği anda
+standardize edip diske yazar.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import random
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
 
+from bookdata.adapters.http import request_flow
+from bookdata.adapters.storage import CategoryFingerprints
 from bookdata.adapters.stores.base import StorePort
 from bookdata.models import Category
 
 logger = logging.getLogger(__name__)
 
 
-async def scrape_category(store: StorePort, category: Category) -> list[dict]:
-    """Tek kategori için sayfaları gezer, ham ürün listesini toplar."""
-    raw_items: list[dict] = []
-    pages = 0
+@dataclass(frozen=True)
+class PageBatch:
+    """Bir kategoriden gelen sayfa ürünleri.
+
+    Her kategori `done=True` olan (boş) bir son partiyle biter; kategori hata verdiyse bu
+    partide `failed=True`'dur. Tüketici kategori başına tuttuğu durumu bu partide bırakır.
+    """
+
+    category: Category
+    items: list[dict]
+    done: bool = False
+    failed: bool = False
+
+
+def page_fingerprint(items: list[dict]) -> str:
+    """Sayfadaki ürünlerin URL + fiyatından sıradan bağımsız bir özet."""
+    digest = hashlib.sha1()
+    for url, price in sorted(
+        (str(item.get("url", "")), str(item.get("price") or item.get("price_text", "")))
+        for item in items
+    ):
+        digest.update(f"{url}\t{price}\n".encode())
+    return digest.hexdigest()
+
+
+async def iter_category(
+    store: StorePort, category: Category, fingerprints: CategoryFingerprints | None = None
+) -> AsyncIterator[PageBatch]:
+    """Tek kategorinin sayfalarını gezer; her sayfanın ham ürünlerini geldikçe üretir.
+
+    Kategorinin istekleri kendi akışında (`request_flow`) zamanlanır; HTTP zamanlayıcısı
+    aynı host'u bekleyen kategorilere sırayla slot verir.
+
+    `fingerprints` verilirse ilk sayfanın parmak izi geçen çalıştırmayla karşılaştırılır;
+    değişmemişse sayfalama atlanır ve geçen seferki ürünler tek parça olarak üretilir.
+    """
+    recorded: list[dict] = []
+    pages = count = 0
+    fingerprint = None
     try:
-        async for soup in store.iter_pages(category):
-            pages += 1
-            raw_items.extend(store.parse_products(soup, category))
+        with request_flow(category.url):
+            async with aclosing(store.iter_pages(category)) as page_iter:
+                async for page in page_iter:
+                    pages += 1
+                    items = await store.extract(page, category)
+                    if pages == 1 and fingerprints is not None:
+                        fingerprint = page_fingerprint(items)
+                        reused = fingerprints.reusable(category.url, fingerprint)
+                        if reused is not None:
+                            logger.info(
+                                "Kategori '%s' değişmemiş: sayfalama atlandı, %s ürün yeniden "
+                                "kullanıldı",
+                                category.name,
+                                len(reused),
+                            )
+                            yield PageBatch(category, reused)
+                            yield PageBatch(category, [], done=True)
+                            return
+                    if fingerprint is not None:
+                        recorded.extend(items)
+                    count += len(items)
+                    yield PageBatch(category, items)
+        if fingerprint is not None:
+            fingerprints.record(category.url, fingerprint, recorded)
+        yield PageBatch(category, [], done=True)
     except Exception as exc:  # noqa: BLE001 — tek kategori hatası diğerlerini etkilememeli
         logger.warning("Kategori işlenirken hata (%s): %s", category.name, exc)
+        yield PageBatch(category, [], done=True, failed=True)
 
-    if raw_items:
-        logger.info("Kategori '%s': %s sayfa, %s ürün", category.name, pages, len(raw_items))
+    if count:
+        logger.info("Kategori '%s': %s sayfa, %s ürün", category.name, pages, count)
     else:
         logger.info("Kategori '%s': ürün bulunamadı (%s sayfa)", category.name, pages)
-    return raw_items
 
 
-async def collect_products(
-    store: StorePort, categories: list[Category], task_limit: int
+async def scrape_category(
+    store: StorePort, category: Category, fingerprints: CategoryFingerprints | None = None
 ) -> list[dict]:
-    """Kategorileri sınırlı eşzamanlılıkla, karışık sırada işler.
+    """Tek kategori için sayfaları gezer, ham ürün listesini toplar."""
+    batches = iter_category(store, category, fingerprints)
+    return [item async for batch in batches for item in batch.items]
 
-    Sıralamayı her çalıştırmada rastgele karıştırmak, site tarafında
-    öngörülebilir (bot benzeri) istek deseni oluşmasını engeller.
+
+async def stream_products(
+    store: StorePort,
+    categories: list[Category],
+    task_limit: int,
+    fingerprints: CategoryFingerprints | None = None,
+    queue_size: int = 64,
+) -> AsyncIterator[PageBatch]:
+    """Kategorileri sınırlı eşzamanlılıkla, karışık sırada işler; sayfa ürünlerini geldikçe
+    üretir.
+
+    Sıralamayı her çalıştırmada rastgele karıştırmak, site tarafında öngörülebilir (bot
+    benzeri) istek deseni oluşmasını engeller. Sayfalar en fazla `queue_size` elemanlık bir
+    kuyruktan akar: tüketici yavaşlarsa kategoriler yeni sayfa çekmeden bekler, böylece
+    bellekte katalog değil yalnızca birkaç sayfa tutulur.
     """
     shuffled = list(categories)
     random.shuffle(shuffled)
 
     semaphore = asyncio.Semaphore(task_limit)
+    queue: asyncio.Queue[PageBatch] = asyncio.Queue(maxsize=max(1, queue_size))
 
-    async def _run(category: Category) -> list[dict]:
+    async def _run(category: Category) -> None:
         async with semaphore:
-            return await scrape_category(store, category)
+            async with aclosing(iter_category(store, category, fingerprints)) as batches:
+                async for batch in batches:
+                    await queue.put(batch)
+
+    async def _produce() -> None:
+        tasks = [asyncio.create_task(_run(c)) for c in shuffled]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-    batches = await asyncio.gather(*(_run(c) for c in shuffled))
-    return [item for batch in batches for item in batch]
+    # Kuyruk ve üretici birlikte beklenir: üretici çökerse hata tüketiciye taşınır,
+    # dolu kuyruğa bitiş işareti koymaya çalışırken kilitlenilmez.
+    producer = asyncio.create_task(_produce())
+    try:
+        while not (producer.done() and queue.empty()):
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, producer}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+        producer.result()
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
+
+async def collect_products(
+    store: StorePort,
+    categories: list[Category],
+    task_limit: int,
+    fingerprints: CategoryFingerprints | None = None,
+) -> list[dict]:
+    """`stream_products` çıktısını tek listede toplar."""
+    batches = stream_products(store, categories, task_limit, fingerprints)
+    return [item async for batch in batches for item in batch.items]
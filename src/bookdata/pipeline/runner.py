@@ -2,25 +2,53 @@
 
 1. Kategorileri çek (StorePort.fetch_categories)
 2. Ignore kurallarına göre filtrele (filter.apply_ignore)
-3. Kategori bazlı ürün sayfalarını çek (products.collect_products)
-4. Veriyi standart şemaya dönüştür (standardize.standardize)
-5. Mevcut fiyat geçmişiyle karşılaştır (merge.diff_products)
-6. Değişen kayıtları veri setine ekle (DatasetStore.append)
+3. Kategori bazlı ürün sayfalarını çek (products.stream_products)
+4. Veriyi standart şemaya dönüştür (standardize.standardize_batch)
+5. Mevcut fiyat geçmişiyle karşılaştır (merge.changed_products)
+6. Değişen kayıtları veri setine ekle (DatasetStore.append ya da ParquetDatasetStore.append)
+
+3-6 akış halinde çalışır: her sayfa geldiği anda dönüştürülüp karşılaştırılır, değişen
+kayıtlar `append_batch_size`'lık partiler halinde diske yazılır. Bellekte tüm katalog
+değil, sınırlı bir sayfa kuyruğu ve görülen URL'ler tutulur.
+
+Biten her kategori ürünleriyle birlikte checkpoint günlüğüne yazılır; ortada ölen bir
+çalıştırma `resume=True` ile kaldığı yerden devam eder.
+
+Replay modunda (`BOOKDATA_HTTP_MODE=replay`) fingerprint atlaması kapalıdır ve ayrı bir
+`data_dir` zorunludur: aynı kaset her seferinde aynı sayfaları tarar, gerçek `Data/`
+dizinindeki veri seti, fingerprint'ler ve üyelik tablosu değişmez.
+
+`run_scrape_many` birden çok mağazayı aynı süreçte, tek paylaşılan HTTP istemcisi üzerinden
+eşzamanlı kazır; host başına sınırlar zamanlayıcıda ayrı tutulduğu için farklı siteler
+birbirini beklemez.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import ExitStack, asynccontextmanager
+from dataclasses import dataclass, fields, replace
+from datetime import UTC, datetime
+from pathlib import Path
 
 import httpx
 
 from bookdata.adapters.http import AsyncHTTPClient
-from bookdata.adapters.storage import DatasetStore
+from bookdata.adapters.storage import (
+    CategoryFingerprints,
+    CheckpointJournal,
+    CompletedCategory,
+    MembershipTable,
+    open_dataset,
+)
 from bookdata.adapters.stores.base import StorePort
 from bookdata.adapters.stores.bkm import BkmKitapAdapter
 from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
 from bookdata.config import Settings
+from bookdata.models import ProductRecord
 from bookdata.pipeline import filter as category_filter
 from bookdata.pipeline import merge, products, standardize
 
@@ -41,6 +69,51 @@ class ScrapeResult:
     total_rows: int
     fetch_count: int
     fail_count: int
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_bytes_saved: int = 0
+    request_rate: float = 0.0
+    coalesced_requests: int = 0
+    retries: int = 0
+    circuit_rejections: int = 0
+    wasted_requests: int = 0
+    categories_unchanged: int = 0
+    categories_resumed: int = 0
+    replay_misses: int = 0
+
+
+@dataclass
+class MultiScrapeResult:
+    """`run_scrape_many` çıktısı: mağaza başına sonuçlar ve toplamları.
+
+    Cache, birleştirme, retry ve devre sayaçları paylaşılan istemcinin geneline aittir;
+    mağaza sonuçlarında da aynı (istemci geneli) değerler görünür, toplamda bir kez sayılır.
+    """
+
+    stores: dict[str, ScrapeResult]
+    combined: ScrapeResult
+
+
+_CLIENT_WIDE = frozenset(
+    {
+        "cache_hits",
+        "cache_misses",
+        "cache_bytes_saved",
+        "coalesced_requests",
+        "retries",
+        "circuit_rejections",
+        "replay_misses",
+    }
+)
+
+
+def combine_results(results: list[ScrapeResult]) -> ScrapeResult:
+    """Mağaza sonuçlarını toplar; istemci geneli sayaçlar bir kez alınır."""
+    totals = {}
+    for f in fields(ScrapeResult):
+        values = [getattr(r, f.name) for r in results]
+        totals[f.name] = values[0] if f.name in _CLIENT_WIDE and values else sum(values)
+    return ScrapeResult(**totals)
 
 
 def get_store_class(settings: Settings) -> type[StorePort]:
@@ -61,39 +134,211 @@ def resolve_adapter(url: str) -> type[StorePort] | None:
     return None
 
 
-async def run_scrape(settings: Settings) -> ScrapeResult:
-    async with AsyncHTTPClient(settings) as http:
-        adapter_cls = get_store_class(settings)
-        store = adapter_cls(http, settings)
-        dataset = DatasetStore(settings.dataset_file)
-
-        raw_categories = await store.fetch_categories()
-        categories = category_filter.apply_ignore(raw_categories, settings.load_ignore_patterns())
-
-        raw_items = await products.collect_products(store, categories, settings.concurrency)
-        normalized = standardize.standardize(raw_items, store.store, store.display_name)
-        last_prices = dataset.last_price_by_url()
-        changed = merge.diff_products(normalized, last_prices)
-        written = dataset.append(changed)
-
-        result = ScrapeResult(
-            categories_found=len(raw_categories),
-            categories_scraped=len(categories),
-            products_scraped=len(normalized),
-            rows_written=written,
-            total_rows=dataset.row_count(),
-            fetch_count=store.stats["fetch"],
-            fail_count=store.stats["fail"],
+@asynccontextmanager
+async def _resources(settings: Settings) -> AsyncIterator[tuple[AsyncHTTPClient, Executor | None]]:
+    """Paylaşılan HTTP istemcisi ve (ayarlıysa) ayrıştırma süreç havuzu."""
+    if settings.http_mode == "replay" and _same_dir(settings.data_dir, Settings().data_dir):
+        raise ValueError(
+            "Replay modu gerçek veri dizinine yazmaz: BOOKDATA_DATA_DIR ile ayrı bir dizin verin"
+        )
+    with ExitStack() as stack:
+        executor = (
+            stack.enter_context(ProcessPoolExecutor(max_workers=settings.parse_workers))
+            if settings.parse_workers > 0
+            else None
+        )
+        async with AsyncHTTPClient(settings) as http:
+            yield http, executor
+
+
+async def run_scrape(settings: Settings, *, resume: bool = False) -> ScrapeResult:
+    """Tek mağazayı uçtan uca kazır.
+
+    `resume=True`: önceki yarım çalıştırmanın checkpoint günlüğündeki kategoriler tekrar
+    taranmaz; ürünleri günlükten veri setine (fiyat diff'i ile, tekrar yazmadan) aktarılır.
+    """
+    async with _resources(settings) as (http, executor):
+        return await _scrape(http, settings, executor, resume)
+
+
+async def run_scrape_many(
+    settings: Settings, stores: list[str], *, resume: bool = False
+) -> MultiScrapeResult:
+    """Mağazaları tek istemci üzerinden eşzamanlı kazır; her biri kendi veri setine yazar.
+
+    Bir mağazanın hatası diğerlerini yarıda kesmez: hepsi bittikten sonra ilk hata
+    yeniden fırlatılır.
+    """
+    async with _resources(settings) as (http, executor):
+        outcomes = await asyncio.gather(
+            *(_scrape(http, replace(settings, store=s), executor, resume) for s in stores),
+            return_exceptions=True,
         )
+    results: dict[str, ScrapeResult] = {}
+    errors: list[BaseException] = []
+    for store, outcome in zip(stores, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            logger.error("Mağaza kazınamadı (%s): %s", store, outcome)
+            errors.append(outcome)
+        else:
+            results[store] = outcome
+    if errors:
+        raise errors[0]
+    return MultiScrapeResult(stores=results, combined=combine_results(list(results.values())))
+
+
+async def _scrape(
+    http: AsyncHTTPClient, settings: Settings, executor: Executor | None, resume: bool = False
+) -> ScrapeResult:
+    adapter_cls = get_store_class(settings)
+    store = adapter_cls(http, settings, executor)
+    dataset = open_dataset(settings)
+    scraped_at = datetime.now(UTC)  # çalıştırmanın tüm kayıtları aynı zamanı paylaşır
+
+    raw_categories = await store.fetch_categories()
+    # Adapter'lar kuralları keşifte uygular; burada üst kategori ve keşifte süzmeyen
+    # adapter'lar için son bir geçiş yapılır (kararlar önbellekte).
+    categories = category_filter.apply_ignore(raw_categories, settings.load_ignore_patterns())
+
+    journal = CheckpointJournal(settings.checkpoint_file)
+    resumed: dict[str, CompletedCategory] = {}
+    if resume:
+        resumed = journal.load()
+        categories = [c for c in categories if c.url not in resumed]
         logger.info(
-            "Özet: %s kategori bulundu, %s işlendi; %s ürün → %s kayıt eklendi (toplam %s). "
-            "İstek: %s, hata: %s",
-            result.categories_found,
-            result.categories_scraped,
-            result.products_scraped,
-            result.rows_written,
-            result.total_rows,
-            result.fetch_count,
-            result.fail_count,
+            "Checkpoint'ten devam: %s kategori tamamlanmış, %s kategori kaldı",
+            len(resumed),
+            len(categories),
+        )
+    elif journal.path.exists():
+        logger.warning("Yarım kalmış çalıştırmanın checkpoint'i yok sayıldı (devam için --resume)")
+        journal.discard()
+
+    fingerprints = (
+        CategoryFingerprints(settings.fingerprint_dir, settings.full_refresh_every)
+        if settings.full_refresh_every > 1 and settings.http_mode != "replay"
+        else None
+    )
+    last_prices = dataset.last_price_by_url()
+    seen: dict[str, str] = {}
+    memberships: dict[str, set[str]] = {}
+    pending: list[ProductRecord] = []
+    raw_count = scraped = changed = written = 0
+
+    def _accept(normalized: list[ProductRecord]) -> None:
+        nonlocal scraped, changed, written, pending
+        scraped += len(normalized)
+        fresh = merge.changed_products(normalized, last_prices)
+        changed += len(fresh)
+        pending.extend(fresh)
+        if len(pending) >= settings.append_batch_size:
+            written += dataset.append(pending, flush=False)
+            pending = []
+
+    # Günlükteki ürünlerin bir kısmı ölmeden önce yazılmış olabilir; fiyat diff'i
+    # bunları eler, yalnızca eksik kalanlar eklenir.
+    for done in resumed.values():
+        _accept([p for p in done.products if p.url not in seen])
+        seen.update((p.url, p.category) for p in done.products)
+        _merge_memberships(memberships, done.memberships)
+
+    # Kategori bitene kadar ürünleri ve üyelikleri tutulur, bitince günlüğe tek satır
+    # olarak yazılır; hatayla biten kategorinin tuttukları da o anda bırakılır.
+    in_flight: dict[str, list[ProductRecord]] = {}
+    in_flight_memberships: dict[str, dict[str, set[str]]] = {}
+    batches = products.stream_products(
+        store, categories, settings.concurrency, fingerprints, settings.queue_size
+    )
+    async for batch in batches:
+        url = batch.category.url
+        if batch.done:
+            category_products = in_flight.pop(url, [])
+            category_memberships = in_flight_memberships.pop(url, None)
+            # Hata veren kategori günlüğe yazılmaz; --resume onu yeniden tarar
+            if not batch.failed:
+                journal.complete(url, category_products, category_memberships)
+            continue
+        raw_count += len(batch.items)
+        found: dict[str, set[str]] = {}
+        normalized = standardize.standardize_batch(
+            batch.items, store.store, store.display_name, seen, scraped_at, found
+        )
+        _merge_memberships(memberships, found)
+        _merge_memberships(in_flight_memberships.setdefault(url, {}), found)
+        in_flight.setdefault(url, []).extend(normalized)
+        _accept(normalized)
+    written += dataset.append(pending, flush=False)
+    dataset.flush()  # indeks ve manifest çalıştırma başına bir kez yazılır
+    membership_rows = MembershipTable(settings.membership_file).write(memberships)
+    if fingerprints is not None:
+        fingerprints.save()
+    journal.discard()
+    logger.info(
+        "Standardize edildi: %s ham → %s ürün; %s tanesinde değişiklik/yeni kayıt; "
+        "%s ek kategori üyeliği kaydedildi",
+        raw_count,
+        scraped,
+        changed,
+        membership_rows,
+    )
+
+    result = ScrapeResult(
+        categories_found=len(raw_categories),
+        categories_scraped=len(categories),
+        products_scraped=scraped,
+        rows_written=written,
+        total_rows=dataset.row_count(),
+        fetch_count=store.stats["fetch"],
+        fail_count=store.stats["fail"],
+        cache_hits=http.stats["cache_hits"],
+        cache_misses=http.stats["cache_misses"],
+        cache_bytes_saved=http.stats["cache_bytes_saved"],
+        request_rate=http.request_rate(store.domain),
+        coalesced_requests=http.stats["coalesced"],
+        retries=http.stats["retries"],
+        circuit_rejections=http.stats["circuit_rejections"],
+        wasted_requests=store.stats["wasted"],
+        categories_unchanged=fingerprints.skipped if fingerprints is not None else 0,
+        categories_resumed=len(resumed),
+        replay_misses=http.stats["replay_misses"],
+    )
+    if result.replay_misses:
+        logger.warning(
+            "Kasette olmayan %s istek 404 sayıldı; kaset bu taramayı tam kapsamıyor",
+            result.replay_misses,
         )
-        return result
+    logger.info(
+        "Özet (%s): %s kategori bulundu, %s işlendi (%s değişmemiş, %s checkpoint'ten); "
+        "%s ürün → %s kayıt eklendi (toplam %s). "
+        "İstek: %s, hata: %s; cache: %s isabet / %s ıska (%s bayt tasarruf); "
+        "güncel hız: %.2f istek/sn; birleştirilen istek: %s; retry: %s, devre reddi: %s; "
+        "boşa giden önden istek: %s",
+        settings.store,
+        result.categories_found,
+        result.categories_scraped,
+        result.categories_unchanged,
+        result.categories_resumed,
+        result.products_scraped,
+        result.rows_written,
+        result.total_rows,
+        result.fetch_count,
+        result.fail_count,
+        result.cache_hits,
+        result.cache_misses,
+        result.cache_bytes_saved,
+        result.request_rate,
+        result.coalesced_requests,
+        result.retries,
+        result.circuit_rejections,
+        result.wasted_requests,
+    )
+    return result
+
+
+def _same_dir(a: Path, b: Path) -> bool:
+    return a.resolve() == b.resolve()
+
+
+def _merge_memberships(target: dict[str, set[str]], source: dict[str, set[str]]) -> None:
+    for url, categories in source.items():
+        target.setdefault(url, set()).update(categories)
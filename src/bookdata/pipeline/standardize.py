@@ -1,16 +1,31 @@
-"""Standardizasyon aşaması: ham sayfa verisini ortak `Product` şemasına dönüştürür.
+"""Standardizasyon aşaması: ham sayfa verisini ortak şemaya (`ProductRecord`) dönüştürür.
 
 Fiyat metnini ("53,30 TL", "1.234,50") sayıya çevirir, URL'leri temizler ve
 URL bazında kopya ürünleri ayıklar. Adapter'lar bu mantığı içermez.
+
+Aynı kitap birçok kategoride listelenir. Kopyalar çıkarmanın hemen ardından, fiyatı
+çözülmeden ve kayıt kurulmadan elenir; atılan kopyanın kategorisi kaybolmaz, üyelik
+tablosuna (`memberships`: URL → ek kategoriler) yazılır.
+
+Doğrulama burada, kayıt başına pydantic modeli kurmadan yapılır: zorunlu alanlar ve
+fiyat kontrol edilir, metin alanları `str`'e çevrilir. Tüm kayıtlar çalıştırmanın tek
+zaman damgasını (`scraped_at`) paylaşır.
+
+Fiyatlar partinin tamamı için bir arada çözülür (`parse_prices`, `item_prices`): aynı
+fiyat metni katalogda binlerce kez geçtiğinden her farklı metin süreç boyunca bir kez
+ayrıştırılır; JSON-LD'den gelen sayısal fiyatlar metne çevrilip geri ayrıştırılmaz.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import re
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
 
-from bookdata.models import Product
+from bookdata.models import ProductRecord
 
 logger = logging.getLogger(__name__)
 
@@ -34,44 +49,117 @@ def parse_price(text: str) -> float | None:
     return value if value > 0 else None
 
 
-def _raw_price(raw: dict) -> str:
-    """JSON-LD sayısal fiyatını text'e, metni olduğu gibi iletir."""
+_cached_price = lru_cache(maxsize=1 << 16)(parse_price)
+
+
+def parse_prices(texts: Iterable[str]) -> list[float | None]:
+    """Fiyat metinlerini toplu çözer; her eleman için `parse_price` ile aynı sonuç.
+
+    Farklı metinler süreç geneli bir LRU önbellekte tutulur, tekrar edenler ayrıştırılmaz.
+    """
+    return [_cached_price(text) for text in texts]
+
+
+def _numeric_price(value: float) -> float | None:
+    """JSON-LD sayısal fiyatı; metin yolu (`f"{value:.2f}"` → `parse_price`) ile aynı sonuç.
+
+    Metin yolu eksi işaretini attığı için negatif değerin mutlak değeri alınır.
+    """
+    value = round(abs(float(value)), 2)
+    return value if math.isfinite(value) and value > 0 else None
+
+
+def _item_price(raw: dict) -> float | None:
     price = raw.get("price")
     if isinstance(price, (int, float)):
-        return f"{price:.2f}".replace(".", ",")
-    return str(raw.get("price_text", ""))
+        return _numeric_price(price)
+    return _cached_price(str(raw.get("price_text", "")))
+
+
+def item_prices(raw_items: Iterable[dict]) -> list[float | None]:
+    """Ham ürünlerin fiyat sütunu: sayısal JSON-LD fiyatı, yoksa `price_text`."""
+    return [_item_price(raw) for raw in raw_items]
+
 
+def _text(value: object) -> str:
+    return value if isinstance(value, str) else "" if value is None else str(value)
 
-def normalize(raw: dict, store: str, display_name: str) -> Product | None:
-    price = parse_price(_raw_price(raw))
-    if price is None or not raw.get("title") or not raw.get("url"):
+
+def normalize(
+    raw: dict, store: str, display_name: str, scraped_at: datetime | None = None
+) -> ProductRecord | None:
+    return _record(raw, _item_price(raw), display_name, scraped_at or datetime.now(UTC))
+
+
+def _record(
+    raw: dict, price: float | None, display_name: str, scraped_at: datetime
+) -> ProductRecord | None:
+    title = raw.get("title")
+    url = raw.get("url")
+    if price is None or not title or not url:
         return None
-    return Product(
-        title=raw["title"],
-        author=raw.get("author", ""),
-        publisher=raw.get("publisher", ""),
-        category=raw.get("category", "Genel"),
+    image_url = raw.get("image_url")
+    return ProductRecord(
+        title=_text(title),
+        author=_text(raw.get("author")),
+        publisher=_text(raw.get("publisher")),
+        category=_text(raw.get("category", "Genel")),
         price=price,
-        url=raw["url"],
+        url=_text(url),
         store=display_name,
-        scraped_at=datetime.now(UTC),
-        image_url=raw.get("image_url"),
-        isbn=raw.get("isbn", ""),
-        currency=str(raw.get("currency", "TRY")).upper(),
-        availability=raw.get("availability", ""),
+        scraped_at=scraped_at,
+        image_url=None if image_url is None else _text(image_url),
+        isbn=_text(raw.get("isbn")),
+        currency=_text(raw.get("currency", "TRY")).upper(),
+        availability=_text(raw.get("availability")),
     )
 
 
-def standardize(raw_items: list[dict], store: str, display_name: str) -> list[Product]:
-    products: list[Product] = []
-    seen: set[str] = set()
+def standardize(raw_items: list[dict], store: str, display_name: str) -> list[ProductRecord]:
+    products = standardize_batch(raw_items, store, display_name, {})
+    logger.info("Standardize edildi: %s ham → %s ürün", len(raw_items), len(products))
+    return products
+
+
+def standardize_batch(
+    raw_items: list[dict],
+    store: str,
+    display_name: str,
+    seen: dict[str, str],
+    scraped_at: datetime | None = None,
+    memberships: dict[str, set[str]] | None = None,
+) -> list[ProductRecord]:
+    """Bir sayfa/parti ham ürünü dönüştürür.
+
+    `seen` (URL → ilk görüldüğü kategori) tüm partiler ve kategoriler arasında paylaşılır:
+    daha önce kaydı kurulmuş URL'ler dönüştürülmeden atlanır, farklı kategorideyseler
+    `memberships`e eklenir. `scraped_at` verilmezse partinin tüm kayıtları için bir kez
+    alınır.
+    """
+    scraped_at = scraped_at or datetime.now(UTC)
+    fresh: list[dict] = []
     for raw in raw_items:
-        product = normalize(raw, store, display_name)
+        url = _text(raw.get("url"))
+        if url in seen:
+            _add_membership(memberships, url, _text(raw.get("category", "Genel")), seen[url])
+        else:
+            fresh.append(raw)
+
+    products: list[ProductRecord] = []
+    for raw, price in zip(fresh, item_prices(fresh), strict=True):
+        product = _record(raw, price, display_name, scraped_at)
         if product is None:
             continue
-        if product.url in seen:
+        if product.url in seen:  # aynı parti içinde tekrar
+            _add_membership(memberships, product.url, product.category, seen[product.url])
             continue
-        seen.add(product.url)
+        seen[product.url] = product.category
         products.append(product)
-    logger.info("Standardize edildi: %s ham → %s ürün", len(raw_items), len(products))
     return products
+
+
+def _add_membership(
+    memberships: dict[str, set[str]] | None, url: str, category: str, first: str
+) -> None:
+    if memberships is not None and category != first:
+        memberships.setdefault(url, set()).add(category)
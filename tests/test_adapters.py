@@ -1,7 +1,13 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import httpx
+import pytest
 from bs4 import BeautifulSoup
 
+from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.adapters.stores.base import Page
 from bookdata.adapters.stores.bkm import BkmKitapAdapter
 from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
 from bookdata.config import Settings
@@ -67,3 +73,201 @@ def test_resolve_adapter_kitapyurdu():
 
 def test_resolve_adapter_unknown():
     assert resolve_adapter("https://example.com/x") is None
+
+
+def test_extract_page_matches_parse_products():
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    content = (FIXTURES / "product_jsonld.html").read_bytes()
+    adapter = BkmKitapAdapter(http=None, settings=Settings(ld_fast_path=False))
+    assert adapter.extract_page(content, category) == adapter.parse_products(
+        soup("product_jsonld.html"), category
+    )
+
+
+def test_extract_page_defaults_to_full_dom_merge():
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    content = (FIXTURES / "product_jsonld.html").read_bytes()
+    assert make_bkm().extract_page(content, category) == make_bkm().parse_products(
+        soup("product_jsonld.html"), category
+    )
+
+
+def test_extract_page_skips_dom_when_json_ld_covers_every_card(monkeypatch):
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    content = (FIXTURES / "product_jsonld.html").read_bytes()
+    adapter = BkmKitapAdapter(http=None, settings=Settings(ld_fast_path=True))
+    assert adapter.count_cards(content) == 1
+    monkeypatch.setattr(adapter, "make_soup", lambda *a: pytest.fail("DOM kuruldu"))
+    items = adapter.extract_page(content, category)
+    assert [(i["title"], i["price"], i["isbn"]) for i in items] == [
+        ("Güneşi Uyandıralım", 199.6, "9789753638029")
+    ]
+
+
+def test_fast_path_needs_exactly_one_json_ld_record_per_card(monkeypatch):
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    html = (FIXTURES / "product_jsonld.html").read_text(encoding="utf-8")
+    start = html.index('<script type="application/ld+json">')
+    block = html[start : html.index("</script>", start) + len("</script>")]
+    extra = block.replace("gunesi-uyandiralim", "onerilen-kitap")
+    content = html.replace(block, block + extra).encode()
+    adapter = BkmKitapAdapter(http=None, settings=Settings(ld_fast_path=True))
+    assert adapter.count_cards(content) == 1
+    items = adapter.extract_page(content, category)
+    assert items[0]["price_text"] == "199,60"  # DOM birleşimi: fazladan LD kaydı DOM'u atlatmaz
+
+
+def test_extract_page_falls_back_to_dom_when_json_ld_is_partial():
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    card = (FIXTURES / "bkm_card.html").read_text(encoding="utf-8")
+    other = card.replace("gunesi-uyandiralim", "baska-kitap")
+    content = (FIXTURES / "product_jsonld.html").read_text(encoding="utf-8") + other
+    items = make_bkm().extract_page(content.encode(), category)
+    assert [i["url"].rsplit("/", 1)[-1] for i in items] == ["gunesi-uyandiralim", "baska-kitap"]
+    assert items[0]["price_text"] == "199,60"
+    assert items[0]["isbn"] == "9789753638029"
+
+
+async def test_extract_in_process_pool_returns_plain_dicts():
+    category = Category(name="Roman", url="https://www.kitapyurdu.com/kategori/kitap/roman/1.html")
+    page = Page(url=category.url, content=(FIXTURES / "ky_card.html").read_bytes())
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        adapter = KitapYurduAdapter(http=None, settings=Settings(), executor=pool)
+        items = await adapter.extract(page, category)
+    assert items == make_ky().extract_page(page.content, category)
+    assert items[0]["title"] == "Kürk Mantolu Madonna"
+
+
+def test_ky_has_products_ignores_sub_classes():
+    card = (FIXTURES / "ky_card.html").read_bytes()
+    assert KitapYurduAdapter.has_products(Page(url="u", content=card))
+    empty = b'<div class="ky-product-list"><span class="x ky-product-title"></span></div>'
+    assert not KitapYurduAdapter.has_products(Page(url="u", content=empty))
+
+
+def bkm_pages_transport(last_page: int, fetched: list[int], active: list[int]):
+    """`pg` numarası küçük olan sayfanın daha geç döndüğü sahte BKM kategorisi."""
+    pagination = "".join(f'<a href="/edebiyat?pg={n}">{n}</a>' for n in range(2, last_page + 1))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params.get("pg", 1))
+        active[0] += 1
+        active[1] = max(active[1], active[0])
+        try:
+            await asyncio.sleep(0.05 * (last_page - number))
+        finally:
+            active[0] -= 1
+        fetched.append(number)
+        body = f'<div class="pagination">{pagination}</div>' if number == 1 else ""
+        return httpx.Response(200, text=f"<html><body>{body}</body></html>")
+
+    return httpx.MockTransport(handler)
+
+
+async def collect_bkm_pages(settings: Settings, last_page: int, limit: int | None = None):
+    fetched: list[int] = []
+    active = [0, 0]
+    pages: list[str] = []
+    category = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+    transport = bkm_pages_transport(last_page, fetched, active)
+    async with AsyncHTTPClient(settings, transport=transport) as http:
+        iterator = BkmKitapAdapter(http=http, settings=settings).iter_pages(category)
+        async for page in iterator:
+            pages.append(page.url)
+            if limit is not None and len(pages) == limit:
+                break
+        await iterator.aclose()
+        await asyncio.sleep(0.05)
+    return pages, fetched, active[1]
+
+
+async def test_bkm_fetches_remaining_pages_concurrently():
+    settings = Settings(min_request_interval=0.0, adaptive_rate=False, concurrency=4)
+    pages, fetched, peak = await collect_bkm_pages(settings, last_page=6)
+    assert pages[0] == "https://www.bkmkitap.com/edebiyat"
+    assert sorted(pages[1:]) == sorted(f"{pages[0]}?pg={n}" for n in range(2, 7))
+    assert pages[1:] != sorted(pages[1:])  # bitiş sırasıyla gelir
+    assert peak == 4
+
+
+async def test_bkm_parses_first_page_only_once(monkeypatch):
+    calls: list[tuple[str, ...]] = []
+    original = BkmKitapAdapter.make_soup
+
+    def counting(self, content, regions=()):
+        calls.append(tuple(regions))
+        return original(self, content, regions)
+
+    monkeypatch.setattr(BkmKitapAdapter, "make_soup", counting)
+    settings = Settings(min_request_interval=0.0, adaptive_rate=False, concurrency=4)
+    pages, _, _ = await collect_bkm_pages(settings, last_page=4)
+    assert len(pages) == 4
+    assert calls == []  # sayfalama DOM kurmadan okunur
+
+
+async def test_bkm_pages_in_order_when_requested():
+    settings = Settings(
+        min_request_interval=0.0, adaptive_rate=False, concurrency=4, ordered_pages=True
+    )
+    pages, _, _ = await collect_bkm_pages(settings, last_page=6)
+    assert pages[1:] == [f"{pages[0]}?pg={n}" for n in range(2, 7)]
+
+
+async def test_bkm_cancels_outstanding_pages_when_consumer_stops():
+    settings = Settings(min_request_interval=0.0, adaptive_rate=False, concurrency=10)
+    pages, fetched, _ = await collect_bkm_pages(settings, last_page=10, limit=2)
+    assert len(pages) == 2
+    assert sorted(fetched) == [1, 10]
+
+
+async def collect_ky_pages(settings: Settings, product_pages: int):
+    card = (FIXTURES / "ky_card.html").read_bytes()
+    requested: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        number = int(request.url.params["page"])
+        requested.append(number)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=card if number <= product_pages else b"<html></html>")
+
+    category = Category(name="Roman", url="https://www.kitapyurdu.com/kategori/kitap-roman/1.html")
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        adapter = KitapYurduAdapter(http=http, settings=settings)
+        pages = [page.url async for page in adapter.iter_pages(category)]
+    return [int(url.rsplit("=", 1)[1]) for url in pages], requested, adapter.stats
+
+
+async def test_ky_prefetches_ahead_and_counts_wasted_requests():
+    settings = Settings(min_request_interval=0.0, adaptive_rate=False, prefetch_window=4)
+    pages, requested, stats = await collect_ky_pages(settings, product_pages=5)
+    assert pages == [1, 2, 3, 4, 5]
+    assert requested[:5] == [1, 2, 3, 4, 5]  # ilk dolu sayfadan sonra pencere dolar
+    assert max(requested) <= 9  # pencerenin ötesine hiç istek çıkmaz
+    assert stats["wasted"] == 3
+
+
+async def test_ky_window_of_one_is_sequential():
+    settings = Settings(min_request_interval=0.0, adaptive_rate=False, prefetch_window=1)
+    pages, requested, stats = await collect_ky_pages(settings, product_pages=3)
+    assert pages == [1, 2, 3]
+    assert requested == [1, 2, 3, 4]
+    assert stats["wasted"] == 0
+
+
+async def test_bkm_discovery_skips_ignored_categories(tmp_path: Path):
+    ignore_file = tmp_path / "ignore.txt"
+    ignore_file.write_text("Hobi\nurl:/cd\n", encoding="utf-8")
+    settings = Settings(ignore_file=ignore_file, min_request_interval=0)
+    menu = "".join(
+        f'<a id="menu-{n}" href="https://www.bkmkitap.com/{slug}" title="{title}">{title}</a>'
+        for n, (slug, title) in enumerate(
+            [("roman", "Roman"), ("hobi", "Hobi Ürünleri"), ("cd", "Albümler")]
+        )
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=f'<div id="header-main">{menu}</div>')
+
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        categories = await BkmKitapAdapter(http=http, settings=settings).fetch_categories()
+    assert [c.name for c in categories] == ["Roman"]
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from bookdata.adapters.cassette import Cassette
+from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.config import Settings
+from bookdata.errors import BlockedResponseError
+
+URL = "https://www.bkmkitap.com/edebiyat"
+
+
+def make_settings(tmp_path: Path, mode: str, **overrides) -> Settings:
+    return Settings(
+        http_mode=mode,
+        cassette_file=tmp_path / "http.jsonl.gz",
+        min_request_interval=0.0,
+        **overrides,
+    )
+
+
+async def test_record_then_replay_without_network(tmp_path: Path):
+    def live(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/html; charset=utf-8"}, text="<p>Güneş</p>"
+        )
+
+    def offline(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("replay modunda ağa çıkılmamalı")
+
+    async with AsyncHTTPClient(
+        make_settings(tmp_path, "record"), transport=httpx.MockTransport(live)
+    ) as http:
+        await http.get(URL)
+
+    async with AsyncHTTPClient(
+        make_settings(tmp_path, "replay"), transport=httpx.MockTransport(offline)
+    ) as http:
+        resp = await http.get(URL)
+        assert resp.status_code == 200
+        assert resp.text == "<p>Güneş</p>"
+        assert resp.headers["content-type"] == "text/html; charset=utf-8"
+        with pytest.raises(BlockedResponseError):
+            await http.get("https://www.bkmkitap.com/kaydedilmemis")
+        assert http.stats["replay_misses"] == 1
+
+
+def test_replay_without_cassette_fails_early(tmp_path: Path):
+    with pytest.raises(FileNotFoundError, match="Kaset bulunamadı"):
+        AsyncHTTPClient(make_settings(tmp_path, "replay"))
+
+
+def test_replay_latency_has_requested_mean(tmp_path: Path):
+    cassette = Cassette(tmp_path / "c.jsonl.gz", latency=0.2, seed=1)
+    samples = [cassette.delay() for _ in range(5000)]
+    assert min(samples) > 0
+    assert sum(samples) / len(samples) == pytest.approx(0.2, rel=0.05)
+    assert Cassette(tmp_path / "c.jsonl.gz").delay() == 0.0
+
+
+def test_invalid_mode_rejected():
+    with pytest.raises(ValueError):
+        AsyncHTTPClient(Settings(http_mode="kayit"))
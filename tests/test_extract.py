@@ -1,13 +1,16 @@
 from pathlib import Path
 
+import pytest
 from bs4 import BeautifulSoup
 
 from bookdata.pipeline.extract import (
     extract_isbn,
     merge_products,
     parse_json_ld,
+    parse_json_ld_bytes,
     product_from_ld,
     products_from_json_ld,
+    products_from_ld_bytes,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -141,3 +144,21 @@ def test_merge_products_appends_ld_only_items():
     ]
     merged = merge_products(dom, ld)
     assert [p["title"] for p in merged] == ["A", "B", "C"]
+
+
+@pytest.mark.parametrize(
+    "fixture", ["product_jsonld.html", "broken_jsonld.html", "itemlist_jsonld.html", "ky_card.html"]
+)
+def test_byte_scan_matches_dom_json_ld(fixture):
+    content = (FIXTURES / fixture).read_bytes()
+    assert parse_json_ld_bytes(content) == parse_json_ld(soup(fixture))
+    assert products_from_ld_bytes(content, "Roman") == products_from_json_ld(soup(fixture), "Roman")
+
+
+def test_byte_scan_handles_attribute_variants():
+    content = (
+        b"<SCRIPT id='ld' type='application/ld+json'>{\"@type\": \"Book\"}</SCRIPT >"
+        b'<script type="text/javascript">{"@type": "Product"}</script>'
+        b'<script type=application/ld+json>[{"@type": "Product"}, 3]</script>'
+    )
+    assert parse_json_ld_bytes(content) == [{"@type": "Book"}, {"@type": "Product"}]
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+from bookdata.adapters.extraction import ExtractionPlan, Field
+from bookdata.adapters.parsers import make_document
+from bookdata.adapters.stores.bkm import BkmKitapAdapter
+from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.parametrize("backend", ["html.parser", "lxml"])
+@pytest.mark.parametrize(
+    ("adapter_cls", "fixture"),
+    [
+        (BkmKitapAdapter, "bkm_card.html"),
+        (BkmKitapAdapter, "product_jsonld.html"),
+        (KitapYurduAdapter, "ky_card.html"),
+    ],
+)
+def test_single_pass_matches_select_one(backend, adapter_cls, fixture):
+    pytest.importorskip(backend)
+    doc = make_document((FIXTURES / fixture).read_bytes(), backend)
+    rows = adapter_cls.plan.extract(doc)
+    assert rows == adapter_cls.plan.extract_css(doc)
+    assert rows and all(row["title"] for row in rows)
+
+
+def test_first_match_wins_and_missing_fields_are_none():
+    plan = ExtractionPlan(
+        "div.card",
+        [
+            Field("title", tag="a", cls="t"),
+            Field("url", tag="a", cls="t", attr="href"),
+            Field("author", tag="a", within="author"),
+            Field("image", tag="img", attr="data-src"),
+        ],
+    )
+    html = (
+        '<div class="card"><a class="t">Birinci</a><a class="t" href="/2">İkinci</a>'
+        '<a href="/menu">Menü</a><span class="author"><b><a href="/y">Yazar</a></b></span>'
+        '</div><div class="card"><a class="t x">Tek</a></div>'
+    )
+    rows = plan.extract(make_document(html))
+    assert rows == [
+        {"title": "Birinci", "url": "/2", "author": "Yazar", "image": None},
+        {"title": "Tek", "url": None, "author": None, "image": None},
+    ]
+    assert rows == plan.extract_css(make_document(html))
+
+
+def test_field_selector():
+    assert Field("a", tag="img", attr="data-src").selector == "img[data-src]"
+    assert Field("b", tag="a", within="ky-product-author").selector == ".ky-product-author a"
+    assert Field("c", cls="ky-product-title").selector == ".ky-product-title"
@@ -1,8 +1,10 @@
 from pathlib import Path
 
+import pytest
+
 from bookdata.config import Settings
 from bookdata.models import Category
-from bookdata.pipeline.filter import apply_ignore
+from bookdata.pipeline.filter import apply_ignore, compile_rules
 
 
 def test_ignore_by_name():
@@ -38,3 +40,56 @@ def test_ignore_file_covers_skip_keywords():
     repo_root = Path(__file__).resolve().parents[1]
     patterns = Settings(ignore_file=repo_root / "ignore_categories.txt").load_ignore_patterns()
     assert apply_ignore(cats, patterns) == []
+
+
+def test_rule_kinds():
+    cats = [
+        Category(name="Çocuk Kitapları", url="https://x.com/cocuk"),
+        Category(name="Roman", url="https://x.com/roman"),
+        Category(name="CD Albümleri", url="https://x.com/muzik/cd"),
+        Category(name="Şiir", url="https://x.com/kategori/siir/12.html"),
+        Category(name="Tarih", url="https://y.com/tarih"),
+    ]
+    rules = ["glob:*kitaplari", r"re:^cd\b", "url:https://y.com/", "url:/kategori/"]
+    assert [c.name for c in apply_ignore(cats, rules)] == ["Roman"]
+
+
+def test_glob_matches_whole_name_or_url_only():
+    cats = [Category(name="Roman Kitapları", url="https://x.com/roman")]
+    assert apply_ignore(cats, ["glob:roman"]) == cats
+    assert apply_ignore(cats, ["glob:https://x.com/*"]) == []
+
+
+def test_plain_lines_with_colon_stay_substrings():
+    cats = [Category(name="Dergi: Özel Sayı", url="/dergi")]
+    assert apply_ignore(cats, ["dergi: ozel"]) == []
+
+
+def test_ignored_parent_prunes_subtree():
+    cats = [
+        Category(name="Hobi", url="/hobi"),
+        Category(name="Maket", url="/maket", parent="Hobi"),
+        Category(name="Roman", url="/roman", parent="Edebiyat"),
+    ]
+    assert [c.name for c in apply_ignore(cats, ["hobi"])] == ["Roman"]
+
+
+def test_invalid_regex_is_reported():
+    with pytest.raises(ValueError, match="re:\\("):
+        compile_rules(("re:(",))
+
+
+def test_user_regexes_are_compiled_separately():
+    cats = [
+        Category(name="CD", url="/cd"),
+        Category(name="DVD", url="/dvd"),
+        Category(name="Aa Serisi", url="/seri"),
+        Category(name="Roman", url="/roman"),
+    ]
+    rules = [
+        r"re:^(?P<tur>cd)$",
+        r"re:^(?P<tur>dvd)$",  # aynı grup adı başka kuralda
+        r"re:^(a)\1",  # geri başvuru kendi kuralındaki gruba bakar
+        "hobi",
+    ]
+    assert [c.name for c in apply_ignore(cats, rules)] == ["Roman"]
@@ -1,10 +1,15 @@
+import asyncio
+import itertools
+import time
 from urllib.robotparser import RobotFileParser
 
 import httpx
 
-from bookdata.adapters.http import classify_status, is_retryable
+from bookdata.adapters.http import AsyncHTTPClient, HostScheduler, classify_status, is_retryable
+from bookdata.config import Settings
 from bookdata.errors import (
     BlockedResponseError,
+    CircuitOpenError,
     RateLimitedError,
     RobotsDeniedError,
     TemporaryServerError,
@@ -47,3 +52,154 @@ def test_robots_parse_and_can_fetch():
     assert not parser.can_fetch(
         "bookdata-bot/0.1", "https://www.kitapyurdu.com/kitapyurdu-uygulamasi"
     )
+
+
+async def test_scheduler_spaces_concurrent_requests_exactly():
+    scheduler = HostScheduler(lambda host: 0.05, concurrency=10)
+    started: list[float] = []
+
+    async def request() -> None:
+        async with scheduler.slot("www.bkmkitap.com"):
+            started.append(time.monotonic())
+
+    await asyncio.gather(*(request() for _ in range(5)))
+    gaps = [b - a for a, b in itertools.pairwise(sorted(started))]
+    assert len(gaps) == 4
+    assert min(gaps) >= 0.05 - 0.005
+
+
+async def test_scheduler_hosts_do_not_block_each_other():
+    scheduler = HostScheduler(lambda host: 0.0, concurrency=1)
+    release = asyncio.Event()
+    order: list[str] = []
+
+    async def slow() -> None:
+        async with scheduler.slot("www.bkmkitap.com"):
+            order.append("bkm")
+            await release.wait()
+
+    async def other_host() -> None:
+        async with scheduler.slot("www.kitapyurdu.com"):
+            order.append("ky")
+            release.set()
+
+    await asyncio.wait_for(asyncio.gather(slow(), other_host()), timeout=1.0)
+    assert order == ["bkm", "ky"]
+
+
+async def test_scheduler_round_robins_between_flows():
+    scheduler = HostScheduler(lambda host: 0.0, concurrency=1)
+    order: list[str] = []
+
+    async def request(flow: str, name: str) -> None:
+        async with scheduler.slot("www.bkmkitap.com", flow):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        request("roman", "r1"),
+        request("roman", "r2"),
+        request("roman", "r3"),
+        request("şiir", "s1"),
+    )
+    assert order == ["r1", "r2", "s1", "r3"]
+
+
+async def test_scheduler_cancelled_waiter_frees_queue():
+    scheduler = HostScheduler(lambda host: 0.0, concurrency=1)
+    hold = asyncio.Event()
+
+    async def holder() -> None:
+        async with scheduler.slot("h"):
+            await hold.wait()
+
+    holder_task = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    hold.set()
+    await holder_task
+    async with scheduler.slot("h"):
+        pass
+
+
+async def test_concurrent_gets_for_same_url_share_one_fetch():
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b"liste")
+
+    settings = Settings(min_request_interval=0.0)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        responses = await asyncio.gather(*(http.get("https://x.com/liste") for _ in range(5)))
+        assert http.stats["coalesced"] == 4
+        await http.get("https://x.com/liste")  # uçuş bitti → yeni istek
+
+    assert all(r.content == b"liste" for r in responses)
+    assert len(calls) == 2
+
+
+async def test_get_after_last_waiter_cancels_starts_a_new_fetch():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=b"liste")
+
+    settings = Settings(min_request_interval=0.0)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        first = asyncio.create_task(http.get("https://x.com/liste"))
+        await asyncio.sleep(0.001)
+        first.cancel()
+        await asyncio.sleep(0)  # tek bekleyen çıktı, paylaşılan alım iptal ediliyor
+        second = asyncio.create_task(http.get("https://x.com/liste"))
+        response = await second
+
+    assert first.cancelled() and not second.cancelled()
+    assert response.content == b"liste"
+    assert calls == 2
+
+
+async def test_coalesced_waiters_share_the_error():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        return httpx.Response(404)
+
+    settings = Settings(min_request_interval=0.0)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        results = await asyncio.gather(
+            http.get("https://x.com/yok"), http.get("https://x.com/yok"), return_exceptions=True
+        )
+    assert all(isinstance(r, BlockedResponseError) for r in results)
+
+
+async def test_robots_fetched_once_and_decided_per_url():
+    robots_calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal robots_calls
+        if request.url.path == "/robots.txt":
+            robots_calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text="User-agent: *\nDisallow: /gizli\n")
+        return httpx.Response(200, content=b"ok")
+
+    settings = Settings(min_request_interval=0.0, respect_robots=True)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        results = await asyncio.gather(
+            http.get("https://x.com/a"),
+            http.get("https://x.com/b"),
+            http.get("https://x.com/gizli"),
+            return_exceptions=True,
+        )
+    assert robots_calls == 1
+    assert [type(r).__name__ for r in results] == ["Response", "Response", "RobotsDeniedError"]
+
+
+def test_circuit_open_is_not_retryable():
+    assert not is_retryable(CircuitOpenError("u"))
@@ -0,0 +1,118 @@
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.adapters.http_cache import ResponseCache
+from bookdata.config import Settings
+
+URL = "https://www.kitapyurdu.com/index.php?route=product/list&page=1"
+
+
+def make_settings(tmp_path: Path, max_mb: float = 1.0) -> Settings:
+    return Settings(
+        http_cache_dir=tmp_path / "cache", http_cache_max_mb=max_mb, min_request_interval=0.0
+    )
+
+
+async def test_conditional_get_serves_304_from_disk(tmp_path: Path):
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, headers={"etag": '"v1"'}, content=b"<html>liste</html>")
+
+    settings = make_settings(tmp_path)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        first = await http.get(URL)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        second = await http.get(URL)
+        stats = http.stats
+
+    assert first.content == second.content == b"<html>liste</html>"
+    assert second.status_code == 200
+    assert "if-none-match" not in seen_headers[0]
+    assert seen_headers[1]["if-none-match"] == '"v1"'
+    assert stats["cache_hits"] == 1
+    assert stats["cache_misses"] == 0
+    assert stats["cache_bytes_saved"] == 18
+
+
+async def test_changed_page_replaces_cached_body(tmp_path: Path):
+    versions = iter([b"eski", b"yeni"])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"last-modified": "Mon, 01 Jan 2026 00:00:00 GMT"}, content=next(versions)
+        )
+
+    settings = make_settings(tmp_path)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        await http.get(URL)
+        resp = await http.get(URL)
+        assert resp.content == b"yeni"
+        assert http.stats["cache_misses"] == 2
+
+    cached = ResponseCache(tmp_path / "cache", 1024).lookup(URL)
+    assert cached is not None
+    assert cached.body == b"yeni"
+    assert cached.validators == {"If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT"}
+
+
+def test_store_skips_responses_without_validators(tmp_path: Path):
+    cache = ResponseCache(tmp_path, 1024)
+    cache.store(URL, httpx.Response(200, content=b"x"))
+    assert cache.lookup(URL) is None
+
+
+def test_eviction_keeps_cache_under_size_limit(tmp_path: Path):
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    for i in range(3):
+        cache.store(
+            f"https://x.com/{i}", httpx.Response(200, headers={"etag": "e"}, content=b"12345")
+        )
+    assert cache.lookup("https://x.com/0") is None
+    assert cache.lookup("https://x.com/2") is not None
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.body")) <= 10
+
+
+def _store(cache: ResponseCache, url: str, etag: str = "e") -> None:
+    cache.store(url, httpx.Response(200, headers={"etag": etag}, content=b"12345"))
+
+
+def test_eviction_follows_use_order_without_listing_the_directory(tmp_path: Path, monkeypatch):
+    cache = ResponseCache(tmp_path, max_bytes=10)
+    _store(cache, "https://x.com/0")
+    _store(cache, "https://x.com/1")
+    request = httpx.Request("GET", "https://x.com/0")
+    cache.hit(cache.lookup("https://x.com/0"), request)  # 0 yeniden kullanıldı → 1 en eski
+
+    monkeypatch.setattr(Path, "glob", lambda *a: pytest.fail("dizin tarandı"))
+    monkeypatch.setattr(Path, "stat", lambda *a, **k: pytest.fail("stat çağrıldı"))
+    _store(cache, "https://x.com/2")
+    monkeypatch.undo()
+
+    assert cache.lookup("https://x.com/1") is None
+    assert cache.lookup("https://x.com/0") is not None
+    assert ResponseCache(tmp_path, max_bytes=10)._total == 10
+
+
+def test_failed_meta_write_never_pairs_old_validators_with_new_body(tmp_path: Path, monkeypatch):
+    cache = ResponseCache(tmp_path, max_bytes=1024)
+    _store(cache, URL, etag="eski")
+    real_replace = os.replace
+
+    def crash_on_meta(src, dst):
+        if str(dst).endswith(".json"):
+            raise OSError("disk doldu")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", crash_on_meta)
+    _store(cache, URL, etag="yeni")
+    monkeypatch.undo()
+    assert cache.lookup(URL) is None
+    assert ResponseCache(tmp_path, max_bytes=1024).lookup(URL) is None
@@ -0,0 +1,32 @@
+import json
+import sys
+import types
+from pathlib import Path
+
+from bookdata.adapters.kaggle import KagglePublisher
+
+
+def test_publish_uploads_extra_files_in_the_same_version(tmp_path: Path, monkeypatch):
+    uploaded: dict[str, bytes] = {}
+
+    class FakeApi:
+        def authenticate(self) -> None:
+            pass
+
+        def dataset_create_version(self, folder: str, version_notes: str) -> None:
+            uploaded.update({p.name: p.read_bytes() for p in Path(folder).iterdir()})
+
+    module = types.ModuleType("kaggle.api.kaggle_api_extended")
+    module.KaggleApi = FakeApi
+    monkeypatch.setitem(sys.modules, "kaggle.api.kaggle_api_extended", module)
+
+    dataset = tmp_path / "bkm_Datasets.csv"
+    dataset.write_text("veri", encoding="utf-8")
+    table = tmp_path / "bkm_categories.csv"
+    table.write_text("URL;Kategori\n", encoding="utf-8")
+    KagglePublisher("sahip/kitaplar").publish(dataset, "bkm", "not", {table: "üyelikler"})
+
+    assert uploaded["bkm_Datasets.csv"] == b"veri"
+    assert uploaded["bkm_categories.csv"] == b"URL;Kategori\n"
+    metadata = json.loads(uploaded["dataset-metadata.json"])
+    assert [r["path"] for r in metadata["resources"]] == ["bkm_Datasets.csv", "bkm_categories.csv"]
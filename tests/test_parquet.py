@@ -0,0 +1,151 @@
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from bookdata.adapters.storage import HEADER, DatasetStore
+from bookdata.analyze import load_datasets
+from bookdata.models import Product
+
+pytest.importorskip("pyarrow")
+
+from bookdata.adapters.parquet import ParquetDatasetStore  # noqa: E402
+
+
+def make_product(url: str, price: float, day: int, title: str = "Kitap") -> Product:
+    return Product(
+        title=title,
+        author="Yazar",
+        publisher="Yayın",
+        category="Edebiyat",
+        price=price,
+        url=url,
+        store="BKM Kitap",
+        scraped_at=datetime(2025, 1, day, 12, tzinfo=UTC),
+    )
+
+
+BATCHES = [
+    [make_product("a", 10.0, 1), make_product("b", 20.0, 1, title='Şiir; "seçme"')],
+    [make_product("a", 12.5, 2), make_product("c", 5.0, 1)],
+    [make_product("b", 18.0, 3)],
+]
+
+
+def _fill(store) -> None:
+    for batch in BATCHES:
+        store.append(batch)
+
+
+def test_same_contract_as_csv_store(tmp_path: Path):
+    csv_store = DatasetStore(tmp_path / "bkm_Datasets.csv")
+    parquet_store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    _fill(csv_store)
+    _fill(parquet_store)
+
+    assert parquet_store.last_price_by_url() == csv_store.last_price_by_url()
+    assert parquet_store.row_count() == csv_store.row_count() == 5
+    key = lambda row: (row["Tarih"], row["URL"])  # noqa: E731
+    assert sorted(parquet_store.load(), key=key) == sorted(csv_store.load(), key=key)
+    assert parquet_store.stats() == csv_store.stats()
+
+
+def test_rows_land_in_day_partitions(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    _fill(store)
+    days = sorted(p.name for p in store.directory.iterdir())
+    assert days == ["gun=2025-01-01", "gun=2025-01-02", "gun=2025-01-03"]
+    assert not list(store.directory.rglob("*.tmp"))
+
+
+def test_typed_frame_with_dictionary_columns(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    _fill(store)
+    frame = store.load_frame()
+    assert list(frame.columns) == HEADER
+    assert str(frame["Site"].dtype) == "category"
+    assert str(frame["Fiyat"].dtype) == "float64"
+    assert frame["Tarih"].dt.year.unique().tolist() == [2025]
+
+
+def test_export_csv_matches_csv_store(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    _fill(store)
+    exported = tmp_path / "export" / "bkm_Datasets.csv"
+    assert store.export_csv(exported) == 5
+    reread = DatasetStore(exported)
+    assert reread.last_price_by_url() == store.last_price_by_url()
+    assert exported.read_text(encoding="utf-8").splitlines()[0] == ";".join(HEADER)
+
+
+def test_empty_store(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    assert store.append([]) == 0
+    assert store.load() == []
+    assert store.last_price_by_url() == {}
+    assert store.row_count() == 0
+
+
+def test_analysis_prefers_parquet_over_same_store_csv(tmp_path: Path):
+    _fill(ParquetDatasetStore(tmp_path / "bkm_Datasets"))
+    DatasetStore(tmp_path / "bkm_Datasets.csv").append([make_product("eski", 1.0, 1)])
+    DatasetStore(tmp_path / "kitapyurdu_Datasets.csv").append([make_product("ky", 7.0, 1)])
+    df = load_datasets(tmp_path)
+    assert sorted(df["URL"]) == ["a", "a", "b", "b", "c", "ky"]
+
+
+def _parts(store: ParquetDatasetStore, day: str = "2025-01-01") -> list[str]:
+    return sorted(p.name for p in (store.directory / f"gun={day}").glob("*.parquet"))
+
+
+def test_appends_in_the_same_nanosecond_keep_both_files(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("bookdata.adapters.parquet.time.time_ns", lambda: 1_000)
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    store.append([make_product("a", 10.0, 1)], flush=False)
+    ParquetDatasetStore(store.directory).append([make_product("b", 20.0, 1)], flush=False)
+    assert len(_parts(store)) == 2
+    assert store.row_count() == 2
+
+
+def test_flush_compacts_each_written_day(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    for n in range(3):
+        store.append([make_product(f"u{n}", 10.0 + n, 1)], flush=False)
+    before = store.load()
+    assert len(_parts(store)) == 3
+
+    store.flush()
+    (name,) = _parts(store)
+    assert name.count("-") == 2  # part-<ilk>-<son>.parquet
+    assert store.load() == before
+
+    store.append([make_product("u3", 9.0, 1)])  # flush=True da birleştirir
+    assert len(_parts(store)) == 1
+    assert store.row_count() == 4
+
+
+def test_interrupted_compaction_neither_loses_nor_duplicates_rows(tmp_path: Path):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    for n in range(2):
+        store.append([make_product(f"u{n}", 10.0, 1)], flush=False)
+    day = store.directory / "gun=2025-01-01"
+    leftovers = {p.name: p.read_bytes() for p in day.iterdir()}
+    store.flush()
+    for name, content in leftovers.items():  # silinmeden önce çökmüş gibi
+        (day / name).write_bytes(content)
+
+    assert store.row_count() == 2
+    assert sorted(row["URL"] for row in store.load()) == ["u0", "u1"]
+    store.append([make_product("u2", 10.0, 1)])
+    assert len(_parts(store)) == 1
+    assert store.row_count() == 3
+
+
+def test_clock_going_back_does_not_hide_new_parts(tmp_path: Path, monkeypatch):
+    store = ParquetDatasetStore(tmp_path / "bkm_Datasets")
+    _fill(store)
+    monkeypatch.setattr("bookdata.adapters.parquet.time.time_ns", lambda: 1)
+    later = ParquetDatasetStore(store.directory)
+    later.append([make_product("d", 1.0, 1)], flush=False)
+    assert later.row_count() == 6
+    assert later.last_price_by_url()["d"] == 1.0
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import pytest
+
+from bookdata.adapters.parsers import PARSER_BACKENDS, Region, make_document, resolve_backend
+from bookdata.adapters.stores.bkm import BkmKitapAdapter
+from bookdata.adapters.stores.kitapyurdu import KitapYurduAdapter
+from bookdata.config import Settings
+from bookdata.models import Category
+from bookdata.pipeline.extract import parse_json_ld
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+BKM_CATEGORY = Category(name="Edebiyat", url="https://www.bkmkitap.com/edebiyat")
+KY_CATEGORY = Category(name="Roman", url="https://www.kitapyurdu.com/kategori/kitap/roman/1.html")
+CASES = [
+    (BkmKitapAdapter, BKM_CATEGORY, "bkm_card.html"),
+    (BkmKitapAdapter, BKM_CATEGORY, "product_jsonld.html"),
+    (BkmKitapAdapter, BKM_CATEGORY, "itemlist_jsonld.html"),
+    (KitapYurduAdapter, KY_CATEGORY, "ky_card.html"),
+    (KitapYurduAdapter, KY_CATEGORY, "broken_jsonld.html"),
+]
+
+
+@pytest.fixture(params=[b for b in PARSER_BACKENDS if b != "html.parser"])
+def backend(request) -> str:
+    pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.mark.parametrize(("adapter_cls", "category", "fixture"), CASES)
+def test_backend_parity_with_html_parser(backend, adapter_cls, category, fixture):
+    content = (FIXTURES / fixture).read_bytes()
+    reference = adapter_cls(http=None, settings=Settings()).extract_page(content, category)
+    fast = adapter_cls(http=None, settings=Settings(html_parser=backend))
+    assert fast.extract_page(content, category) == reference
+
+
+@pytest.mark.parametrize("fixture", ["product_jsonld.html", "broken_jsonld.html"])
+def test_json_ld_parity(backend, fixture):
+    content = (FIXTURES / fixture).read_bytes()
+    assert parse_json_ld(make_document(content, backend)) == parse_json_ld(make_document(content))
+
+
+def test_bkm_last_page_from_bytes():
+    html = (
+        b'<a href="/roman?pg=99">x</a><div class="col pagination">'
+        b'<a href="/roman?pg=2">2</a><a href="/roman?sort=1&pg=7">7</a><a>...</a></div>'
+        b'<div class="product-item"><a href="/kitap?pg=50">y</a></div>'
+    )
+    assert BkmKitapAdapter._last_pg_link(html) == 7
+    assert (
+        BkmKitapAdapter._last_pg_link(b'<div class="pagination-x"><a href="?pg=3"></a></div>') == 0
+    )
+    assert BkmKitapAdapter._last_pg_link(b"<div></div>") == 0
+    assert BkmKitapAdapter._last_pg_link(b'<ul class="pagination"><a href="?pg=4"></a></ul>') == 0
+
+
+def test_bkm_last_page_with_nested_markup():
+    html = (
+        b'<div id="x" class="pagination"><div class="info">Sayfa 1/7</div>'
+        b'<a href="?pg=2">2</a><div><span>...</span></div><a href="/roman?a=1&amp;pg=7">7</a>'
+        b'</div><div class="product-item"><a href="/kitap?pg=50">y</a></div>'
+    )
+    assert BkmKitapAdapter._last_pg_link(html) == 7
+    # Sayfa ayrıştırıcısıyla aynı sonuç
+    doc = make_document(html)
+    links = doc.select("div.pagination a[href*='pg=']")
+    assert max(int(a.get("href").rsplit("pg=", 1)[1]) for a in links) == 7
+
+
+def test_resolve_backend():
+    assert resolve_backend("html.parser") == "html.parser"
+    assert resolve_backend("auto") in PARSER_BACKENDS
+    with pytest.raises(ValueError):
+        resolve_backend("html5")
+
+
+@pytest.mark.parametrize(("adapter_cls", "category", "fixture"), CASES)
+def test_partial_parse_matches_full_parse(adapter_cls, category, fixture):
+    content = (FIXTURES / fixture).read_bytes()
+    full = adapter_cls(http=None, settings=Settings(partial_parse=False))
+    partial = adapter_cls(http=None, settings=Settings())
+    assert partial.extract_page(content, category) == full.extract_page(content, category)
+
+
+def test_partial_parse_keeps_only_declared_regions():
+    html = (
+        b'<header><a href="/x">Menu</a><div class="product-item-x">no</div></header>'
+        b'<div class="col product-item"><a class="product-title">T</a></div>'
+        b'<script>var x = 1;</script><script type="application/ld+json">{}</script>'
+    )
+    doc = make_document(html, "html.parser", BkmKitapAdapter.page_regions)
+    assert [tag.name for tag in doc.children] == ["div"]
+    assert doc.select_one("a.product-title").get_text() == "T"
+
+
+def test_region_parse():
+    assert Region.parse("div.ky-product") == Region(tag="div", cls="ky-product")
+    assert Region.parse('script[type="application/ld+json"]') == Region(
+        tag="script", attr="type", value="application/ld+json"
+    )
+    with pytest.raises(ValueError):
+        Region.parse("div > a")
@@ -0,0 +1,107 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from bookdata.adapters.storage import CategoryFingerprints
+from bookdata.adapters.stores.base import Page, StorePort
+from bookdata.config import Settings
+from bookdata.models import Category
+from bookdata.pipeline.products import page_fingerprint, scrape_category, stream_products
+
+CATEGORY = Category(name="Roman", url="https://x.com/roman")
+
+
+class FakeStore(StorePort):
+    """Her sayfası tek ürün olan, sayfa içerikleri dışarıdan verilen sahte mağaza."""
+
+    store = "fake"
+    display_name = "Fake"
+    site_url = "https://x.com"
+
+    def __init__(self, prices: list[str]) -> None:
+        super().__init__(http=None, settings=Settings())  # type: ignore[arg-type]
+        self.prices = prices
+        self.served = 0
+
+    async def fetch_categories(self) -> list[Category]:
+        return [CATEGORY]
+
+    async def iter_pages(self, category: Category) -> AsyncIterator[Page]:
+        for number, price in enumerate(self.prices, start=1):
+            self.served += 1
+            yield Page(url=f"{category.url}?pg={number}", content=price.encode())
+
+    def parse_dom_products(self, soup, category: Category) -> list[dict]:
+        raise NotImplementedError
+
+    def extract_page(self, content: bytes, category: Category) -> list[dict]:
+        price = content.decode()
+        return [{"url": f"https://x.com/{price}", "price_text": price, "category": category.name}]
+
+
+async def test_unchanged_first_page_skips_pagination(tmp_path: Path):
+    path = tmp_path / "fake_fingerprints"
+    first_run = CategoryFingerprints(path, refresh_every=7)
+    full = await scrape_category(FakeStore(["10", "20", "30"]), CATEGORY, first_run)
+    first_run.save()
+
+    store = FakeStore(["10", "20", "30"])
+    fingerprints = CategoryFingerprints(path, refresh_every=7)
+    assert await scrape_category(store, CATEGORY, fingerprints) == full
+    assert store.served == 1
+    assert fingerprints.skipped == 1
+
+
+async def test_changed_first_page_triggers_full_crawl(tmp_path: Path):
+    path = tmp_path / "fake_fingerprints"
+    first_run = CategoryFingerprints(path, refresh_every=7)
+    await scrape_category(FakeStore(["10", "20", "30"]), CATEGORY, first_run)
+    first_run.save()
+
+    store = FakeStore(["11", "20", "30"])
+    items = await scrape_category(store, CATEGORY, CategoryFingerprints(path, refresh_every=7))
+    assert store.served == 3
+    assert [item["price_text"] for item in items] == ["11", "20", "30"]
+
+
+def test_page_fingerprint_ignores_order_but_not_prices():
+    a = {"url": "u1", "price_text": "10"}
+    b = {"url": "u2", "price_text": "20"}
+    assert page_fingerprint([a, b]) == page_fingerprint([b, a])
+    assert page_fingerprint([a, b]) != page_fingerprint([a, {**b, "price_text": "21"}])
+
+
+async def test_stream_products_yields_pages_as_they_arrive():
+    categories = [Category(name=f"K{i}", url=f"https://x.com/k{i}") for i in range(3)]
+    store = FakeStore(["10", "20"])
+    batches = [b async for b in stream_products(store, categories, task_limit=2)]
+    assert len([b for b in batches if b.done]) == 3
+    pages = [b for b in batches if not b.done]
+    assert len(pages) == 6
+    assert sorted(b.items[0]["url"] for b in pages) == sorted(
+        f"https://x.com/{p}" for p in ["10", "20"] * 3
+    )
+
+
+async def test_failed_category_ends_with_a_failed_batch():
+    class FailingStore(FakeStore):
+        async def iter_pages(self, category: Category) -> AsyncIterator[Page]:
+            yield Page(url=category.url, content=b"10")
+            raise RuntimeError("sayfa 2 alınamadı")
+
+    batches = [b async for b in stream_products(FailingStore([]), [CATEGORY], task_limit=1)]
+    assert [(len(b.items), b.done, b.failed) for b in batches] == [
+        (1, False, False),
+        (0, True, True),
+    ]
+
+
+async def test_stream_products_applies_backpressure():
+    store = FakeStore([str(n) for n in range(20)])
+    stream = stream_products(store, [CATEGORY], task_limit=1, queue_size=2)
+    first = await anext(stream)
+    await asyncio.sleep(0.01)
+    # kuyruk (2) + üreticide bekleyen sayfa (1) + tüketilen sayfa (1)
+    assert store.served <= 4
+    await stream.aclose()
+    assert first.items[0]["price_text"] == "0"
@@ -0,0 +1,78 @@
+import pytest
+
+from bookdata.adapters.ratelimit import AdaptiveRateController
+from bookdata.config import Settings
+from bookdata.errors import (
+    BlockedResponseError,
+    FetchTimeoutError,
+    RateLimitedError,
+    TemporaryServerError,
+)
+
+HOST = "www.kitapyurdu.com"
+
+
+def make_controller(**overrides) -> AdaptiveRateController:
+    return AdaptiveRateController(Settings(min_request_interval=0.5, **overrides))
+
+
+def test_starts_at_min_request_interval():
+    controller = make_controller()
+    assert controller.interval(HOST) == 0.5
+    assert controller.rate(HOST) == 2.0
+
+
+def test_fast_success_increases_rate_additively():
+    controller = make_controller()
+    controller.on_response(HOST, elapsed=0.1)
+    assert controller.rate(HOST) == pytest.approx(2.25)
+
+
+def test_slow_success_holds_rate():
+    controller = make_controller(slow_response_seconds=1.0)
+    controller.on_response(HOST, elapsed=1.5)
+    assert controller.interval(HOST) == 0.5
+
+
+def test_rate_never_exceeds_floor():
+    controller = make_controller(min_interval_floor=0.2)
+    for _ in range(100):
+        controller.on_response(HOST, elapsed=0.01)
+    assert controller.interval(HOST) == 0.2
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        RateLimitedError("u", status=429),
+        TemporaryServerError("u", status=503),
+        FetchTimeoutError("u"),
+    ],
+)
+def test_backoff_halves_rate(error):
+    controller = make_controller()
+    controller.on_error(HOST, error)
+    assert controller.rate(HOST) == pytest.approx(1.0)
+
+
+def test_backoff_is_capped_and_ignores_permanent_errors():
+    controller = make_controller(max_request_interval=3.0)
+    controller.on_error(HOST, BlockedResponseError("u", status=404))
+    assert controller.interval(HOST) == 0.5
+    for _ in range(10):
+        controller.on_error(HOST, RateLimitedError("u", status=429))
+    assert controller.interval(HOST) == 3.0
+
+
+def test_disabled_controller_keeps_fixed_interval():
+    controller = make_controller(adaptive_rate=False)
+    controller.on_response(HOST, elapsed=0.01)
+    controller.on_error(HOST, RateLimitedError("u", status=429))
+    assert controller.interval(HOST) == 0.5
+
+
+def test_hosts_are_independent():
+    controller = make_controller()
+    controller.on_error(HOST, RateLimitedError("u", status=429))
+    assert controller.interval("www.bkmkitap.com") == 0.5
+    assert set(controller.rates) == {HOST}
@@ -0,0 +1,108 @@
+import httpx
+import pytest
+
+from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.adapters.resilience import MIN_RETRIES, CircuitBreaker, CircuitState, RetryBudget
+from bookdata.config import Settings
+from bookdata.errors import (
+    BlockedResponseError,
+    CircuitOpenError,
+    TemporaryServerError,
+)
+
+HOST = "www.bkmkitap.com"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(failure_threshold=3, reset_timeout=60.0, clock=clock)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = make_breaker(FakeClock())
+    for _ in range(2):
+        breaker.record(HOST, TemporaryServerError("u", status=503))
+    assert breaker.state(HOST) is CircuitState.CLOSED
+    breaker.record(HOST, TemporaryServerError("u", status=503))
+    assert breaker.state(HOST) is CircuitState.OPEN
+    assert not breaker.allow(HOST)
+    assert breaker.rejects(HOST)
+    assert breaker.rejections == 2
+
+
+def test_permanent_errors_and_successes_reset_failures():
+    breaker = make_breaker(FakeClock())
+    breaker.record(HOST, TemporaryServerError("u", status=503))
+    breaker.record(HOST, TemporaryServerError("u", status=503))
+    breaker.record(HOST, BlockedResponseError("u", status=404))
+    breaker.record(HOST, TemporaryServerError("u", status=503))
+    assert breaker.state(HOST) is CircuitState.CLOSED
+
+
+def test_half_open_allows_single_probe_then_closes():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record_failure(HOST)
+    clock.now = 61.0
+    assert breaker.allow(HOST)
+    assert breaker.state(HOST) is CircuitState.HALF_OPEN
+    assert not breaker.allow(HOST)
+    breaker.record(HOST, None)
+    assert breaker.state(HOST) is CircuitState.CLOSED
+    assert breaker.allow(HOST)
+
+
+def test_failed_probe_reopens_circuit():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(3):
+        breaker.record_failure(HOST)
+    clock.now = 61.0
+    assert breaker.allow(HOST)
+    breaker.record(HOST, TemporaryServerError("u", status=503))
+    assert breaker.state(HOST) is CircuitState.OPEN
+    clock.now = 100.0
+    assert not breaker.allow(HOST)
+
+
+def test_hosts_have_separate_circuits():
+    breaker = make_breaker(FakeClock())
+    for _ in range(3):
+        breaker.record_failure(HOST)
+    assert breaker.allow("www.kitapyurdu.com")
+
+
+def test_retry_budget_caps_retries_to_ratio_of_requests():
+    budget = RetryBudget(ratio=0.1)
+    for _ in range(100):
+        budget.record_request()
+    allowed = sum(budget.try_spend() for _ in range(50))
+    assert allowed == MIN_RETRIES + 10
+    assert budget.denied == 50 - allowed
+
+
+async def test_open_circuit_fails_fast_without_network():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    settings = Settings(min_request_interval=0.0, retry_attempts=1, breaker_failure_threshold=2)
+    async with AsyncHTTPClient(settings, transport=httpx.MockTransport(handler)) as http:
+        for i in range(2):
+            with pytest.raises(TemporaryServerError):
+                await http.get(f"https://{HOST}/{i}")
+        with pytest.raises(CircuitOpenError):
+            await http.get(f"https://{HOST}/2")
+        assert http.stats["circuit_rejections"] == 1
+    assert calls == 2
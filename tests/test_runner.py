@@ -0,0 +1,271 @@
+import gzip
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from bookdata.adapters.http import AsyncHTTPClient
+from bookdata.adapters.storage import (
+    CheckpointJournal,
+    DatasetManifest,
+    DatasetStore,
+    MembershipTable,
+    PriceIndex,
+    open_dataset,
+)
+from bookdata.adapters.stores.base import Page, StorePort
+from bookdata.config import Settings
+from bookdata.models import Category
+from bookdata.pipeline import runner
+
+
+class SimulatedCrash(BaseException):
+    """Süreci öldüren bir hata (OOM, CI zaman aşımı); kategori hatası olarak yutulmaz."""
+
+
+CATEGORIES = [Category(name=f"K{i}", url=f"https://x.com/k{i}") for i in range(4)]
+
+
+class CrashingStore(StorePort):
+    """Kategori başına iki ürün döndürür; `crash_on` kategorisine gelince süreci "öldürür"."""
+
+    store = "fake"
+    display_name = "Fake"
+    site_url = "https://x.com"
+    domain = "x.com"
+    crash_on: str | None = None
+    fail_on: str | None = None
+    crawled: list[str] = []
+
+    async def fetch_categories(self) -> list[Category]:
+        return CATEGORIES
+
+    async def iter_pages(self, category: Category) -> AsyncIterator[Page]:
+        if category.name == self.crash_on:
+            raise SimulatedCrash
+        type(self).crawled.append(category.name)
+        yield Page(url=category.url, content=category.name.encode())
+        if category.name == self.fail_on:
+            raise RuntimeError("sayfa 2 alınamadı")
+
+    def parse_dom_products(self, soup, category: Category) -> list[dict]:
+        raise NotImplementedError
+
+    def extract_page(self, content: bytes, category: Category) -> list[dict]:
+        name = content.decode()
+        return [
+            {"title": f"{name}-{n}", "url": f"https://x.com/{name}/{n}", "price": 10.0}
+            for n in range(2)
+        ]
+
+
+async def _scrape(settings: Settings, *, resume: bool = False) -> runner.ScrapeResult:
+    transport = httpx.MockTransport(lambda request: httpx.Response(404))
+    async with AsyncHTTPClient(settings, transport=transport) as http:
+        return await runner._scrape(http, settings, None, resume)
+
+
+@pytest.fixture
+def settings(tmp_path: Path, monkeypatch) -> Settings:
+    monkeypatch.setitem(runner.STORE_REGISTRY, "fake", CrashingStore)
+    monkeypatch.setattr(CrashingStore, "crawled", [])
+    return Settings(
+        data_dir=tmp_path, store="fake", concurrency=1, full_refresh_every=1, append_batch_size=100
+    )
+
+
+async def test_resume_skips_journaled_categories(settings: Settings, monkeypatch):
+    monkeypatch.setattr(CrashingStore, "crash_on", "K3")
+    monkeypatch.setattr("random.shuffle", lambda items: None)
+    with pytest.raises(SimulatedCrash):
+        await _scrape(settings)
+    assert CrashingStore.crawled == ["K0", "K1", "K2"]
+    assert settings.checkpoint_file.exists()
+    assert not settings.dataset_file.exists()  # append partisi dolmadan öldü
+
+    monkeypatch.setattr(CrashingStore, "crash_on", None)
+    CrashingStore.crawled.clear()
+    result = await _scrape(settings, resume=True)
+    assert CrashingStore.crawled == ["K3"]
+    assert result.categories_resumed == 3
+    assert result.rows_written == 8
+    assert len({row["URL"] for row in DatasetStore(settings.dataset_file).load()}) == 8
+    assert not settings.checkpoint_file.exists()
+
+
+async def test_resume_does_not_duplicate_rows_already_written(settings: Settings, monkeypatch):
+    monkeypatch.setattr(CrashingStore, "crash_on", "K3")
+    monkeypatch.setattr("random.shuffle", lambda items: None)
+    settings = Settings(**{**settings.__dict__, "append_batch_size": 1})
+    with pytest.raises(SimulatedCrash):
+        await _scrape(settings)
+    assert DatasetStore(settings.dataset_file).row_count() == 6
+
+    monkeypatch.setattr(CrashingStore, "crash_on", None)
+    result = await _scrape(settings, resume=True)
+    assert result.rows_written == 2
+    assert DatasetStore(settings.dataset_file).row_count() == 8
+
+
+async def test_run_without_resume_discards_stale_checkpoint(settings: Settings):
+    settings.checkpoint_file.write_text('{"category": "https://x.com/k0", "products": []}\n')
+    result = await _scrape(settings)
+    assert result.categories_resumed == 0
+    assert sorted(CrashingStore.crawled) == ["K0", "K1", "K2", "K3"]
+    assert not settings.checkpoint_file.exists()
+
+
+class OtherStore(CrashingStore):
+    store = "other"
+    display_name = "Other"
+    site_url = "https://y.com"
+    domain = "y.com"
+
+
+async def test_run_scrape_many_shares_one_client(settings: Settings, monkeypatch):
+    monkeypatch.setitem(runner.STORE_REGISTRY, "other", OtherStore)
+    clients = []
+    original = runner._scrape
+
+    async def _spy(http, store_settings, executor, resume=False):
+        clients.append(http)
+        return await original(http, store_settings, executor, resume)
+
+    monkeypatch.setattr(runner, "_scrape", _spy)
+    result = await runner.run_scrape_many(settings, ["fake", "other"])
+
+    assert len(clients) == 2 and clients[0] is clients[1]
+    assert set(result.stores) == {"fake", "other"}
+    assert result.stores["fake"].rows_written == 8
+    assert result.combined.rows_written == 16
+    assert result.combined.categories_scraped == 8
+    assert DatasetStore(settings.data_dir / "other_Datasets.csv").row_count() == 8
+
+
+async def test_run_scrape_many_finishes_other_stores_before_raising(
+    settings: Settings, monkeypatch
+):
+    monkeypatch.setitem(runner.STORE_REGISTRY, "other", OtherStore)
+    monkeypatch.setattr(OtherStore, "fetch_categories", _failing_categories)
+    with pytest.raises(RuntimeError):
+        await runner.run_scrape_many(settings, ["fake", "other"])
+    assert DatasetStore(settings.dataset_file).row_count() == 8
+
+
+async def _failing_categories(self) -> list[Category]:
+    raise RuntimeError("kategori sayfası açılmadı")
+
+
+def test_combine_results_counts_client_wide_stats_once():
+    a = runner.ScrapeResult(1, 1, 10, 5, 50, 3, 0, cache_hits=7, request_rate=1.5)
+    b = runner.ScrapeResult(2, 2, 20, 6, 60, 4, 1, cache_hits=7, request_rate=2.0)
+    combined = runner.combine_results([a, b])
+    assert (combined.products_scraped, combined.rows_written, combined.fail_count) == (30, 11, 1)
+    assert combined.cache_hits == 7
+    assert combined.request_rate == 3.5
+
+
+class OverlapStore(CrashingStore):
+    """Her kategori aynı kitabı ve kendine özgü bir kitabı listeler."""
+
+    def extract_page(self, content: bytes, category: Category) -> list[dict]:
+        name = content.decode()
+        return [
+            {"title": "Ortak", "url": "https://x.com/ortak", "price": 9.0, "category": name},
+            {"title": name, "url": f"https://x.com/{name}", "price": 9.0, "category": name},
+        ]
+
+
+async def test_cross_category_duplicates_go_to_membership_table(settings: Settings, monkeypatch):
+    monkeypatch.setitem(runner.STORE_REGISTRY, "fake", OverlapStore)
+    monkeypatch.setattr("random.shuffle", lambda items: None)
+    result = await _scrape(settings)
+    assert result.products_scraped == 5
+    assert MembershipTable(settings.membership_file).load() == {
+        "https://x.com/ortak": {"K1", "K2", "K3"}
+    }
+
+
+async def test_sqlite_backend_runs_the_same_pipeline(settings: Settings):
+    settings = Settings(**{**settings.__dict__, "storage_backend": "sqlite"})
+    result = await _scrape(settings)
+    assert result.rows_written == result.total_rows == 8
+    assert not settings.dataset_file.exists()
+    assert len(open_dataset(settings).last_price_by_url()) == 8
+
+    assert (await _scrape(settings)).rows_written == 0
+
+
+async def test_index_and_manifest_are_written_once_per_run(settings: Settings, monkeypatch):
+    settings = Settings(**{**settings.__dict__, "append_batch_size": 1})
+    saves = []
+    for cls in (PriceIndex, DatasetManifest):
+        original = cls.save
+        monkeypatch.setattr(
+            cls,
+            "save",
+            lambda self, *args, cls=cls, original=original: (
+                saves.append(cls.__name__) or original(self, *args)
+            ),
+        )
+    result = await _scrape(settings)
+    assert result.rows_written == result.total_rows == 8
+    assert sorted(saves) == ["DatasetManifest", "PriceIndex"]
+    assert DatasetStore(settings.dataset_file).stats().rows == 8
+    assert DatasetStore(settings.dataset_file).last_price_by_url() == {
+        f"https://x.com/K{i}/{n}": 10.0 for i in range(4) for n in range(2)
+    }
+
+
+async def test_resume_keeps_memberships_from_before_the_crash(settings: Settings, monkeypatch):
+    monkeypatch.setitem(runner.STORE_REGISTRY, "fake", OverlapStore)
+    monkeypatch.setattr(OverlapStore, "crash_on", "K3")
+    monkeypatch.setattr("random.shuffle", lambda items: None)
+    with pytest.raises(SimulatedCrash):
+        await _scrape(settings)
+
+    monkeypatch.setattr(OverlapStore, "crash_on", None)
+    await _scrape(settings, resume=True)
+    assert MembershipTable(settings.membership_file).load() == {
+        "https://x.com/ortak": {"K1", "K2", "K3"}
+    }
+
+
+async def test_replay_refuses_the_default_data_dir(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="BOOKDATA_DATA_DIR"):
+        await runner.run_scrape(Settings(http_mode="replay", store="fake"))
+    assert not (tmp_path / "Data").exists()
+
+
+async def test_replay_ignores_fingerprints(settings: Settings, tmp_path: Path):
+    cassette = tmp_path / "http.jsonl.gz"
+    gzip.open(cassette, "wt").close()
+    # Canlı taramada ikinci çalıştırma değişmemiş kategorileri atlardı
+    overrides = {"http_mode": "replay", "cassette_file": cassette, "full_refresh_every": 7}
+    settings = Settings(**{**settings.__dict__, **overrides})
+    for _ in range(2):
+        CrashingStore.crawled.clear()
+        result = await _scrape(settings)
+        assert sorted(CrashingStore.crawled) == ["K0", "K1", "K2", "K3"]
+        assert result.categories_unchanged == 0
+    assert not settings.fingerprint_dir.exists()
+
+
+async def test_failed_category_is_dropped_and_recrawled_on_resume(settings: Settings, monkeypatch):
+    monkeypatch.setattr(CrashingStore, "fail_on", "K1")
+    monkeypatch.setattr(CrashingStore, "crash_on", "K3")
+    monkeypatch.setattr("random.shuffle", lambda items: None)
+    with pytest.raises(SimulatedCrash):
+        await _scrape(settings)
+    assert set(CheckpointJournal(settings.checkpoint_file).load()) == {
+        "https://x.com/k0",
+        "https://x.com/k2",
+    }
+
+    monkeypatch.setattr(CrashingStore, "fail_on", None)
+    monkeypatch.setattr(CrashingStore, "crash_on", None)
+    CrashingStore.crawled.clear()
+    await _scrape(settings, resume=True)
+    assert CrashingStore.crawled == ["K1", "K3"]
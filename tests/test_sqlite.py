@@ -0,0 +1,120 @@
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+from bookdata.adapters.sqlite import SqliteDatasetStore
+from bookdata.adapters.storage import DatasetStore
+from bookdata.analyze import load_datasets
+from bookdata.models import Product
+
+
+def make_product(url: str, price: float, day: int, category: str = "Edebiyat") -> Product:
+    return Product(
+        title=f"Kitap {url}",
+        author="Yazar",
+        publisher="Yayın",
+        category=category,
+        price=price,
+        url=url,
+        store="BKM Kitap",
+        scraped_at=datetime(2025, 1, day, 12, tzinfo=UTC),
+    )
+
+
+BATCHES = [
+    [make_product("a", 10.0, 1), make_product("b", 20.0, 1)],
+    [make_product("a", 12.5, 2, category="Roman"), make_product("c", 5.0, 2)],
+    [make_product("b", 18.0, 3)],
+]
+
+
+def _fill(store) -> None:
+    for batch in BATCHES:
+        store.append(batch)
+
+
+def test_same_contract_as_csv_store(tmp_path: Path):
+    csv_store = DatasetStore(tmp_path / "bkm_Datasets.csv")
+    database = SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite")
+    _fill(csv_store)
+    _fill(database)
+
+    assert database.last_price_by_url() == csv_store.last_price_by_url()
+    assert database.row_count() == csv_store.row_count() == 5
+    assert database.load() == csv_store.load()
+    assert database.stats() == csv_store.stats()
+
+
+def test_history_is_an_index_lookup(tmp_path: Path):
+    database = SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite")
+    _fill(database)
+    assert database.history("a") == [("2025-01-01 12:00:00", 10.0), ("2025-01-02 12:00:00", 12.5)]
+
+    with sqlite3.connect(database.path) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT scraped_at, price FROM price_observations"
+            " WHERE url = ? ORDER BY scraped_at, id",
+            ("a",),
+        ).fetchall()
+    assert "price_observations_url_time" in " ".join(row[-1] for row in plan)
+
+
+def test_rows_keep_the_metadata_they_were_written_with(tmp_path: Path):
+    csv_store = DatasetStore(tmp_path / "bkm_Datasets.csv")
+    database = SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite")
+    renamed = make_product("a", 11.0, 3)
+    renamed.title = "Yeni Baskı"
+    renamed.publisher = "Başka Yayın"
+    renamed.isbn = "9789753638029"
+    for store in (csv_store, database):
+        store.append([make_product("a", 10.0, 1)])
+        store.append([renamed])
+
+    assert [row["Kitap İsmi"] for row in database.load()] == ["Kitap a", "Yeni Baskı"]
+    exported = tmp_path / "export" / "bkm_Datasets.csv"
+    database.export_csv(exported)
+    assert exported.read_bytes() == csv_store.path.read_bytes()
+
+
+def test_older_rows_do_not_override_last_price(tmp_path: Path):
+    database = SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite")
+    database.append([make_product("a", 12.5, 2)])
+    database.append([make_product("a", 10.0, 1)])
+    assert database.last_price_by_url() == {"a": 12.5}
+
+
+def test_import_csv_then_export_round_trips(tmp_path: Path):
+    csv_store = DatasetStore(tmp_path / "bkm_Datasets.csv")
+    _fill(csv_store)
+    database = SqliteDatasetStore(tmp_path / "db" / "bkm_Datasets.sqlite")
+    assert database.import_csv(csv_store.path, batch_size=2) == 5
+    assert database.last_price_by_url() == csv_store.last_price_by_url()
+
+    exported = tmp_path / "export" / "bkm_Datasets.csv"
+    assert database.export_csv(exported) == 5
+    assert exported.read_bytes() == csv_store.path.read_bytes()
+
+
+def test_import_csv_tolerates_short_and_old_rows(tmp_path: Path):
+    old = tmp_path / "bkm_Datasets.csv"
+    old.write_text(
+        "Kitap İsmi;Yazar;Yayınevi;Kategori;Fiyat;URL;Site;Tarih\r\n"
+        "Eski;Y;P;Roman;10.5;a;BKM;2024-01-01 00:00:00\r\n"
+        "Kısa;Y;P;Roman;7.0;b;BKM;2024-01-02 00:00:00;;\r\n"
+        ";;;;3.0;c\r\n"
+        "Bozuk;Y;P;Roman;fiyat yok;d;BKM;2024-01-02 00:00:00\r\n",
+        encoding="utf-8",
+    )
+    database = SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite")
+    assert database.import_csv(old) == 2
+    assert database.last_price_by_url() == {"a": 10.5, "b": 7.0}
+    assert database.load()[0]["Para Birimi"] == "TRY"
+
+
+def test_analysis_reads_sqlite_in_place_of_csv(tmp_path: Path):
+    _fill(SqliteDatasetStore(tmp_path / "bkm_Datasets.sqlite"))
+    DatasetStore(tmp_path / "bkm_Datasets.csv").append([make_product("eski", 1.0, 1)])
+    df = load_datasets(tmp_path)
+    assert sorted(df["URL"]) == ["a", "a", "b", "b", "c"]
+    assert str(df["Tarih"].dtype).startswith("datetime64")
@@ -1,4 +1,14 @@
-from bookdata.pipeline.standardize import normalize, parse_price
+import random
+from datetime import UTC, datetime
+
+from bookdata.models import ProductRecord
+from bookdata.pipeline.standardize import (
+    item_prices,
+    normalize,
+    parse_price,
+    parse_prices,
+    standardize_batch,
+)
 
 
 def test_parse_price_turkish_comma():
@@ -53,3 +63,80 @@ def test_normalize_defaults():
 def test_normalize_skips_without_title_or_url():
     assert normalize({"price": 10.0}, "bkm", "BKM") is None
     assert normalize({"title": "K", "price": 10.0}, "bkm", "BKM") is None
+
+
+def test_record_csv_row_matches_model():
+    scraped_at = datetime(2026, 5, 1, 12, 30, tzinfo=UTC)
+    raw = {"title": "K", "url": "u", "price_text": "10,00", "author": None, "isbn": 978}
+    record = normalize(raw, "bkm", "BKM", scraped_at)
+    assert isinstance(record, ProductRecord)
+    assert record.author == "" and record.isbn == "978"
+    assert record.to_csv_row() == record.to_model().to_csv_row()
+    assert record.to_csv_row()[7] == "2026-05-01 12:30:00"
+    assert record.to_model().to_record() == record
+
+
+def test_standardize_batch_shares_one_timestamp():
+    raws = [{"title": "K", "url": f"u{i}", "price": 5.0} for i in range(3)]
+    records = standardize_batch(raws + raws[:1], "bkm", "BKM", {})
+    assert [r.url for r in records] == ["u0", "u1", "u2"]
+    assert len({r.scraped_at for r in records}) == 1
+
+
+PRICE_TEXTS = [
+    "53,30",
+    "1.234,50 TL",
+    "199,60TL",
+    "₺ 12.345.678,9",
+    "1.234",
+    "1.2.3",
+    "1,2,3",
+    "1,2.3",
+    ",5",
+    "5,",
+    ".",
+    ",",
+    "",
+    "abc",
+    "0,00",
+    "-15,00",
+    "  42 ",
+]
+
+
+def test_parse_prices_matches_parse_price():
+    texts = PRICE_TEXTS * 3
+    assert parse_prices(texts) == [parse_price(text) for text in texts]
+
+
+def test_numeric_prices_match_text_round_trip():
+    rng = random.Random(7)
+    values = [0, 0.004, 0.005, 1, True, -3.5, 1e20, float("inf"), float("nan")]
+    values += [rng.uniform(0, 5000) for _ in range(2000)]
+    for value in values:
+        via_text = parse_price(f"{value:.2f}".replace(".", ","))
+        assert item_prices([{"price": value}]) == [via_text], value
+
+
+def test_cross_category_duplicates_skip_normalization_and_keep_membership(monkeypatch):
+    seen: dict[str, str] = {}
+    memberships: dict[str, set[str]] = {}
+    roman = [{"title": "K", "url": "u1", "price": 5.0, "category": "Roman"}]
+    standardize_batch(roman, "bkm", "BKM", seen, memberships=memberships)
+
+    parsed: list[str] = []
+    monkeypatch.setattr(
+        "bookdata.pipeline.standardize._cached_price",
+        lambda text: parsed.append(text) or parse_price(text),
+    )
+    klasik = [
+        {"title": "K", "url": "u1", "price_text": "5,00", "category": "Klasik"},
+        {"title": "K", "url": "u1", "price_text": "5,00", "category": "Roman"},
+        {"title": "Y", "url": "u2", "price_text": "7,00", "category": "Klasik"},
+        {"title": "Y", "url": "u2", "price_text": "7,00", "category": "Klasik"},
+    ]
+    records = standardize_batch(klasik, "bkm", "BKM", seen, memberships=memberships)
+    assert [r.url for r in records] == ["u2"]
+    assert parsed == ["7,00", "7,00"]  # u1 kopyaları fiyat çözülmeden atlandı
+    assert memberships == {"u1": {"Klasik"}}
+    assert seen == {"u1": "Roman", "u2": "Klasik"}
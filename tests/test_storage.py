@@ -1,7 +1,17 @@
 from datetime import UTC, datetime
 from pathlib import Path
 
-from bookdata.adapters.storage import HEADER, DatasetStore
+import pytest
+
+from bookdata.adapters.storage import (
+    HEADER,
+    CategoryFingerprints,
+    CheckpointJournal,
+    DatasetStore,
+    MembershipTable,
+    open_dataset,
+)
+from bookdata.config import Settings
 from bookdata.models import Product
 
 
@@ -65,3 +75,200 @@ def test_roundtrip_new_fields(tmp_path: Path):
     assert rows[0]["ISBN"] == "9789753638029"
     assert rows[0]["Para Birimi"] == "TRY"
     assert rows[0]["Stok Durumu"] == "Stokta"
+
+
+def test_category_fingerprints_reuse_until_full_refresh(tmp_path: Path):
+    path = tmp_path / "bkm_fingerprints"
+    items = [{"url": "a", "price_text": "10"}]
+    first = CategoryFingerprints(path, refresh_every=3)
+    assert first.reusable("kat", "fp") is None
+    first.record("kat", "fp", items)
+    first.record("eski", "x", [])
+    first.save()
+
+    for _ in range(2):
+        run = CategoryFingerprints(path, refresh_every=3)
+        assert run.reusable("kat", "degisti") is None
+        assert run.reusable("kat", "fp") == items
+        assert run.skipped == 1
+        run.save()
+
+    third = CategoryFingerprints(path, refresh_every=3)
+    assert third.run == 4
+    assert third.reusable("kat", "fp") is None  # 3 çalıştırma doldu → tam tarama
+    assert third.reusable("eski", "x") is None  # görülmeyen kategori düşürüldü
+    assert len(list(path.glob("*.json"))) == 2  # index + "kat"
+
+
+def test_category_fingerprints_ignore_corrupt_file(tmp_path: Path):
+    path = tmp_path / "bkm_fingerprints"
+    path.mkdir()
+    (path / "index.json").write_text("{bozuk", encoding="utf-8")
+    fingerprints = CategoryFingerprints(path, refresh_every=7)
+    assert fingerprints.run == 1
+    assert fingerprints.reusable("kat", "fp") is None
+
+
+def test_checkpoint_journal_roundtrip_and_truncated_line(tmp_path: Path):
+    journal = CheckpointJournal(tmp_path / "bkm_checkpoint.jsonl")
+    assert journal.load() == {}
+    products = [make_product("a", 10.0).to_record(), make_product("b", 5.0).to_record()]
+    journal.complete("https://x.com/roman", products)
+    journal.complete("https://x.com/siir", [], {"a": {"Şiir"}})
+    with journal.path.open("a", encoding="utf-8") as fh:
+        fh.write('{"category": "https://x.com/yarim", "prod')  # çökme anında yarım satır
+
+    loaded = journal.load()
+    assert list(loaded) == ["https://x.com/roman", "https://x.com/siir"]
+    assert loaded["https://x.com/roman"] == (products, {})
+    assert loaded["https://x.com/siir"].memberships == {"a": {"Şiir"}}
+
+    journal.discard()
+    assert not journal.path.exists()
+
+
+def test_membership_table_roundtrip(tmp_path: Path):
+    table = MembershipTable(tmp_path / "bkm_categories.csv")
+    assert table.load() == {}
+    assert table.write({"b": {"Şiir", "Klasik"}, "a": {"Roman"}}) == 3
+    assert table.path.read_text(encoding="utf-8").splitlines() == [
+        "URL;Kategori",
+        "a;Roman",
+        "b;Klasik",
+        "b;Şiir",
+    ]
+    assert table.load() == {"a": {"Roman"}, "b": {"Klasik", "Şiir"}}
+
+
+def _legacy_last_prices(store: DatasetStore) -> dict[str, float]:
+    latest: dict[str, tuple[str, float]] = {}
+    for row in store.load():
+        if row["URL"] not in latest or row["Tarih"] >= latest[row["URL"]][0]:
+            latest[row["URL"]] = (row["Tarih"], float(row["Fiyat"]))
+    return {url: price for url, (_, price) in latest.items()}
+
+
+def test_price_index_matches_full_scan_and_points_at_rows(tmp_path: Path):
+    path = tmp_path / "bkm_Datasets.csv"
+    store = DatasetStore(path)
+    store.append([make_product("a", 10.0, title="Çok\nsatırlı"), make_product("b", 20.0)])
+    store.append([make_product("a", 12.5), make_product("ç", 7.0)])
+
+    assert store.index.path == tmp_path / "bkm_Datasets.idx"
+    fresh = DatasetStore(path)
+    assert (
+        fresh.last_price_by_url()
+        == _legacy_last_prices(fresh)
+        == {
+            "a": 12.5,
+            "b": 20.0,
+            "ç": 7.0,
+        }
+    )
+    data = path.read_bytes()
+    for url, entry in fresh.last_prices().items():
+        row = data[entry.offset :].decode("utf-8").split(";")
+        assert row[5] == url and float(row[4]) == entry.price
+
+
+def test_price_index_is_used_instead_of_csv(tmp_path: Path, monkeypatch):
+    path = tmp_path / "bkm_Datasets.csv"
+    DatasetStore(path).append([make_product("a", 10.0)])
+    monkeypatch.setattr("bookdata.adapters.storage._scan_rows", _fail)
+    assert DatasetStore(path).last_price_by_url() == {"a": 10.0}
+
+
+def _fail(*args):
+    raise AssertionError("CSV taranmamalıydı")
+
+
+def test_deferred_index_is_written_by_flush(tmp_path: Path, monkeypatch):
+    path = tmp_path / "bkm_Datasets.csv"
+    store = DatasetStore(path)
+    store.append([make_product("a", 10.0)], flush=False)
+    store.append([make_product("b", 20.0)], flush=False)
+    assert not store.index.path.exists()
+    assert DatasetStore(path).last_price_by_url() == {"a": 10.0, "b": 20.0}  # kuyruktan
+
+    store.index.path.unlink()
+    store.flush()
+    monkeypatch.setattr("bookdata.adapters.storage._scan_rows", _fail)
+    assert DatasetStore(path).last_price_by_url() == {"a": 10.0, "b": 20.0}
+
+
+def test_price_index_catches_up_with_external_appends(tmp_path: Path):
+    path = tmp_path / "bkm_Datasets.csv"
+    DatasetStore(path).append([make_product("a", 10.0)])
+    with path.open("a", encoding="utf-8", newline="") as fh:
+        fh.write("K;Y;P;Roman;11.0;a;BKM;2999-01-01 00:00:00;;;TRY;\r\n")
+        fh.write("K;Y;P;Roman;3.0;z;BKM;2999-01-01 00:00:00;;;TRY;\r\n")
+    assert DatasetStore(path).last_price_by_url() == {"a": 11.0, "z": 3.0}
+
+
+def test_price_index_rebuilds_when_csv_replaced_or_index_corrupt(tmp_path: Path):
+    path = tmp_path / "bkm_Datasets.csv"
+    DatasetStore(path).append([make_product("a", 10.0)])
+    other = tmp_path / "yeni" / "bkm_Datasets.csv"
+    DatasetStore(other).append([make_product(u, 1.0, title="Başka") for u in "cde"])
+    other.replace(path)  # Kaggle'dan farklı başlangıçlı, daha büyük bir dosya indi
+    assert DatasetStore(path).last_price_by_url() == {"c": 1.0, "d": 1.0, "e": 1.0}
+
+    DatasetStore(path).index.path.write_bytes(b"bozuk")
+    assert DatasetStore(path).last_price_by_url() == {"c": 1.0, "d": 1.0, "e": 1.0}
+
+
+def test_manifest_tracks_append_batches(tmp_path: Path):
+    path = tmp_path / "bkm_Datasets.csv"
+    store = DatasetStore(path)
+    older = make_product("a", 10.0, title="Çok\nsatırlı")
+    older.scraped_at = datetime(2025, 1, 1, tzinfo=UTC)
+    store.append([older, make_product("b", 20.0)])
+    store.append([make_product("a", 12.5)])
+
+    fresh = DatasetStore(path)
+    assert fresh.manifest.path == tmp_path / "bkm_Datasets.manifest.json"
+    assert fresh.row_count() == len(fresh.load()) == 3
+    summary = fresh.stats()
+    assert (summary.rows, summary.urls, summary.first) == (3, 2, "2025-01-01 00:00:00")
+    batches = fresh.batches()
+    assert [b.rows for b in batches] == [2, 1]
+    assert batches[0].offset == 0 and batches[-1].end == path.stat().st_size
+    with path.open("rb") as fh:
+        fh.seek(batches[1].offset)
+        assert b";a;" in fh.read(batches[1].end - batches[1].offset)
+
+
+def test_row_count_reads_manifest_instead_of_csv(tmp_path: Path, monkeypatch):
+    path = tmp_path / "bkm_Datasets.csv"
+    DatasetStore(path).append([make_product("a", 10.0), make_product("b", 20.0)])
+    monkeypatch.setattr("bookdata.adapters.storage._scan_batch", _fail)
+    monkeypatch.setattr("bookdata.adapters.storage._iter_rows", _fail)
+    assert DatasetStore(path).row_count() == 2
+    assert DatasetStore(path).stats().urls == 2
+    assert DatasetStore(tmp_path / "yok.csv").stats().rows == 0
+
+
+def test_manifest_catches_up_and_rebuilds(tmp_path: Path):
+    path = tmp_path / "bkm_Datasets.csv"
+    DatasetStore(path).append([make_product("a", 10.0)])
+    with path.open("a", encoding="utf-8", newline="") as fh:
+        fh.write("K;Y;P;Roman;11.0;a;BKM;2999-01-01 00:00:00;;;TRY;\r\n")
+        fh.write("K;Y;P;Roman;3.0;z;BKM;2999-01-01 00:00:00;;;TRY;\r\n")
+    store = DatasetStore(path)
+    assert store.row_count() == 3
+    assert len(store.batches()) == 2
+    assert (store.stats().last, store.stats().urls) == ("2999-01-01 00:00:00", 2)
+
+    store.manifest.path.write_text("bozuk", encoding="utf-8")
+    rebuilt = DatasetStore(path)
+    assert rebuilt.row_count() == 3
+    assert len(rebuilt.batches()) == 1
+
+
+def test_open_dataset_picks_backend(tmp_path: Path):
+    settings = Settings(data_dir=tmp_path, store="bkm")
+    store = open_dataset(settings)
+    assert isinstance(store, DatasetStore)
+    assert store.path == tmp_path / "bkm_Datasets.csv"
+    with pytest.raises(ValueError, match="depolama"):
+        open_dataset(Settings(data_dir=tmp_path, storage_backend="xml"))